@@ -0,0 +1,16 @@
+"""
+    Benchmarks for retrieving documents.
+"""
+from .common import LocalServerBenchmark, COLLECTION_NAME
+
+
+class RetrieveAllDocuments(LocalServerBenchmark):
+    params = ([1000, 10000], [30, 768])
+    param_names = ['num_of_documents', 'vector_length']
+
+    def setup(self, num_of_documents, vector_length):
+        super().setup()
+        self.create_collection(num_of_documents, vector_length)
+
+    def time_retrieve_all_documents(self, num_of_documents, vector_length):
+        self.client.retrieve_all_documents(COLLECTION_NAME, retrieve_chunk_size=1000)
@@ -0,0 +1,23 @@
+"""
+    Benchmarks for the time it takes to import the library and create a client,
+    each measured in a fresh interpreter.
+"""
+
+
+class Startup:
+    timeout = 60
+
+    def timeraw_import_vectorai(self):
+        return "import vectorai"
+
+    def timeraw_create_client(self):
+        return """
+        from vectorai import ViClient
+        ViClient("username", "api_key", url="http://localhost", verbose=False)
+        """
+
+    def timeraw_create_client_with_background_login(self):
+        return """
+        from vectorai import ViClient
+        ViClient("username", "api_key", url="http://localhost", login_check="background")
+        """
@@ -0,0 +1,37 @@
+"""
+    Benchmarks for the document utilities and scores, which do not make requests.
+"""
+from vectorai.client import ViClient
+from .common import sample_documents
+
+
+class DocUtils:
+    params = ([1000, 100000],)
+    param_names = ['num_of_documents']
+
+    def setup(self, num_of_documents):
+        self.client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+        self.documents = sample_documents(num_of_documents)
+        self.values = list(range(num_of_documents))
+
+    def time_get_field(self, num_of_documents):
+        for d in self.documents:
+            self.client.get_field('size.feet', d)
+
+    def time_get_field_across_documents(self, num_of_documents):
+        self.client.get_field_across_documents('size.feet', self.documents)
+
+    def time_set_field_across_documents(self, num_of_documents):
+        self.client.set_field_across_documents('size.inches', self.values, self.documents)
+
+
+class CosineSimilarityScores:
+    params = ([1000, 10000], [30, 768])
+    param_names = ['num_of_documents', 'vector_length']
+
+    def setup(self, num_of_documents, vector_length):
+        self.client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+        self.documents = sample_documents(num_of_documents, vector_length)
+
+    def time_get_cosine_similarity_scores(self, num_of_documents, vector_length):
+        self.client.get_cosine_similarity_scores(self.documents[1:], self.documents[0], 'color_vector_')
@@ -0,0 +1,46 @@
+"""
+    Benchmarks for inserting and encoding documents.
+"""
+import pandas as pd
+from .common import LocalServerBenchmark, sample_documents, COLLECTION_NAME
+
+
+class InsertDocuments(LocalServerBenchmark):
+    params = ([100, 1000], [30, 768], [1, 4], ['thread', 'process'])
+    param_names = ['num_of_documents', 'vector_length', 'workers', 'executor']
+
+    def setup(self, num_of_documents, vector_length, workers, executor):
+        if workers == 1 and executor == 'process':
+            raise NotImplementedError
+        super().setup()
+        self.documents = sample_documents(num_of_documents, vector_length)
+
+    def time_insert_documents(self, num_of_documents, vector_length, workers, executor):
+        self.client.insert_documents(COLLECTION_NAME, self.documents, chunksize=50,
+            workers=workers, executor=executor, overwrite=True, show_progress_bar=False)
+
+
+class InsertDf(LocalServerBenchmark):
+    params = ([100, 1000], [30, 768])
+    param_names = ['num_of_documents', 'vector_length']
+
+    def setup(self, num_of_documents, vector_length):
+        super().setup()
+        self.df = pd.DataFrame(sample_documents(num_of_documents, vector_length))
+
+    def time_insert_df(self, num_of_documents, vector_length):
+        self.client.insert_df(COLLECTION_NAME, self.df, chunksize=50, verbose=False,
+            overwrite=True, show_progress_bar=False)
+
+
+class EncodeDocumentsWithModels(LocalServerBenchmark):
+    params = ([10, 100], [False, True])
+    param_names = ['num_of_documents', 'use_bulk_encode']
+
+    def setup(self, num_of_documents, use_bulk_encode):
+        super().setup()
+        self.documents = sample_documents(num_of_documents)
+
+    def time_encode_documents_with_models(self, num_of_documents, use_bulk_encode):
+        self.client.encode_documents_with_models(self.documents,
+            models={'description': self.text_encoder}, use_bulk_encode=use_bulk_encode)
@@ -0,0 +1,45 @@
+"""
+    Shared setup for the benchmarks: a LocalViServer with a client pointed at it.
+"""
+import random
+import numpy as np
+from vectorai.client import ViClient
+from vectorai.local_server import LocalViServer
+from vectorai.models.deployed import ViText2Vec
+
+COLLECTION_NAME = "benchmark_collection"
+
+
+def sample_documents(num_of_documents: int, vector_length: int=30):
+    """
+    Documents with a nested field, a text field and a vector of vector_length.
+    """
+    return [{
+        '_id': str(i),
+        'country': random.choice(['Italy', 'Australia', 'Denmark', 'Brazil', 'France']),
+        'description': f"document number {i}",
+        'size': {'feet': random.randint(1, 30)},
+        'color_vector_': np.random.rand(vector_length).tolist(),
+    } for i in range(num_of_documents)]
+
+
+class LocalServerBenchmark:
+    """
+    Starts a LocalViServer before every benchmark and stops it afterwards.
+    """
+    timeout = 300
+
+    def setup(self, *params):
+        self.server = LocalViServer(encoding_dimension=30).start()
+        self.client = ViClient("username", "api_key", url=self.server.url, verbose=False)
+        self.text_encoder = ViText2Vec("username", "api_key", url=self.server.url)
+
+    def teardown(self, *params):
+        self.client.close()
+        self.text_encoder.close()
+        self.server.stop()
+
+    def create_collection(self, num_of_documents: int, vector_length: int=30):
+        documents = sample_documents(num_of_documents, vector_length)
+        self.client.insert_documents(COLLECTION_NAME, documents, chunksize=500, show_progress_bar=False)
+        return documents
@@ -8,7 +8,9 @@ core_req = ["requests", "numpy", "pandas", "appdirs>=1.4.4", "tqdm>=4.27.0", "pl
 extras_req = {
     "dev" : ["twine", "black", "pytest", "pytest-cov", "vectorai", "openapi-to-sdk"],
     "test" : ["pytest", "pytest-cov", "pytest-rerunfailures"],
-    "docs" : ["sphinx-rtd-theme>=0.5.0", "nbsphinx>=0.7.1"]
+    "docs" : ["sphinx-rtd-theme>=0.5.0", "nbsphinx>=0.7.1"],
+    "async" : ["aiohttp"],
+    "parquet" : ["pyarrow"]
 }
 extras_req["all"] = [p for r in extras_req.values() for p in r]
 
@@ -6,6 +6,7 @@ import os
 from vectorai.client import ViClient
 from vectorai.analytics.client import ViAnalyticsClient
 from vectorai.models.deployed import ViText2Vec
+from vectorai.local_server import LocalViServer
 import random
 import string
 
@@ -50,6 +51,23 @@ def test_client(test_username, test_api_key):
     return ViClient(username=test_username, api_key=test_api_key,
         url="https://vectorai-development-api-vectorai-test-api.azurewebsites.net/")
 
+@pytest.fixture
+def local_server():
+    """In-memory stand-in for the API so tests can run without a live service.
+    """
+    with LocalViServer() as server:
+        yield server
+
+
+@pytest.fixture
+def local_client(local_server):
+    return ViClient("username", "api_key", url=local_server.url, verbose=False)
+
+
+@pytest.fixture
+def text_encoder(local_server):
+    return ViText2Vec("username", "api_key", url=local_server.url)
+
 @pytest.fixture(scope='class')
 def test_collection_name():
     return "test_colour_col_" + str(get_random_string(3))
@@ -0,0 +1,42 @@
+"""Testing the asyncio client.
+"""
+import asyncio
+import pytest
+from vectorai.async_client import AsyncViClient
+from vectorai.errors import APIError
+
+pytest.importorskip("aiohttp")
+
+
+def test_async_endpoints_mirror_api():
+    assert asyncio.iscoroutinefunction(AsyncViClient.bulk_insert)
+    assert asyncio.iscoroutinefunction(AsyncViClient.advanced_search)
+    assert asyncio.iscoroutinefunction(AsyncViClient.retrieve_documents)
+
+
+def test_async_insert_and_retrieve_all_documents(local_server):
+    async def run():
+        async with AsyncViClient("username", "api_key", url=local_server.url) as client:
+            documents = client.client.create_sample_documents(20)
+            result = await client.insert_documents("test_collection", documents, chunksize=3, workers=4)
+            retrieved = await client.retrieve_all_documents("test_collection", retrieve_chunk_size=7)
+            return result, retrieved
+    result, retrieved = asyncio.run(run())
+    assert result["inserted_successfully"] == 20
+    assert sorted(d["_id"] for d in retrieved) == sorted(str(i) for i in range(20))
+
+
+def test_async_error(local_server):
+    async def run():
+        async with AsyncViClient("username", "api_key", url=local_server.url) as client:
+            await client.collection_stats("test_collection")
+    with pytest.raises(APIError):
+        asyncio.run(run())
+
+
+def test_only_the_client_is_exported():
+    import vectorai
+    from vectorai import async_client
+    assert async_client.__all__ == ['AsyncViClient']
+    assert vectorai.AsyncViClient is AsyncViClient
+    assert not hasattr(vectorai, '_RequestRecorder')
@@ -0,0 +1,188 @@
+"""Testing adaptive chunk sizes.
+"""
+import json
+import pytest
+import requests
+from vectorai.api.serializer import get_serializer
+from vectorai.api.utils import RetryPolicy
+from vectorai.batching import AdaptiveChunker, FailedDocumentHandler
+from vectorai.errors import APIError
+
+
+def test_chunk_size_grows_and_shrinks():
+    chunker = AdaptiveChunker(initial_size=10, increase=5, target_latency=1)
+    chunker.record_success(10, 0.1)
+    assert chunker.size == 15
+    chunker.record_success(3, 0.1)
+    assert chunker.size == 15
+    chunker.record_success(15, 2)
+    assert chunker.size == 7
+    chunker.record_failure()
+    assert chunker.size == 3
+
+
+def test_chunk_size_is_capped_by_bytes():
+    chunker = AdaptiveChunker(initial_size=100, target_bytes=1000)
+    chunker.send(lambda c: {}, [{"text": "a" * 190}])
+    assert 4 <= chunker.size <= 5
+    assert [len(c) for c in chunker.chunks(range(12))][:2] == [chunker.size] * 2
+
+
+def test_send_splits_chunks_that_are_too_large():
+    sent = []
+
+    def send(documents):
+        if len(documents) > 3:
+            raise APIError("Too large", status_code=413)
+        sent.append(len(documents))
+        return {"failed_document_ids": [d for d in documents if d % 5 == 0], "inserted_successfully": len(documents)}
+
+    chunker = AdaptiveChunker(initial_size=10)
+    result = chunker.send(send, list(range(10)))
+    assert sum(sent) == 10 and max(sent) <= 3
+    assert sorted(result["failed_document_ids"]) == [0, 5]
+    assert result["inserted_successfully"] == 10
+    assert chunker.size < 10
+
+
+def test_send_raises_other_errors():
+    def send(documents):
+        raise APIError("Bad request", status_code=400)
+    with pytest.raises(APIError):
+        AdaptiveChunker().send(send, [1, 2])
+
+    def timeout(documents):
+        raise requests.Timeout()
+    with pytest.raises(requests.Timeout):
+        AdaptiveChunker().send(timeout, [1])
+
+
+@pytest.mark.parametrize("error", [requests.Timeout(), APIError("Gateway timeout", status_code=504),
+    APIError("Request timeout", status_code=408)])
+def test_timeouts_shrink_later_chunks_without_resending(error):
+    sent = []
+
+    def send(documents):
+        sent.append(len(documents))
+        if len(documents) > 3:
+            raise error
+        return {"failed_document_ids": [], "inserted_successfully": len(documents)}
+
+    chunker = AdaptiveChunker(initial_size=10)
+    with pytest.raises(type(error)):
+        chunker.send(send, list(range(10)))
+    assert sent == [10]
+    assert chunker.size == 5
+    result = chunker.send(send, list(range(10)), retryable=True)
+    assert result["inserted_successfully"] == 10 and max(sent[1:]) > 3 and sum(sent[1:]) > 10
+
+def test_adaptive_insert_stays_under_payload_limit(local_server, local_client):
+    documents = local_client.create_sample_documents(60)
+    local_client.insert_documents("test_collection", documents[:1], show_progress_bar=False)
+    local_server.max_body_size = 20000
+    chunker = AdaptiveChunker(initial_size=30, target_bytes=10 ** 6)
+    result = local_client.insert_documents("test_collection", documents, chunksize=chunker, workers=2,
+        show_progress_bar=False, overwrite=True)
+    assert result["inserted_successfully"] == 60
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 60
+    assert local_client.metrics.to_dict()["bulk_insert"]["status_codes"]["413"] > 0
+    assert chunker.size < 30
+
+
+def test_adaptive_edit_documents(local_client):
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(40),
+        show_progress_bar=False)
+    edits = [{"_id": str(i), "edited": True} for i in range(40)]
+    result = local_client.edit_documents("test_collection", edits, chunk_size="auto")
+    assert result["edited_successfully"] == 40
+    assert all(d["edited"] for d in local_client.retrieve_all_documents("test_collection"))
+
+
+def test_failed_documents_are_retried():
+    attempts = []
+
+    def send(documents):
+        attempts.append([d["_id"] for d in documents])
+        failed = [d["_id"] for d in documents if d["_id"] == "3" and len(attempts) < 3]
+        return {"failed_document_ids": failed}
+
+    handler = FailedDocumentHandler(max_retries=3, retry_policy=RetryPolicy(backoff_factor=0))
+    result = handler.send(send, [{"_id": str(i)} for i in range(5)])
+    assert result == {"inserted_successfully": 5, "failed_document_ids": []}
+    assert attempts[1:] == [["3"], ["3"]]
+
+
+def test_poison_documents_are_isolated(local_server, local_client, tmp_path):
+    path = tmp_path / "dead_letters.jsonl"
+    documents = local_client.create_sample_documents(16)
+    local_client.insert_documents("test_collection", documents[:1], show_progress_bar=False)
+    local_server.max_body_size = 50000
+    documents[5]["text"] = "a" * 60000
+    documents[9]["color_vector_"] = [0.1]
+    result = local_client.insert_documents("test_collection", documents, chunksize=8, overwrite=True,
+        retry_failed=1, dead_letter_path=str(path), show_progress_bar=False)
+    assert sorted(result["failed_document_ids"]) == ["5", "9"]
+    assert result["inserted_successfully"] == 14
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 14
+    letters = {letter["document"]["_id"]: letter for letter in map(json.loads, path.read_text().splitlines())}
+    assert letters["5"]["status_code"] == 413 and "too large" in letters["5"]["error"]
+    assert letters["9"]["status_code"] is None
+
+
+def test_unserializable_documents_are_dead_lettered(tmp_path):
+    path = tmp_path / "dead_letters.jsonl"
+    sent = []
+
+    def send(documents):
+        get_serializer().dumps(documents)
+        sent.extend(documents)
+        return {"failed_document_ids": []}
+
+    handler = FailedDocumentHandler(dead_letter_path=str(path))
+    documents = [{"_id": str(i)} for i in range(6)]
+    documents[2]["value"] = object()
+    assert handler.send(send, documents)["failed_document_ids"] == ["2"]
+    assert len(sent) == 5
+    assert "TypeError" in json.loads(path.read_text())["error"]
+
+
+def test_errors_of_serializable_documents_are_raised_without_splitting(tmp_path):
+    path = tmp_path / "dead_letters.jsonl"
+    sent = []
+
+    def send(documents):
+        sent.append(len(documents))
+        raise TypeError("bulk_insert() got an unexpected keyword argument 'upsert'")
+
+    handler = FailedDocumentHandler(dead_letter_path=str(path))
+    with pytest.raises(TypeError):
+        handler.send(send, [{"_id": str(i)} for i in range(15)])
+    assert sent == [15]
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("status_code", [503, 429, 401, 403])
+def test_service_errors_are_raised_without_splitting(tmp_path, status_code):
+    path = tmp_path / "dead_letters.jsonl"
+    sent = []
+
+    def send(documents):
+        sent.append(len(documents))
+        raise APIError("Unavailable", status_code=status_code)
+
+    handler = FailedDocumentHandler(dead_letter_path=str(path), retry_policy=RetryPolicy(backoff_factor=0))
+    with pytest.raises(APIError):
+        handler.send(send, [{"_id": str(i)} for i in range(15)])
+    assert sent == [15]
+    assert not path.exists()
+
+
+def test_rejected_chunks_are_split():
+    def send(documents):
+        if any(d["_id"] == "4" for d in documents):
+            raise APIError("Invalid document", status_code=422)
+        return {"failed_document_ids": []}
+
+    handler = FailedDocumentHandler()
+    assert handler.send(send, [{"_id": str(i)} for i in range(8)]) == \
+        {"inserted_successfully": 7, "failed_document_ids": ["4"]}
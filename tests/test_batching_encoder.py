@@ -0,0 +1,60 @@
+"""Testing micro-batching of encode calls against the local server.
+"""
+import asyncio
+import pickle
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from vectorai.models.deployed import BatchingEncoder
+from vectorai.errors import APIError
+
+
+def test_concurrent_calls_are_batched(text_encoder):
+    texts = [f"text {i % 20}" for i in range(100)]
+    with BatchingEncoder(text_encoder, max_batch_size=32, max_wait=0.05) as encoder:
+        with ThreadPoolExecutor(max_workers=50) as threads:
+            vectors = list(threads.map(encoder.encode, texts))
+    assert vectors == [text_encoder.encode(t) for t in texts]
+    assert text_encoder.metrics.to_dict()["bulk_encode_text"]["requests"] < 20
+
+
+def test_coroutines_are_batched(text_encoder):
+    async def encode_all(encoder):
+        return await asyncio.gather(*[encoder.aencode(f"text {i}") for i in range(10)])
+
+    with BatchingEncoder(text_encoder, max_wait=0.05) as encoder:
+        vectors = asyncio.run(encode_all(encoder))
+    assert vectors[3] == text_encoder.encode("text 3")
+    assert text_encoder.metrics.to_dict()["bulk_encode_text"]["requests"] == 1
+
+
+def test_errors_reach_every_call_in_the_batch():
+    class FailingModel:
+        def bulk_encode(self, values):
+            raise APIError("Encoder unavailable", 503)
+
+    with BatchingEncoder(FailingModel(), max_wait=0.05) as encoder:
+        futures = [encoder.submit(str(i)) for i in range(3)]
+        for future in futures:
+            with pytest.raises(APIError):
+                future.result()
+
+
+def test_close_sends_queued_calls_and_rejects_new_ones(text_encoder):
+    encoder = BatchingEncoder(text_encoder, max_wait=10)
+    future = encoder.submit("queued")
+    encoder.close()
+    assert future.result() == text_encoder.encode("queued")
+    with pytest.raises(RuntimeError):
+        encoder.submit("late")
+
+
+def test_wrapper_reads_attributes_of_the_model(local_client, text_encoder):
+    encoder = BatchingEncoder(text_encoder)
+    assert encoder.url == text_encoder.url and encoder.__name__ == text_encoder.__name__
+    copy = pickle.loads(pickle.dumps(encoder))
+    assert copy.encode("text") == text_encoder.encode("text")
+    copy.close()
+    documents = local_client.encode_documents_with_models([{"name": "a"}, {"name": "b"}],
+        models={"name": encoder}, use_bulk_encode=False)
+    assert documents[1][f"name_{text_encoder.__name__}_vector_"] == text_encoder.encode("b")
+    encoder.close()
@@ -0,0 +1,56 @@
+"""Testing request body compression.
+"""
+import gzip
+import json
+import pytest
+import requests
+from vectorai.api.session import ViSession
+from vectorai.api.compression import compress_body
+from vectorai.options import get_option, set_option
+
+
+@pytest.fixture
+def gzip_compression():
+    original = get_option('request_compression'), get_option('request_compression_threshold')
+    set_option('request_compression', 'gzip')
+    set_option('request_compression_threshold', 1024)
+    yield
+    set_option('request_compression', original[0])
+    set_option('request_compression_threshold', original[1])
+
+
+def test_small_bodies_are_not_compressed():
+    body, content_encoding = compress_body(b'{}', 'gzip', threshold=1024)
+    assert body == b'{}'
+    assert content_encoding is None
+
+
+def test_large_bodies_are_compressed():
+    original = json.dumps([{"text": "the same description"}] * 1000).encode()
+    body, content_encoding = compress_body(original, 'gzip', threshold=1024, level=1)
+    assert content_encoding == 'gzip'
+    assert len(body) * 5 < len(original)
+    assert gzip.decompress(body) == original
+
+
+def test_zstd_compression():
+    zstandard = pytest.importorskip("zstandard")
+    original = json.dumps([{"text": "the same description"}] * 1000).encode()
+    body, content_encoding = compress_body(original, 'zstd', threshold=1024)
+    assert content_encoding == 'zstd'
+    assert zstandard.ZstdDecompressor().decompress(body) == original
+
+
+def test_compression_is_off_by_default():
+    documents = [{"_id": str(i), "text": "the same description"} for i in range(1000)]
+    request = requests.Request("POST", "http://localhost/collection/bulk_insert", json={"documents": documents})
+    prepared = ViSession().prepare_request(request)
+    assert "Content-Encoding" not in prepared.headers
+
+
+def test_session_compresses_large_bodies(gzip_compression):
+    documents = [{"_id": str(i), "text": "the same description"} for i in range(1000)]
+    request = requests.Request("POST", "http://localhost/collection/bulk_insert", json={"documents": documents})
+    prepared = ViSession().prepare_request(request)
+    assert prepared.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(prepared.body))["documents"] == documents
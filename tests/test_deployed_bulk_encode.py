@@ -0,0 +1,64 @@
+"""Testing bulk encodes of deployed models against the local server.
+"""
+import numpy as np
+import pytest
+from vectorai.models.deployed import ViImage2Vec
+from vectorai.errors import APIError
+
+
+def test_bulk_encode_splits_by_count_in_order(text_encoder):
+    text_encoder.bulk_encode_chunksize = 7
+    texts = [f"text {i}" for i in range(30)]
+    vectors = text_encoder.bulk_encode(texts)
+    assert vectors == [text_encoder.encode(t) for t in texts]
+    assert text_encoder.metrics.to_dict()["bulk_encode_text"]["requests"] == 5
+
+
+def test_bulk_encode_splits_by_bytes(text_encoder):
+    text_encoder.bulk_encode_max_bytes = 1000
+    methods = []
+    text_encoder.session.on_request(lambda request: methods.append(request.method))
+    vectors = text_encoder.bulk_encode(["x" * 300 + str(i) for i in range(10)])
+    assert len(vectors) == 10
+    assert methods == ["POST"] * 4
+
+
+def test_bulk_encode_sends_long_lists_in_the_body(local_server):
+    image_encoder = ViImage2Vec("username", "api_key", url=local_server.url)
+    urls = [f"https://example.com/images/{'a' * 100}/{i}.jpg" for i in range(1000)]
+    vectors = image_encoder.bulk_encode(urls)
+    assert len(vectors) == 1000 and vectors[999] == image_encoder.encode(urls[999])
+
+
+def test_bulk_encode_returns_an_array(text_encoder):
+    text_encoder.bulk_encode_chunksize = 4
+    texts = [f"text {i}" for i in range(10)]
+    vectors = text_encoder.bulk_encode(texts, return_array=True)
+    assert vectors.shape == (10, len(text_encoder.encode("text 0")))
+    assert vectors.dtype == np.float32 and vectors.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(vectors, np.array(text_encoder.bulk_encode(texts)), rtol=1e-6)
+
+
+def test_bulk_encode_falls_back_to_get(local_server, text_encoder):
+    methods = []
+    text_encoder.session.on_request(lambda request: methods.append(request.method))
+    local_server.fail_next(405)
+    assert text_encoder.bulk_encode(["a", "b"]) == [text_encoder.encode("a"), text_encoder.encode("b")]
+    text_encoder.bulk_encode(["c"])
+    assert methods == ["POST", "GET", "GET", "GET", "GET"]
+
+
+def test_bulk_encode_keeps_posting_after_a_404_of_both_methods(local_server, text_encoder):
+    methods = []
+    text_encoder.session.on_request(lambda request: methods.append(request.method))
+    local_server.fail_next(404, count=2)
+    with pytest.raises(APIError):
+        text_encoder.bulk_encode(["a"])
+    assert text_encoder.bulk_encode(["b"]) == [text_encoder.encode("b")]
+    assert methods == ["POST", "GET", "POST", "GET"]
+
+
+def test_bulk_encode_raises_errors(local_server, text_encoder):
+    local_server.fail_next(400)
+    with pytest.raises(APIError):
+        text_encoder.bulk_encode(["a"])
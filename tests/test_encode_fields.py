@@ -0,0 +1,111 @@
+"""Testing encoding several fields and models at the same time.
+"""
+import os
+import time
+import pytest
+from vectorai.models.base import ViText2Vec
+from vectorai.models.deployed import BatchingEncoder
+
+
+class SlowModel:
+    def __init__(self, name, delay=0.3):
+        self.__name__ = name
+        self.delay = delay
+
+    def bulk_encode(self, values):
+        time.sleep(self.delay)
+        return [[float(len(v)), 1.0] for v in values]
+
+
+def length_encoder(value):
+    return [float(len(value)), float(os.getpid())]
+
+
+class CountingModel:
+    pickles = 0
+
+    def __getstate__(self):
+        CountingModel.pickles += 1
+        return self.__dict__
+
+    def encode(self, value):
+        return [float(len(value)), float(os.getpid())]
+
+
+class LengthText2Vec(ViText2Vec):
+    def encode(self, value):
+        return [float(len(value))]
+
+
+def sample_documents():
+    return [{"_id": str(i), "title": "t" * i, "description": "d" * (i + 1)} for i in range(6)]
+
+
+def test_slow_models_overlap(local_client):
+    models = {"title": SlowModel("a"), "description": [SlowModel("b"), SlowModel("c")]}
+    expected = local_client.encode_documents_with_models(sample_documents(), models)
+    start = time.perf_counter()
+    documents = local_client.encode_documents_with_models(sample_documents(), models, field_workers=3)
+    assert time.perf_counter() - start < 0.6
+    assert documents == expected
+    assert [list(d) for d in documents] == [list(d) for d in expected]
+
+
+def test_local_models_run_in_processes(local_client):
+    models = {"title": length_encoder, "description": length_encoder}
+    documents = local_client.encode_documents_with_models(sample_documents(), models, field_workers=2)
+    assert documents[3]["title_vector_"][0] == 3.0 and documents[3]["description_vector_"][0] == 4.0
+    assert documents[3]["title_vector_"][1] != os.getpid()
+    local_client.close()
+
+
+def test_deployed_and_unpicklable_models_run_in_threads(local_client, local_server, text_encoder):
+    assert not local_client._encodes_in_process(text_encoder.encode)
+    assert not local_client._encodes_in_process(BatchingEncoder(text_encoder).encode)
+    assert local_client._encodes_in_process(text_encoder.encode, field_executor="process")
+    assert not local_client._encodes_in_process(lambda value: [1.0])
+    assert not local_client._encodes_in_process(length_encoder, field_executor="thread")
+    assert local_client._encodes_in_process(length_encoder)
+    assert local_client._encodes_in_process(LengthText2Vec("username", "api_key", local_server.url).encode)
+    documents = local_client.encode_documents_with_models(sample_documents(),
+        {"title": lambda value: [float(len(value))], "description": length_encoder}, field_workers=2,
+        field_executor="thread")
+    assert documents[2]["title_vector_"] == [2.0]
+    assert documents[2]["description_vector_"][1] == os.getpid()
+
+
+def test_models_are_pickled_once_for_each_call(local_client):
+    model = CountingModel()
+    models = {"title": model.encode, "description": model.encode}
+    documents = local_client.encode_documents_with_models(sample_documents(), models, field_workers=2)
+    pickles = CountingModel.pickles
+    for _ in range(2):
+        documents = local_client.encode_documents_with_models(sample_documents(), models, field_workers=2)
+    assert CountingModel.pickles == pickles + 2
+    assert documents[4]["title_vector_"][0] == 4.0
+    assert documents[4]["title_vector_"][1] != os.getpid()
+    local_client.close()
+
+
+def test_new_models_share_the_process_pool(local_client):
+    for _ in range(5):
+        models = {"title": CountingModel().encode, "description": CountingModel().encode}
+        documents = local_client.encode_documents_with_models(sample_documents(), models, field_workers=2)
+        assert documents[2]["title_vector_"][0] == 2.0 and documents[2]["description_vector_"][0] == 3.0
+    assert list(local_client._process_pools) == [2]
+    local_client.close()
+
+
+def test_unknown_field_executor(local_client):
+    with pytest.raises(ValueError):
+        local_client.encode_documents_with_models(sample_documents(),
+            {"title": length_encoder, "description": length_encoder}, field_workers=2, field_executor="fiber")
+
+
+def test_insert_with_field_workers(local_client):
+    models = {"title": SlowModel("a", 0), "description": SlowModel("b", 0)}
+    result = local_client.insert_documents("test_collection", sample_documents(), models=models,
+        field_workers=2, show_progress_bar=False)
+    assert result["inserted_successfully"] == 6
+    document = local_client.id(collection_name="test_collection", document_id="2")
+    assert document["title_a_vector_"][0] == 2.0 and document["description_b_vector_"][0] == 3.0
@@ -0,0 +1,108 @@
+"""Testing the encoding cache.
+"""
+import pickle
+import pytest
+from vectorai.encoding_cache import EncodingCache
+
+
+class CountingModel:
+    def __init__(self, url="model_a"):
+        self.__name__ = None
+        self.url = url
+        self.calls = []
+
+    def encode(self, value):
+        self.calls.append(value)
+        return [float(len(value)), 1.0]
+
+    def bulk_encode(self, values):
+        self.calls.append(list(values))
+        return [[float(len(v)), 1.0] for v in values]
+
+
+def test_encode_uses_the_cache(local_client):
+    model = CountingModel()
+    local_client.encoding_cache = EncodingCache()
+    documents = [{"category": ["shoes", "hats"][i % 2]} for i in range(10)]
+    local_client.encode_documents_with_models(documents[:2], models={"category": model}, use_bulk_encode=False)
+    local_client.encode_documents_with_models(documents, models={"category": model}, use_bulk_encode=False)
+    assert model.calls == ["shoes", "hats"]
+    assert documents[2]["category_vector_"] == [5.0, 1.0]
+    assert local_client.encoding_cache.hits == 2
+
+
+def test_bulk_encode_sends_each_value_once(local_client):
+    model = CountingModel()
+    cache = EncodingCache()
+    documents = [{"category": ["shoes", "hats", "socks"][i % 3]} for i in range(9)]
+    local_client.encode_documents_with_models(documents[:3], models={"category": model},
+        use_bulk_encode=True, encoding_cache=cache)
+    local_client.encode_documents_with_models(documents, models={"category": model},
+        use_bulk_encode=True, encoding_cache=cache)
+    assert model.calls == [["shoes", "hats", "socks"]]
+    assert [d["category_vector_"][0] for d in documents] == [5.0, 4.0, 5.0] * 3
+
+
+def test_models_have_separate_entries():
+    cache = EncodingCache()
+    first, second = CountingModel("model_a"), CountingModel("model_b")
+    assert cache.model_key(first.encode) != cache.model_key(second.encode)
+    cache.encode(first, "shoes", first.encode)
+    cache.encode(second, "shoes", second.encode)
+    assert first.calls == ["shoes"] and second.calls == ["shoes"]
+
+
+def test_models_that_cannot_be_told_apart_are_not_cached():
+    cache = EncodingCache()
+    first, second = (lambda value: [1.0]), (lambda value: [2.0])
+    assert cache.encode(first, "shoes", first) == [1.0]
+    assert cache.encode(second, "shoes", second) == [2.0]
+    assert cache.bulk_encode(second, ["shoes"], lambda values: [[2.0]]) == [[2.0]]
+    unnamed = CountingModel(url=None)
+    assert cache.model_key(unnamed) is None and cache.model_key(unnamed.encode) is None
+    assert cache.model_key(len) == "builtins.len"
+    first.cache_key = "first"
+    cache.encode(first, "shoes", first)
+    assert cache.encode(first, "shoes", lambda value: None) == [1.0]
+
+
+def test_disk_cache_persists_and_evicts(tmp_path):
+    path = str(tmp_path / "encodings.cache")
+    model = CountingModel()
+    cache = EncodingCache(path=path, max_disk_bytes=16 * 10)
+    for i in range(20):
+        cache.encode(model, "x" * i, model.encode)
+    cache.close()
+    reopened = pickle.loads(pickle.dumps(EncodingCache(path=path, max_disk_bytes=16 * 10)))
+    assert reopened.encode(model, "x" * 19, lambda value: None) == [19.0, 1.0]
+    assert reopened.encode(model, "x", lambda value: "encoded") == "encoded"
+    assert reopened._disk_bytes <= 16 * 10
+
+
+def test_bulk_encode_is_detected_and_values_deduplicated(local_client):
+    model = CountingModel()
+    calls = []
+
+    def encode(value):
+        calls.append(value)
+        return [1.0, 2.0]
+
+    documents = [{"category": ["shoes", "hats"][i % 2], "tags": ["a", "b"]} for i in range(6)]
+    local_client.encode_documents_with_models(documents, models={"category": model, "tags": encode})
+    assert model.calls == [["shoes", "hats"]]
+    assert calls == [["a", "b"]]
+    assert all(d["tags_vector_"] == [1.0, 2.0] for d in documents)
+    assert [d["category_vector_"][0] for d in documents] == [5.0, 4.0] * 3
+
+
+@pytest.mark.parametrize("use_bulk_encode", [None, True, False])
+def test_documents_missing_the_field_get_empty_vectors(local_client, use_bulk_encode):
+    model = CountingModel()
+    documents = [{"category": "shoes"}, {"name": "no category"}, {"category": "hats"}]
+    with pytest.warns(UserWarning):
+        local_client.encode_documents_with_models(documents, models={"category": model},
+            use_bulk_encode=use_bulk_encode)
+    encoded = [v for call in model.calls for v in (call if isinstance(call, list) else [call])]
+    assert sorted(encoded) == ["hats", "shoes"]
+    assert documents[0]["category_vector_"] == [5.0, 1.0]
+    assert documents[1]["category_vector_"] == local_client.dummy_vector(2)
@@ -0,0 +1,88 @@
+"""Testing skipping unchanged documents with fingerprints.
+"""
+import pytest
+from vectorai.errors import APIError
+from vectorai.fingerprints import FingerprintStore
+
+
+def test_fingerprint_ignores_vectors_and_insert_date():
+    document = {"_id": "1", "name": "a", "nested": {"b": 1, "nested_vector_": [0.1]}}
+    fingerprint = FingerprintStore.fingerprint(document)
+    assert FingerprintStore.fingerprint({**document, "name_vector_": [1.0], "insert_date_": "2020"}) == fingerprint
+    assert FingerprintStore.fingerprint({**document, "nested": {"b": 2}}) != fingerprint
+
+
+def test_insert_skips_unchanged_documents(local_client, tmp_path):
+    path = str(tmp_path / "documents.fingerprints")
+    encoded = []
+
+    def encode(color):
+        encoded.append(color)
+        return [1.0, 2.0]
+
+    documents = [{"_id": str(i), "color": f"color {i}"} for i in range(20)]
+    result = local_client.insert_documents("test_collection", documents, models={"color": encode},
+        fingerprints=path, show_progress_bar=False)
+    assert result["inserted_successfully"] == 20 and result["unchanged"] == 0
+    encoded.clear()
+    local_client.metrics.reset()
+    documents = [{"_id": str(i), "color": f"color {i}"} for i in range(25)]
+    documents[3]["color"] = "changed"
+    result = local_client.insert_documents("test_collection", documents, models={"color": encode},
+        fingerprints=path, overwrite=True, show_progress_bar=False)
+    assert result["inserted_successfully"] == 6 and result["unchanged"] == 19
+    assert sorted(encoded) == sorted(["changed"] + [f"color {i}" for i in range(20, 25)])
+    assert local_client.id(collection_name="test_collection", document_id="3")["color"] == "changed"
+    result = local_client.insert_documents("test_collection", documents, models={"color": encode},
+        fingerprints=path, show_progress_bar=False)
+    assert result == {"inserted_successfully": 0, "failed": 0, "failed_document_ids": [], "unchanged": 25}
+
+
+def test_failed_documents_are_not_fingerprinted(local_client, tmp_path):
+    path = str(tmp_path / "documents.fingerprints")
+    documents = local_client.create_sample_documents(10)
+    local_client.insert_documents("test_collection", documents[:1], show_progress_bar=False)
+    documents[4]["color_vector_"] = [0.1]
+    local_client.insert_documents("test_collection", documents, overwrite=True, fingerprints=path,
+        show_progress_bar=False)
+    with FingerprintStore(path) as store:
+        assert sorted(store.lookup("test_collection", [str(i) for i in range(10)])) == \
+            [str(i) for i in range(10) if i != 4]
+
+
+def test_edit_documents_skips_repeated_edits(local_client, tmp_path):
+    path = str(tmp_path / "edits.fingerprints")
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(10),
+        show_progress_bar=False)
+    edits = [{"_id": str(i), "edited": 1} for i in range(10)]
+    assert local_client.edit_documents("test_collection", edits, fingerprints=path)["edited_successfully"] == 10
+    edits[2]["edited"] = 2
+    result = local_client.edit_documents("test_collection", edits, fingerprints=path)
+    assert result["edited_successfully"] == 1 and result["unchanged"] == 9
+
+
+def test_edit_documents_writes_new_vectors(local_client, tmp_path):
+    path = str(tmp_path / "documents.fingerprints")
+    local_client.insert_documents("test_collection", [{"_id": "1", "name": "a"}], fingerprints=path,
+        show_progress_bar=False)
+    for vector in ([0.1, 0.2], [0.3, 0.4]):
+        result = local_client.edit_documents("test_collection", [{"_id": "1", "name_vector_": vector}],
+            fingerprints=path)
+        assert result["edited_successfully"] == 1 and result["unchanged"] == 0
+    assert local_client.id(collection_name="test_collection", document_id="1")["name_vector_"] == [0.3, 0.4]
+    # Edits do not replace the fingerprint of the insert
+    result = local_client.insert_documents("test_collection", [{"_id": "1", "name": "a"}], fingerprints=path,
+        show_progress_bar=False)
+    assert result["unchanged"] == 1
+
+
+def test_edit_documents_closes_the_store_after_an_error(local_server, local_client, tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(FingerprintStore, "close", lambda self: closed.append(self.path))
+    path = str(tmp_path / "edits.fingerprints")
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(5),
+        show_progress_bar=False)
+    local_server.fail_next(400)
+    with pytest.raises(APIError):
+        local_client.edit_documents("test_collection", [{"_id": "1", "edited": 1}], fingerprints=path)
+    assert closed == [path]
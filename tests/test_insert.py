@@ -0,0 +1,169 @@
+"""Testing insert_documents against the local server.
+"""
+import json
+import threading
+import numpy as np
+import pytest
+
+
+def test_thread_executor_shares_session_and_supports_hooks(local_client):
+    threads = set()
+
+    def hook(document):
+        threads.add(threading.get_ident())
+        document["hooked"] = True
+
+    session = local_client.session
+    documents = local_client.create_sample_documents(40)
+    result = local_client.insert_documents("test_collection", documents, chunksize=4, workers=4,
+        executor="thread", preprocess_hook=hook, show_progress_bar=False)
+    assert result["inserted_successfully"] == 40
+    assert local_client.session is session
+    assert local_client.metrics.to_dict()["bulk_insert"]["requests"] == 10
+    assert len(threads) > 1
+    documents = local_client.retrieve_all_documents("test_collection")
+    assert len(documents) == 40 and all(d["hooked"] for d in documents)
+
+
+def test_process_pool_is_reused(local_client):
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(20),
+        chunksize=5, workers=2, executor="process")
+    pools = dict(local_client._process_pools)
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(20),
+        chunksize=5, workers=2, executor="process", overwrite=True)
+    assert local_client._process_pools == pools and len(pools) == 1
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 20
+    local_client.close()
+    assert "_process_pools" not in local_client.__dict__
+
+
+def test_process_pools_are_created_once_for_each_size(local_client):
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        pools = list(threads.map(lambda _: local_client._get_process_pool(2), range(8)))
+    assert all(pool is pools[0] for pool in pools)
+    other = local_client._get_process_pool(3)
+    # A pool of another size does not stop the one in use
+    assert pools[0].apply_async(abs, (-1,)).get(timeout=10) == 1
+    assert local_client._get_process_pool(2) is pools[0] and other is not pools[0]
+    local_client.close()
+
+
+def test_unknown_executor(local_client):
+    with pytest.raises(ValueError):
+        local_client.insert_documents("test_collection", local_client.create_sample_documents(2),
+            workers=2, executor="fiber")
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"workers": 4, "executor": "thread"}, {"pipelined": True},
+    {"workers": 2, "executor": "process"}])
+def test_insert_from_generator_reads_lazily(local_client, kwargs):
+    sample = local_client.create_sample_documents(1)[0]
+    read = [0]
+
+    def documents():
+        for i in range(200):
+            read[0] += 1
+            yield {**sample, "_id": str(i)}
+
+    result = local_client.insert_documents("test_collection", documents(), chunksize=10,
+        show_progress_bar=False, **kwargs)
+    assert result["inserted_successfully"] == 200
+    assert read[0] == 200
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 200
+
+
+def test_insert_from_generator_has_bounded_read_ahead(local_client):
+    sample = local_client.create_sample_documents(1)[0]
+    read, inserted = [0], [0]
+    peak = [0]
+
+    def documents():
+        for i in range(300):
+            read[0] += 1
+            peak[0] = max(peak[0], read[0] - inserted[0])
+            yield {**sample, "_id": str(i)}
+
+    def count(response):
+        if "bulk_insert" in response.url:
+            inserted[0] += 10
+    local_client.on_response(count)
+    local_client.insert_documents("test_collection", documents(), chunksize=10, workers=2,
+        executor="thread", show_progress_bar=False)
+    # Never more than a handful of chunks read ahead of the inserts
+    assert peak[0] <= 10 * 6
+
+
+def test_insert_empty_iterable(local_client):
+    result = local_client.insert_documents("test_collection", iter([]), show_progress_bar=False)
+    assert result == {"inserted_successfully": 0, "failed": 0, "failed_document_ids": []}
+
+
+def test_insert_jsonl(local_client, tmp_path):
+    documents = local_client.create_sample_documents(30)
+    path = tmp_path / "documents.jsonl"
+    path.write_text("\n".join(json.dumps(d) for d in documents) + "\n\n")
+    result = local_client.insert_jsonl("test_collection", str(path), chunksize=7, show_progress_bar=False)
+    assert result["inserted_successfully"] == 30
+    assert local_client.id(collection_name="test_collection", document_id="3")["color_vector_"] == \
+        documents[3]["color_vector_"]
+
+
+def test_insert_csv(local_client, tmp_path):
+    path = tmp_path / "documents.csv"
+    path.write_text('_id,name,size,color_vector_\n'
+        '1,a,1.5,"[0.1, 0.2]"\n'
+        '2,b,,"[0.3, 0.4]"\n'
+        '3,,2.0,\n')
+    result = local_client.insert_csv("test_collection", str(path), read_chunksize=2, show_progress_bar=False)
+    assert result["inserted_successfully"] == 3
+    documents = {d["_id"]: d for d in local_client.retrieve_all_documents("test_collection")}
+    assert documents["1"]["color_vector_"] == [0.1, 0.2] and documents["1"]["size"] == 1.5
+    assert "size" not in documents["2"]
+    assert "name" not in documents["3"] and "color_vector_" not in documents["3"]
+
+
+def test_df_to_documents_stacks_vector_columns(local_client):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"_id": ["a", "b", "c"], "value": [1, None, 3],
+        "image_vector_": [np.array([1.0, 2.0]), np.array([3.0, 4.0]), None]})
+    assert local_client._df_to_documents(df) == [
+        {"_id": "a", "value": 1.0, "image_vector_": [1.0, 2.0]},
+        {"_id": "b", "image_vector_": [3.0, 4.0]},
+        {"_id": "c", "value": 3.0},
+    ]
+
+
+def test_insert_parquet(local_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    documents = local_client.create_sample_documents(25)
+    path = tmp_path / "documents.parquet"
+    pd.DataFrame.from_records(documents).to_parquet(path)
+    result = local_client.insert_parquet("test_collection", str(path), read_chunksize=10, show_progress_bar=False)
+    assert result["inserted_successfully"] == 25
+
+
+def test_insert_df_in_slices(local_client):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"_id": [str(i) for i in range(25)], "name": ["a"] * 24 + [None],
+        "x0": np.arange(25, dtype=float), "x1": np.ones(25)})
+    df.loc[3, "x1"] = np.nan
+    converted = []
+    to_documents = local_client._df_to_documents
+    local_client._df_to_documents = lambda df, *args: converted.append(len(df)) or to_documents(df, *args)
+    result = local_client.insert_df("test_collection", df, vector_columns={"x_vector_": ["x0", "x1"]},
+        read_chunksize=10, show_progress_bar=False)
+    assert result["inserted_successfully"] == 25
+    assert converted == [10, 10, 5]
+    documents = {d["_id"]: d for d in local_client.retrieve_all_documents("test_collection")}
+    assert documents["2"]["x_vector_"] == [2.0, 1.0] and "x0" not in documents["2"]
+    assert "x_vector_" not in documents["3"]
+    assert "name" not in documents["24"]
+
+
+def test_insert_df_with_a_total(local_client):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"_id": [str(i) for i in range(5)], "name": ["a"] * 5})
+    result = local_client.insert_df("test_collection", df, total=5, show_progress_bar=False)
+    assert result["inserted_successfully"] == 5
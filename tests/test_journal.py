@@ -0,0 +1,70 @@
+"""Testing journaled and resumed inserts.
+"""
+import pytest
+from vectorai.journal import InsertJournal
+
+
+def crashing_documents(documents, crash_after):
+    for i, d in enumerate(documents):
+        if i == crash_after:
+            raise RuntimeError("Crashed")
+        yield d
+
+
+def test_journaled_insert_resumes_at_the_next_chunk(local_client, tmp_path):
+    path = str(tmp_path / "insert.journal")
+    documents = local_client.create_sample_documents(100)
+    with pytest.raises(RuntimeError):
+        local_client.insert_documents("test_collection", crashing_documents(documents, 47), chunksize=10,
+            journal=path, show_progress_bar=False)
+    assert InsertJournal(path).num_of_documents == 40
+    local_client.metrics.reset()
+    result = local_client.insert_documents("test_collection", documents, chunksize=10, journal=path,
+        show_progress_bar=False)
+    assert result["inserted_successfully"] == 60
+    assert local_client.metrics.to_dict()["bulk_insert"]["requests"] == 6
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 100
+    assert InsertJournal(path).num_of_documents == 100
+
+
+def test_journal_opened_from_a_path_is_closed_after_a_crash(local_client, tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(InsertJournal, "close", lambda self: closed.append(self.path))
+    path = str(tmp_path / "insert.journal")
+    documents = local_client.create_sample_documents(30)
+    with pytest.raises(RuntimeError):
+        local_client.insert_documents("test_collection", crashing_documents(documents, 15), chunksize=10,
+            journal=path, show_progress_bar=False)
+    assert closed == [path]
+
+def test_journal_with_threads_and_failed_documents(local_client, tmp_path):
+    path = str(tmp_path / "insert.journal")
+    documents = local_client.create_sample_documents(30)
+    local_client.insert_documents("test_collection", documents[:1], show_progress_bar=False)
+    documents[12]["color_vector_"] = [0.1]
+    result = local_client.insert_documents("test_collection", documents, chunksize=4, workers=3,
+        overwrite=True, journal=path, show_progress_bar=False)
+    assert result["failed_document_ids"] == ["12"]
+    with InsertJournal(path) as journal:
+        assert journal.num_of_documents == 30
+        assert journal.failed_document_ids() == ["12"]
+    assert local_client.insert_documents("test_collection", documents, journal=path,
+        show_progress_bar=False)["inserted_successfully"] == 0
+
+
+def test_journal_belongs_to_one_collection(tmp_path):
+    path = str(tmp_path / "insert.journal")
+    InsertJournal(path, "test_collection").close()
+    with pytest.raises(ValueError):
+        InsertJournal(path, "other_collection")
+
+
+def test_resume_insert_documents(local_client):
+    documents = local_client.create_sample_documents(25)
+    local_client.insert_documents("test_collection", documents[:10], show_progress_bar=False)
+    local_client.metrics.reset()
+    result = local_client.resume_insert_documents("test_collection", documents, missing_id_chunksize=10,
+        show_progress_bar=False)
+    assert result["inserted_successfully"] == 15
+    assert local_client.metrics.to_dict()["bulk_missing_id"]["requests"] == 3
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 25
@@ -0,0 +1,124 @@
+"""Testing the in-process stand-in server.
+"""
+import numpy as np
+import pytest
+from vectorai.api.session import ViSession
+from vectorai.client import ViClient
+from vectorai.errors import APIError
+from vectorai.local_server import LocalViServer
+from vectorai.options import get_option, set_option
+
+
+def test_insert_and_retrieve_all_documents(local_client):
+    documents = local_client.create_sample_documents(50)
+    result = local_client.insert_documents("test_collection", documents, chunksize=7)
+    assert result["inserted_successfully"] == 50
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 50
+    assert local_client.collection_schema("test_collection")["color_vector_"] == 30
+    retrieved = local_client.retrieve_all_documents("test_collection", retrieve_chunk_size=8)
+    assert [d["_id"] for d in retrieved] == [d["_id"] for d in documents]
+
+
+def test_bulk_id_and_missing_id(local_client):
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(5))
+    documents = local_client.bulk_id(collection_name="test_collection", document_ids=["1", "3"])
+    assert [d["_id"] for d in documents] == ["1", "3"]
+    assert local_client.bulk_missing_id("test_collection", ["1", "10", "11"]) == ["10", "11"]
+
+
+def test_overwrite(local_client):
+    documents = local_client.create_sample_documents(3)
+    local_client.insert_documents("test_collection", documents)
+    edited = [dict(d, country="Nowhere") for d in documents]
+    local_client.insert_documents("test_collection", edited, overwrite=False)
+    assert local_client.id(collection_name="test_collection", document_id="1")["country"] == documents[1]["country"]
+    local_client.insert_documents("test_collection", edited, overwrite=True)
+    assert local_client.id(collection_name="test_collection", document_id="1")["country"] == "Nowhere"
+
+
+def test_wrong_vector_length_fails(local_client):
+    documents = local_client.create_sample_documents(3)
+    local_client.insert_documents("test_collection", documents)
+    documents[1]["color_vector_"] = [0.1, 0.2]
+    result = local_client.insert_documents("test_collection", documents, overwrite=True)
+    assert result["failed_document_ids"] == ["1"]
+
+
+def test_edit_documents(local_client):
+    local_client.insert_documents("test_collection", local_client.create_sample_documents(5))
+    result = local_client.edit_documents("test_collection",
+        [{"_id": "1", "size.feet": 100}, {"_id": "missing", "country": "Peru"}])
+    assert result["failed_document_ids"] == ["missing"]
+    assert local_client.id(collection_name="test_collection", document_id="1")["size"]["feet"] == 100
+
+
+def test_advanced_search(local_client):
+    documents = local_client.create_sample_documents(20)
+    local_client.insert_documents("test_collection", documents)
+    vector = documents[4]["color_vector_"]
+    results = local_client.advanced_search("test_collection",
+        {"color": {"vector": vector, "fields": ["color_vector_"]}}, page_size=5)
+    assert results["count"] == 20
+    assert results["results"][0]["_id"] == "4"
+    np.testing.assert_almost_equal(results["results"][0]["_search_score"], 1, decimal=5)
+    results = local_client.advanced_search("test_collection",
+        {"color": {"vector": vector, "fields": ["color_vector_"]}}, metric="l2", page_size=5)
+    assert results["results"][0]["_id"] == "4"
+    assert results["results"][0]["_search_score"] < results["results"][1]["_search_score"]
+
+
+def test_filters(local_client):
+    documents = local_client.create_sample_documents(30)
+    local_client.insert_documents("test_collection", documents)
+    results = local_client.filters("test_collection",
+        [{"field": "size.feet", "filter_type": "numeric", "condition": ">=", "condition_value": 10}], page_size=30)
+    assert results["count"] == sum(d["size"]["feet"] >= 10 for d in documents)
+    results = local_client.filters("test_collection",
+        [{"field": "country", "filter_type": "contains", "condition": "==", "condition_value": "ital"}], page_size=30)
+    assert results["count"] == sum(d["country"] == "Italy" for d in documents)
+
+
+def test_login_is_checked(local_client):
+    with LocalViServer(username="username", api_key="api_key") as server:
+        ViClient("username", "api_key", url=server.url)
+        with pytest.raises(APIError):
+            ViClient("username", "wrong", url=server.url, verbose=False).list_collections()
+
+
+def test_retries_injected_failures(local_server, local_client):
+    local_server.fail_next(503, count=2, retry_after=0)
+    assert local_client.list_collections() == []
+    assert local_server.request_count == 3
+
+
+@pytest.mark.parametrize("encoding", ["float32", "float16"])
+def test_vector_wire_encoding(local_client, encoding):
+    local_client.session = ViSession(vector_encoding=encoding)
+    documents = local_client.create_sample_documents(5)
+    local_client.insert_documents("test_collection", documents)
+    document = local_client.id(collection_name="test_collection", document_id="2")
+    np.testing.assert_almost_equal(document["color_vector_"], documents[2]["color_vector_"], decimal=2)
+
+
+def test_vector_wire_encoding_in_head_and_encode(local_client, text_encoder):
+    documents = local_client.create_sample_documents(3)
+    local_client.insert_documents("test_collection", documents)
+    vector = text_encoder.encode("text")
+    local_client.session = text_encoder.session = ViSession(vector_encoding="float32")
+    head = local_client.head("test_collection", page_size=3, return_as_pandas_df=False)
+    assert isinstance(head[0]["color_vector_"], np.ndarray)
+    np.testing.assert_almost_equal(head[0]["color_vector_"],
+        local_client.id(collection_name="test_collection", document_id=head[0]["_id"])["color_vector_"])
+    np.testing.assert_almost_equal(text_encoder.encode("text"), vector)
+
+
+def test_compressed_request_bodies(local_client):
+    original = get_option('request_compression'), get_option('request_compression_threshold')
+    set_option('request_compression', 'gzip')
+    set_option('request_compression_threshold', 1024)
+    try:
+        local_client.insert_documents("test_collection", local_client.create_sample_documents(50), chunksize=50)
+    finally:
+        set_option('request_compression', original[0])
+        set_option('request_compression_threshold', original[1])
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 50
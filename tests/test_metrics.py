@@ -0,0 +1,59 @@
+"""Testing request metrics and hooks.
+"""
+from vectorai.api.metrics import ViMetrics
+
+
+def test_metrics_per_endpoint(local_client):
+    documents = local_client.create_sample_documents(20)
+    local_client.insert_documents("test_collection", documents, chunksize=5)
+    local_client.retrieve_all_documents("test_collection", retrieve_chunk_size=10)
+    metrics = local_client.metrics.to_dict()
+    assert metrics["bulk_insert"]["requests"] == 4
+    assert metrics["bulk_insert"]["errors"] == 0
+    assert metrics["bulk_insert"]["bytes_sent"] > 0
+    assert metrics["retrieve_documents"]["bytes_received"] > 0
+    latency = metrics["bulk_insert"]["latency"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+def test_retries_and_failed_documents(local_server, local_client):
+    documents = local_client.create_sample_documents(5)
+    local_client.insert_documents("test_collection", documents)
+    local_server.fail_next(503, count=2, retry_after=0)
+    documents[1]["color_vector_"] = [0.1, 0.2]
+    local_client.insert_documents("test_collection", documents, overwrite=True)
+    metrics = local_client.metrics.to_dict()
+    assert metrics["list_collections"]["retries"] == 2
+    assert metrics["list_collections"]["status_codes"] == {"200": 2, "503": 2}
+    assert metrics["bulk_insert"]["failed_documents"] == 1
+
+
+def test_hooks(local_client):
+    requests, responses = [], []
+    local_client.on_request(lambda request: requests.append(request.url))
+
+    @local_client.on_response
+    def record(response):
+        responses.append(response.status_code)
+
+    local_client.list_collections()
+    assert len(requests) == 1 and "list_collections" in requests[0]
+    assert responses == [200]
+
+
+def test_prometheus_export():
+    metrics = ViMetrics(buckets=(0.1, 1))
+    metrics.record_request("bulk_insert", 200, 0.05, bytes_sent=100, bytes_received=10)
+    metrics.record_request("bulk_insert", 200, 0.5)
+    metrics.record_request("bulk_insert", None, 2)
+    metrics.record_failed_documents("bulk_insert", 3)
+    text = metrics.to_prometheus()
+    assert 'vectorai_requests_total{endpoint="bulk_insert",status="200"} 2' in text
+    assert 'vectorai_requests_total{endpoint="bulk_insert",status="none"} 1' in text
+    assert 'vectorai_request_duration_seconds_bucket{endpoint="bulk_insert",le="1"} 2' in text
+    assert 'vectorai_request_duration_seconds_bucket{endpoint="bulk_insert",le="+Inf"} 3' in text
+    assert 'vectorai_failed_documents_total{endpoint="bulk_insert"} 3' in text
+    assert 'vectorai_sent_bytes_total{endpoint="bulk_insert"} 100' in text
+    assert metrics.to_dict()["bulk_insert"]["errors"] == 1
+    metrics.reset()
+    assert metrics.to_dict() == {}
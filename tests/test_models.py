@@ -2,8 +2,10 @@
     Test for models.
 """
 
+import numpy as np
 import pytest
 from vectorai.models import ViDeployedModel
+from vectorai.models.base import ViText2Vec
 
 def test_operations_sum(test_text_encoder):
     vectors = [[1, 2], [2, 3]]
@@ -29,3 +31,48 @@ def test_operations_min_with_error(test_text_encoder):
     with pytest.raises(ValueError):
         vectors = vectors = [[1, 2], [2, 3], [2, 4]]
         test_text_encoder._vector_operation(vectors, vector_operation='minus')
+
+
+class LengthModel(ViText2Vec):
+    def __init__(self):
+        self.batches = []
+
+    def encode_text(self, text):
+        return [float(len(text)), 1.0]
+
+    def encode_text_batch(self, texts):
+        self.batches.append(len(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def test_bulk_encode_text_returns_one_array():
+    model = LengthModel()
+    vectors = model.bulk_encode_text(["a" * i for i in range(10)], chunk_size=4)
+    assert vectors.dtype == np.float32 and vectors.shape == (10, 2)
+    assert vectors[:, 0].tolist() == list(range(10))
+    assert model.batches == [4, 4, 2]
+
+
+def test_bulk_encode_text_updates_documents():
+    model = LengthModel()
+    model.encode_batch_size = 3
+    documents = [{"name": {"first": "a" * i}} for i in range(5)]
+    vectors = model.bulk_encode_text(documents, "name.first")
+    assert documents[4]["name"]["first_vector_"] == [4.0, 1.0]
+    assert vectors.shape == (5, 2) and model.batches == [3, 2]
+
+
+def test_iter_encode_text_reads_lazily():
+    model = LengthModel()
+    batches = model.iter_encode_text((str(i) for i in range(5)), chunk_size=2)
+    assert next(batches).tolist() == [[1.0, 1.0], [1.0, 1.0]]
+    assert model.batches == [2]
+    assert sum(len(b) for b in batches) == 3
+
+
+def test_encode_documents_with_array_bulk_encode(local_client):
+    model = LengthModel()
+    model.__name__ = None
+    documents = [{"name": "ab"}, {"name": "abc"}]
+    local_client.encode_documents_with_models(documents, models={"name": model})
+    assert documents[1]["name_vector_"] == [3.0, 1.0]
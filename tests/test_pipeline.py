@@ -0,0 +1,61 @@
+"""Testing pipelined inserts.
+"""
+import threading
+import time
+import pytest
+from vectorai.pipeline import run_pipeline
+
+
+def test_pipeline_runs_every_stage():
+    results = run_pipeline(range(20), [(lambda x: x + 1, 2), (lambda x: x * 10, 3)], max_queued=1)
+    assert sorted(results) == [(x + 1) * 10 for x in range(20)]
+
+
+def test_pipeline_bounds_items_in_flight():
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def items():
+        for i in range(30):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            yield i
+
+    def slow(x):
+        time.sleep(0.005)
+        with lock:
+            in_flight[0] -= 1
+        return x
+
+    assert len(list(run_pipeline(items(), [(lambda x: x, 1), (slow, 1)], max_queued=2))) == 30
+    # Two queues of 2 items, one item in each stage and one waiting to be queued
+    assert peak[0] <= 7
+
+
+def test_pipeline_raises_stage_errors():
+    def fail(x):
+        if x == 5:
+            raise ValueError("bad item")
+        return x
+    with pytest.raises(ValueError):
+        list(run_pipeline(range(100), [(fail, 2), (lambda x: x, 1)]))
+
+
+def test_pipelined_insert_overlaps_encoding_and_uploading(local_server, local_client):
+    local_server.latency = 0.02
+    in_flight, overlapped = [0], []
+    local_client.on_request(lambda request: in_flight.__setitem__(0, in_flight[0] + 1))
+    local_client.on_response(lambda response: in_flight.__setitem__(0, in_flight[0] - 1))
+
+    def encode(country):
+        overlapped.append(in_flight[0] > 0)
+        return [1.0, 2.0]
+
+    documents = local_client.create_sample_documents(50)
+    result = local_client.insert_documents("test_collection", documents, models={"country": encode},
+        chunksize=5, pipelined=True, upload_workers=2, show_progress_bar=False)
+    assert result["inserted_successfully"] == 50
+    assert local_client.collection_stats("test_collection")["number_of_documents"] == 50
+    assert local_client.id(collection_name="test_collection", document_id="7")["country_vector_"] == [1.0, 2.0]
+    assert any(overlapped)
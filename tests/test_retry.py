@@ -0,0 +1,111 @@
+"""Testing the retry policy applied by the client session.
+"""
+import json
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from vectorai.client import ViClient
+from vectorai.api.utils import RetryPolicy
+from vectorai.errors import APIError
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Transport adapter that answers with a scripted list of status codes or errors.
+    """
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status = self.responses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        headers = {}
+        if isinstance(status, tuple):
+            status, headers = status
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = json.dumps({"status": "success", "failed_document_ids": []}).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def scripted_client(responses, **policy_kwargs):
+    client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+    client.retry_policy = RetryPolicy(backoff_factor=0.001, **policy_kwargs)
+    adapter = ScriptedAdapter(responses)
+    client.session.mount("http://", adapter)
+    return client, adapter
+
+
+def test_retry_on_throttling():
+    client, adapter = scripted_client([429, 503, 200], max_retries=3)
+    client.collection_stats("test_collection")
+    assert len(adapter.requests) == 3
+
+
+def test_retry_on_connection_error():
+    client, adapter = scripted_client([requests.ConnectionError(), 200], max_retries=3)
+    client.collection_stats("test_collection")
+    assert len(adapter.requests) == 2
+
+
+def test_retry_gives_up_after_max_retries():
+    client, adapter = scripted_client([503, 503, 503], max_retries=2)
+    with pytest.raises(APIError):
+        client.collection_stats("test_collection")
+    assert len(adapter.requests) == 3
+
+
+def test_write_endpoints_are_not_retried_by_default():
+    client, adapter = scripted_client([503, 200], max_retries=3)
+    with pytest.raises(APIError):
+        client.bulk_insert("test_collection", documents=[{"_id": "1"}])
+    assert len(adapter.requests) == 1
+
+
+def test_write_endpoints_can_opt_in():
+    client, adapter = scripted_client([503, 200], max_retries=3,
+        retry_endpoints=RetryPolicy.READ_ENDPOINTS | {"bulk_insert"})
+    client.bulk_insert("test_collection", documents=[{"_id": "1"}])
+    assert len(adapter.requests) == 2
+
+
+def test_read_post_endpoints_are_retried():
+    client, adapter = scripted_client([502, 200], max_retries=3)
+    client.advanced_search("test_collection", multivector_query={})
+    assert len(adapter.requests) == 2
+
+
+def test_deadline_stops_retries():
+    client, adapter = scripted_client([(429, {"Retry-After": "10"}), 200],
+        max_retries=3, max_backoff=10, deadline=1)
+    with pytest.raises(APIError):
+        client.collection_stats("test_collection")
+    assert len(adapter.requests) == 1
+
+
+def test_backoff_honors_retry_after():
+    policy = RetryPolicy(max_backoff=30)
+    assert policy.get_backoff(0, {"Retry-After": "7"}) == 7
+    assert policy.get_backoff(0, {"Retry-After": "120"}) == 120
+
+
+def test_default_policy_waits_the_full_retry_after():
+    policy = RetryPolicy()
+    assert policy.get_backoff(0, {"Retry-After": "30"}) == 30
+    assert policy.get_backoff(0) <= policy.max_backoff
+
+
+def test_backoff_is_exponential():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=100, jitter=False)
+    assert [policy.get_backoff(i) for i in range(4)] == [1, 2, 4, 8]
+    policy = RetryPolicy(backoff_factor=1, max_backoff=100, jitter=True)
+    assert all(0 <= policy.get_backoff(3) <= 8 for _ in range(20))
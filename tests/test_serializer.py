@@ -0,0 +1,86 @@
+"""Testing the JSON serializers used for request bodies.
+"""
+import json
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from vectorai.api.session import ViSession
+from vectorai.api.serializer import get_serializer, JSONSerializer, orjson
+
+SERIALIZERS = ["json"] + (["orjson"] if orjson is not None else [])
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+def test_serialize_numpy_and_timestamps(name):
+    serializer = get_serializer(name)
+    document = {
+        "_id": "1",
+        "color_vector_": np.array([0.5, 0.25], dtype=np.float32),
+        "size_vector_": np.arange(6, dtype=np.float64).reshape(2, 3)[:, 0],
+        "count": np.int64(3),
+        "score": np.float32(1.5),
+        "created": pd.Timestamp("2020-01-01"),
+        "tags": np.array(["a", "b"]),
+    }
+    assert json.loads(serializer.dumps(document)) == {
+        "_id": "1",
+        "color_vector_": [0.5, 0.25],
+        "size_vector_": [0.0, 3.0],
+        "count": 3,
+        "score": 1.5,
+        "created": "2020-01-01T00:00:00",
+        "tags": ["a", "b"],
+    }
+
+
+def test_unknown_serializer():
+    with pytest.raises(ValueError):
+        get_serializer("pickle")
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+def test_session_serializes_numpy_documents(name):
+    session = ViSession(serializer=get_serializer(name))
+    request = requests.Request("POST", "http://localhost/collection/bulk_insert",
+        json={"documents": [{"_id": "1", "color_vector_": np.array([0.5, 0.25])}]})
+    prepared = session.prepare_request(request)
+    assert prepared.headers["Content-Type"] == "application/json"
+    assert json.loads(prepared.body)["documents"][0]["color_vector_"] == [0.5, 0.25]
+
+
+def test_json_serializer_rejects_nan():
+    with pytest.raises(ValueError):
+        JSONSerializer().dumps({"value": float("nan")})
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+@pytest.mark.parametrize("dtype", [np.float16, ">f4", "<f8", ">f8", ">i4"])
+def test_serialize_any_numpy_dtype(name, dtype):
+    vector = np.array([0.5, 1.0, -2.0], dtype=dtype)
+    assert json.loads(get_serializer(name).dumps({"vector": vector})) == {"vector": vector.tolist()}
+    assert json.loads(get_serializer(name).dumps([{"vectors": (vector, vector[::2])}])) == \
+        [{"vectors": [vector.tolist(), vector[::2].tolist()]}]
+    assert vector.tolist()[1:] == [1.0, -2.0]
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_orjson_serializes_native_arrays_itself():
+    vector = np.random.rand(768).astype(np.float32)
+    content = get_serializer("orjson").dumps({"vector": vector})
+    assert content == orjson.dumps({"vector": vector}, option=orjson.OPT_SERIALIZE_NUMPY)
+    np.testing.assert_array_equal(np.array(json.loads(content)["vector"], dtype=np.float32), vector)
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), np.float32("nan"),
+    np.array([0.5, np.nan]), [1.0, {"a": float("-inf")}]])
+def test_serializers_reject_non_finite_values(name, value):
+    with pytest.raises(ValueError):
+        get_serializer(name).dumps({"value": value})
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+def test_serializers_keep_none(name):
+    assert json.loads(get_serializer(name).dumps({"value": None, "vector": [0.5]})) == \
+        {"value": None, "vector": [0.5]}
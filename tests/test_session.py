@@ -0,0 +1,87 @@
+"""Testing the pooled session shared by client requests.
+"""
+import json
+import pickle
+import requests
+from requests.adapters import BaseAdapter
+from vectorai.client import ViClient, request_api_key
+from vectorai.api.session import ViSession
+from vectorai.models.deployed import ViText2Vec
+from vectorai.options import get_option, set_option
+
+
+class RecordingAdapter(BaseAdapter):
+    """Transport adapter that answers every request with an empty JSON list.
+    """
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps([]).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def test_session_is_reused():
+    client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+    assert isinstance(client.session, ViSession)
+    assert client.session is client.session
+
+
+def test_requests_go_through_session():
+    client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+    adapter = RecordingAdapter()
+    client.session.mount("http://", adapter)
+    client.list_collections()
+    client.collection_stats("test_collection")
+    assert len(adapter.requests) == 2
+    assert adapter.requests[0].url.startswith("http://localhost/project/list_collections")
+
+
+def test_request_api_key_goes_through_session():
+    client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+    adapter = RecordingAdapter()
+    client.session.mount("https://", adapter)
+    request_api_key(client, "me@example.com", "Testing")
+    assert len(adapter.requests) == 1
+    assert adapter.requests[0].url == "https://api.vctr.ai/project/request_api_key"
+
+
+def test_deployed_model_requests_go_through_session():
+    model = ViText2Vec("username", "api_key", url="http://localhost")
+    adapter = RecordingAdapter()
+    model.session.mount("http://", adapter)
+    model.encode("hello")
+    assert len(adapter.requests) == 1
+
+
+def test_pool_size_option():
+    original = get_option('http_pool_maxsize')
+    set_option('http_pool_maxsize', 3)
+    try:
+        session = ViSession()
+        assert session.get_adapter("https://api.vctr.ai")._pool_maxsize == 3
+    finally:
+        set_option('http_pool_maxsize', original)
+
+
+def test_pickled_client_opens_new_session():
+    client = ViClient("username", "api_key", url="http://localhost", verbose=False)
+    session = client.session
+    unpickled_client = pickle.loads(pickle.dumps(client))
+    assert unpickled_client.session is not session
+    assert unpickled_client.url == client.url
+
+
+def test_close_session():
+    with ViClient("username", "api_key", url="http://localhost", verbose=False) as client:
+        session = client.session
+    assert client.session is not session
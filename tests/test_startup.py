@@ -0,0 +1,30 @@
+"""Testing import time and login checks.
+"""
+import pickle
+import subprocess
+import sys
+import pytest
+from vectorai.client import ViClient
+from vectorai.errors import LoginError
+from vectorai.local_server import LocalViServer
+
+
+def test_import_does_not_load_optional_stacks():
+    code = ("import sys, vectorai; "
+        "print(','.join(m for m in ['pandas', 'plotly', 'IPython', 'aiohttp'] if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert loaded.strip() == ""
+
+
+def test_background_login_check():
+    with LocalViServer(username="username", api_key="api_key") as server:
+        vi_client = ViClient("username", "api_key", url=server.url, login_check="background")
+        assert vi_client.list_collections() == []
+        vi_client = ViClient("username", "wrong", url=server.url, login_check="background")
+        with pytest.raises(LoginError):
+            vi_client.list_collections()
+
+
+def test_background_login_client_can_be_pickled(local_server):
+    vi_client = ViClient("username", "api_key", url=local_server.url, login_check="background")
+    assert pickle.loads(pickle.dumps(vi_client)).username == "username"
@@ -0,0 +1,74 @@
+"""Testing the binary vector wire encoding.
+"""
+import json
+import numpy as np
+import pytest
+import requests
+from vectorai.api.session import ViSession
+from vectorai.api.utils import return_response
+from vectorai.api.wire import (encode_vector, decode_vector, encode_vectors, decode_vectors,
+    VECTOR_ENCODING_HEADER, ACCEPT_VECTOR_ENCODING_HEADER)
+
+
+@pytest.mark.parametrize("encoding,decimal", [("float32", 6), ("float16", 2)])
+def test_vector_round_trip(encoding, decimal):
+    vector = np.random.rand(768)
+    decoded = decode_vector(encode_vector(vector, encoding), encoding)
+    assert decoded.dtype == np.float32
+    np.testing.assert_almost_equal(decoded, vector, decimal=decimal)
+
+
+def test_float32_encoding_is_smaller_than_json():
+    vector = np.random.rand(768).tolist()
+    assert len(encode_vector(vector)) * 3 < len(json.dumps(vector))
+
+
+def test_encode_vectors_only_touches_vector_fields():
+    documents = [{
+        "_id": "1",
+        "color_vector_": [0.1, 0.2],
+        "color": "red",
+        "numbers": [1, 2, 3],
+        "chunk": [{"color_chunkvector_": np.array([0.3, 0.4])}]
+    }]
+    query = {"color": {"vector": [0.1, 0.2], "fields": ["color_vector_"]}}
+    encoded = encode_vectors({"documents": documents, "multivector_query": query})
+    assert isinstance(encoded["documents"][0]["color_vector_"], str)
+    assert isinstance(encoded["documents"][0]["chunk"][0]["color_chunkvector_"], str)
+    assert encoded["documents"][0]["numbers"] == [1, 2, 3]
+    assert isinstance(encoded["multivector_query"]["color"]["vector"], str)
+    assert encoded["multivector_query"]["color"]["fields"] == ["color_vector_"]
+    # The original documents are not modified
+    assert documents[0]["color_vector_"] == [0.1, 0.2]
+    decoded = decode_vectors(encoded)
+    np.testing.assert_almost_equal(decoded["documents"][0]["color_vector_"], [0.1, 0.2])
+
+
+def test_session_encodes_request_vectors():
+    session = ViSession(vector_encoding="float32")
+    request = requests.Request("POST", "http://localhost/collection/bulk_insert",
+        json={"documents": [{"_id": "1", "color_vector_": [0.5, 0.25]}]})
+    prepared = session.prepare_request(request)
+    assert prepared.headers[VECTOR_ENCODING_HEADER] == "float32"
+    assert prepared.headers[ACCEPT_VECTOR_ENCODING_HEADER] == "float32"
+    body = json.loads(prepared.body)
+    assert body["documents"][0]["color_vector_"] == encode_vector([0.5, 0.25])
+
+
+def test_session_does_not_encode_by_default():
+    session = ViSession()
+    request = requests.Request("POST", "http://localhost/collection/bulk_insert",
+        json={"documents": [{"_id": "1", "color_vector_": [0.5, 0.25]}]})
+    prepared = session.prepare_request(request)
+    assert VECTOR_ENCODING_HEADER not in prepared.headers
+    assert json.loads(prepared.body)["documents"][0]["color_vector_"] == [0.5, 0.25]
+
+
+def test_response_vectors_are_decoded():
+    response = requests.Response()
+    response.status_code = 200
+    response.headers[VECTOR_ENCODING_HEADER] = "float16"
+    response._content = json.dumps({"documents": [
+        {"_id": "1", "color_vector_": encode_vector([0.5, 0.25], "float16")}]}).encode()
+    documents = return_response(response)["documents"]
+    np.testing.assert_almost_equal(documents[0]["color_vector_"], [0.5, 0.25])
@@ -1,3 +1,16 @@
+def route_requests_through_session(filename):
+    """
+    Rewrite the generated client so every request goes through the client's
+    pooled session instead of opening a new connection with the requests module.
+    """
+    with open(filename) as f:
+        source = f.read()
+    source = source.replace("class _ViAPIClient:", "class _ViAPIClient(ViSessionMixin):")
+    source = source.replace("return requests.post(", "return self.session.post(")
+    source = source.replace("return requests.get(", "return self.session.get(")
+    with open(filename, "w") as f:
+        f.write(source)
+
 if __name__=="__main__":
     import os
     from openapi_to_sdk.sdk_automation import PythonSDKBuilder
@@ -32,9 +45,10 @@ if __name__=="__main__":
     sdk.to_python_file(
         class_name="_ViAPIClient",
         filename='vectorai/api/api.py',
-        import_strings=['import requests', 'from vectorai.api.utils import retry, return_curl_or_response'],
+        import_strings=['from vectorai.api.session import ViSessionMixin', 'from vectorai.api.utils import retry, return_curl_or_response'],
         include_response_parsing=False,
     )
+    route_requests_through_session('vectorai/api/api.py')
 
     from vectorai.api.api import _ViAPIClient
     vi = _ViAPIClient(os.environ['VI_USERNAME'], os.environ['VI_API_KEY'], url=url)
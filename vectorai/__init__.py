@@ -6,3 +6,4 @@ from .api import *
 from .client import *
 from .read import *
 from .write import *
+from .async_client import *
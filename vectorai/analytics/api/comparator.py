@@ -1,8 +1,8 @@
-import requests
+from ...api.session import ViSessionMixin
 from typing import List, Dict, Optional
 from ...api.utils import retry, return_curl_or_response
 
-class ComparatorAPI:
+class ComparatorAPI(ViSessionMixin):
     def __init__(self, username: str=None, api_key: str=None, 
     url: str = "https://api.vctr.ai", analytics_url="https://vector-analytics.vctr.ai"):
         self.username = username
@@ -60,6 +60,6 @@ class ComparatorAPI:
             "colors": colors,
         }
         params.update(kwargs)
-        return requests.post(
+        return self.session.post(
             url= f"{self.analytics_url}/comparator/compare_ranks/",
             json=params)
@@ -1,7 +1,6 @@
 """Vi Dimensionality Reduction
 """
 import numpy as np
-import pandas as pd
 from typing import List, Dict, Any
 from ..write import ViWriteClient
 
@@ -1,7 +1,6 @@
 """
 The Table Mixin 
 """
-import pandas as pd
 from typing import List
 from ..utils import get_random_int
 from ..errors import APIError
@@ -49,4 +48,5 @@ class TableMixin:
         for f in vector_fields:
             values[f] = self._return_vector_search_results(collection_name=collection_name, vector_field=f, 
         id_value=id_value, label=label, num_rows=num_rows)
+        import pandas as pd
         return pd.DataFrame.from_dict(values)
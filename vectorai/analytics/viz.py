@@ -1,18 +1,17 @@
 """
 Plotting functions of Vi go here. 
 """
-import plotly.express as px
-import plotly.graph_objects as go
 import copy
 import random
-from typing import Union, List, Dict, Any
-from plotly.subplots import make_subplots
-from tqdm.notebook import tqdm
+from typing import Union, List, Dict, Any, TYPE_CHECKING
 from .score import ViScore
 from .utils import ViAnalyticsUtils, MeanDict
 from ..read import ViReadClient
 from ..errors import APIError
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 class VizMixin(ViScore, ViAnalyticsUtils):
     """
     Visualisation submodule for the library.
@@ -46,6 +45,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
             go.Scatter: Scatter plot of centroids.
 
         """
+        import plotly.graph_objects as go
         return go.Scatter(
             x=[
                 self.get_field(dim_reduction_field, x)[0]
@@ -108,6 +108,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
             self.get_field(point_label, x)
             for x in cluster_centroid_documents.values()
         ]
+        import plotly.graph_objects as go
         return go.Scatter(
             x=x,
             y=y,
@@ -171,6 +172,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                     alias=alias)
         
         """
+        import plotly.graph_objects as go
         fig = go.Figure()
         if include_centroids:
             if not isinstance(collection, str):
@@ -219,7 +221,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                 )
             )
         else:
-            for title in tqdm(cluster_titles):
+            for title in self.progress_bar(cluster_titles):
                 filtered_collection = [
                     x
                     for x in collection
@@ -297,6 +299,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
         import math
         if num_cols is None:
             num_cols = len(vector_fields)
+        from plotly.subplots import make_subplots
         fig = make_subplots(rows=int(len(vector_fields) / num_cols) + 1, cols=num_cols, 
         subplot_titles=vector_fields)
         row_num = 1
@@ -328,7 +331,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
         label: str,
         anchor_document: dict=None,
         anchor_index: Union[str, int]=0,
-        orientation="h") -> go.Bar:
+        orientation="h") -> 'go.Bar':
             """
             Compare 1 document against other documents.
 
@@ -356,7 +359,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                         alias=alias)
             
             """
-            
+            import plotly.graph_objects as go
             try:
                 scores = self.get_cosine_similarity_scores(
                     documents, anchor_document, vector_field=vector_field
@@ -506,6 +509,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
             len(anchor_documents) == 2
         ), "You need 2 anchor documents for a 2d cosine similarity plot."
 
+        import plotly.graph_objects as go
         fig = go.FigureWidget()
         
         if len(vector_fields) > len(marker_colors):
@@ -580,6 +584,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                 spokes: The outside labels 
                 name: The name of the plot
         """
+        import plotly.graph_objects as go
         return go.Scatterpolar(
             # Get the cosine similarity scores here 
             r=scores + [scores[0]],
@@ -599,6 +604,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                 label_field: The field of the documents to get labels.
         """
         categories = self.get_field_across_documents(label_field, docs)
+        import plotly.graph_objects as go
         fig = go.Figure()
         for anchor_document in anchor_documents:
             if scoring_metric == 'cosine':
@@ -628,6 +634,7 @@ class VizMixin(ViScore, ViAnalyticsUtils):
                 label_field: The field of the documents to get labels.
         """
         categories = self.get_field_across_documents(label_field, docs)
+        import plotly.graph_objects as go
         fig = go.Figure()
         for vector in vector_fields:
             if scoring_metric == 'cosine':
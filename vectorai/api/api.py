@@ -1,10 +1,9 @@
 # This python file is auto-generated. Please do not edit.
-import requests
-import requests
+from vectorai.api.session import ViSessionMixin
 from vectorai.api.utils import retry, return_curl_or_response
 
 
-class _ViAPIClient:
+class _ViAPIClient(ViSessionMixin):
 	def __init__(self, username, api_key, url, ):
 		self.username = username		
 		self.api_key = api_key		
@@ -24,7 +23,7 @@ description: Description of your intended use case
 referral_code: The referral code you've been given to allow you to register for an api key before others
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/request_api_key',
 			json=dict(
 				username=self.username,
@@ -36,7 +35,7 @@ referral_code: The referral code you've been given to allow you to register for
 	@retry()
 	@return_curl_or_response('json')
 	def list_jobs(self,show_active_only=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/list_jobs',
 			params=dict(
 				show_active_only=show_active_only, 
@@ -57,7 +56,7 @@ api_key: Api Key, you can request it from request_api_key
 read_username: Username for read only key
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/request_read_api_key',
 			json=dict(
 				username=self.username,
@@ -89,7 +88,7 @@ collection_name: Name of Collection
 collection_schema: Schema for specifying the field that are vectors and its length
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/create_collection',
 			json=dict(
 				username=self.username,
@@ -112,7 +111,7 @@ collection_name: Name of Collection
 document: A Document is a JSON-like data that we store our metadata and vectors with. For specifying id of the document use the field '\_id', for specifying vector field use the suffix of '\_vector\_'
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/create_collection_from_document',
 			json=dict(
 				username=self.username,
@@ -124,7 +123,7 @@ document: A Document is a JSON-like data that we store our metadata and vectors
 	@retry()
 	@return_curl_or_response('json')
 	def _delete_collection(self,collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/delete_collection',
 			params=dict(
 				username=self.username, 
@@ -135,7 +134,7 @@ document: A Document is a JSON-like data that we store our metadata and vectors
 	@retry()
 	@return_curl_or_response('json')
 	def _list_collections(self,sort_by_created_at_date=False, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/list_collections',
 			params=dict(
 				username=self.username, 
@@ -159,7 +158,7 @@ sort_by_created_at_date: Sort by created at date. By default shows the newest co
 asc: Sort by created at date. By default shows the newest collections. Set reverse=False to get oldest collection.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/search_collections',
 			json=dict(
 				username=self.username,
@@ -172,7 +171,7 @@ asc: Sort by created at date. By default shows the newest collections. Set rever
 	@retry()
 	@return_curl_or_response('json')
 	def list_collections_info(self,schema=True, stats=True, metadata=True, schema_stats=False, vector_health=False, active_jobs=False, collection_names=[], sort_by_created_at_date=False, asc=False, page_size=20, page=1, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/list_collections_info',
 			params=dict(
 				username=self.username, 
@@ -193,7 +192,7 @@ asc: Sort by created at date. By default shows the newest collections. Set rever
 	@retry()
 	@return_curl_or_response('json')
 	def collection_stats(self,collection_name, seperate_chunks=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/collection_stats',
 			params=dict(
 				seperate_chunks=seperate_chunks, 
@@ -205,7 +204,7 @@ asc: Sort by created at date. By default shows the newest collections. Set rever
 	@retry()
 	@return_curl_or_response('json')
 	def collection_schema(self,collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/collection_schema',
 			params=dict(
 				username=self.username, 
@@ -216,7 +215,7 @@ asc: Sort by created at date. By default shows the newest collections. Set rever
 	@retry()
 	@return_curl_or_response('json')
 	def collection_schema_stats(self,collection_name, include_zero_vectors=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/collection_schema_stats',
 			params=dict(
 				username=self.username, 
@@ -228,7 +227,7 @@ asc: Sort by created at date. By default shows the newest collections. Set rever
 	@retry()
 	@return_curl_or_response('json')
 	def collection_vector_health(self,collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/collection_vector_health',
 			params=dict(
 				username=self.username, 
@@ -250,7 +249,7 @@ collection_name: Name of Collection
 metadata: Metadata for a collection, e.g. {'description' : 'collection for searching products'}
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/add_collection_metadata',
 			json=dict(
 				username=self.username,
@@ -262,7 +261,7 @@ metadata: Metadata for a collection, e.g. {'description' : 'collection for searc
 	@retry()
 	@return_curl_or_response('json')
 	def collection_metadata(self,collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/collection_metadata',
 			params=dict(
 				username=self.username, 
@@ -287,7 +286,7 @@ rename_fields: Fields to rename {'old_field': 'new_field'}. Defaults to no renam
 remove_fields: Fields to remove ['random_field', 'another_random_field']. Defaults to no removes
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/copy_collection',
 			json=dict(
 				username=self.username,
@@ -302,7 +301,7 @@ remove_fields: Fields to remove ['random_field', 'another_random_field']. Defaul
 	@retry()
 	@return_curl_or_response('json')
 	def job_status(self,job_id, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/project/job/job_status',
 			params=dict(
 				job_id=job_id, 
@@ -331,7 +330,7 @@ quick: This will run the quickest insertion possible, which means there will be
 pipeline: This will run pipelines for the insert. example: pipeline=["encoders"]
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/insert',
 			json=dict(
 				username=self.username,
@@ -386,7 +385,7 @@ quick: This will run the quickest insertion possible, which means there will be
 store_to_pipeline: Whether to store the encoders to pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/insert_and_encode',
 			json=dict(
 				username=self.username,
@@ -422,7 +421,7 @@ quick: This will run the quickest insertion possible, which means there will be
 pipeline: This will run pipelines for the insert. example: pipeline=["encoders"]
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_insert',
 			json=dict(
 				username=self.username,
@@ -473,7 +472,7 @@ quick: This will run the quickest insertion possible, which means there will be
 store_to_pipeline: Whether to store the encoders to pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_insert_and_encode',
 			json=dict(
 				username=self.username,
@@ -514,7 +513,7 @@ encoders: An array structure of models to encode fields with.
 collection_name: Name of Collection
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/store_encoders_pipeline',
 			json=dict(
 				username=self.username,
@@ -536,7 +535,7 @@ collection_name: Name of Collection
 vector_fields: Vector fields that identifies an encoder to remove from pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/remove_encoder_from_pipeline',
 			json=dict(
 				username=self.username,
@@ -548,7 +547,7 @@ vector_fields: Vector fields that identifies an encoder to remove from pipeline
 	@retry()
 	@return_curl_or_response('json')
 	def delete_by_id(self,document_id, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/delete_by_id',
 			params=dict(
 				document_id=document_id, 
@@ -571,7 +570,7 @@ collection_name: Name of Collection
 document_ids: IDs of documents
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_delete_by_id',
 			json=dict(
 				username=self.username,
@@ -596,7 +595,7 @@ edits: A dictionary to edit and add fields to a document.
 insert_date: Whether to include insert date as a field 'insert_date_'.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/edit_document',
 			json=dict(
 				username=self.username,
@@ -622,7 +621,7 @@ documents: A list of documents. Document is a JSON-like data that we store our m
 insert_date: Whether to include insert date as a field 'insert_date_'.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_edit_document',
 			json=dict(
 				username=self.username,
@@ -635,7 +634,7 @@ insert_date: Whether to include insert date as a field 'insert_date_'.
 	@retry()
 	@return_curl_or_response('json')
 	def delete_document_fields(self,document_id, fields_to_delete, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/delete_document_fields',
 			params=dict(
 				document_id=document_id, 
@@ -660,7 +659,7 @@ updates: Updates to make to the documents. It should be specified in a format of
 filters: Query for filtering the search results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/update_by_filters',
 			json=dict(
 				username=self.username,
@@ -684,7 +683,7 @@ collection_name: Name of Collection
 filters: Query for filtering the search results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/delete_by_filters',
 			json=dict(
 				username=self.username,
@@ -708,7 +707,7 @@ search_history_id: Search history ID of the collection.
 edits: A dictionary to edit and add fields to a document.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/edit_search_history',
 			json=dict(
 				username=self.username,
@@ -721,7 +720,7 @@ edits: A dictionary to edit and add fields to a document.
 	@retry()
 	@return_curl_or_response('json')
 	def id(self,document_id, collection_name, include_vector=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/id',
 			params=dict(
 				document_id=document_id, 
@@ -734,7 +733,7 @@ edits: A dictionary to edit and add fields to a document.
 	@retry()
 	@return_curl_or_response('json')
 	def bulk_id(self,document_ids, collection_name, include_vector=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/bulk_id',
 			params=dict(
 				document_ids=document_ids, 
@@ -758,7 +757,7 @@ collection_name: Name of Collection
 document_ids: IDs of documents
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_missing_id',
 			json=dict(
 				username=self.username,
@@ -770,7 +769,7 @@ document_ids: IDs of documents
 	@retry()
 	@return_curl_or_response('json')
 	def retrieve_documents(self,collection_name, include_fields=[], cursor=None, page_size=20, sort=[], asc=False, include_vector=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/retrieve_documents',
 			params=dict(
 				include_fields=include_fields, 
@@ -787,7 +786,7 @@ document_ids: IDs of documents
 	@retry()
 	@return_curl_or_response('json')
 	def random_documents(self,collection_name, seed=10, include_fields=[], page_size=20, include_vector=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/random_documents',
 			params=dict(
 				seed=seed, 
@@ -820,7 +819,7 @@ include_vector: Include vectors in the search results
 filters: Query for filtering the search results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/retrieve_documents_with_filters',
 			json=dict(
 				username=self.username,
@@ -853,7 +852,7 @@ include_vector: Include vectors in the search results
 filters: Query for filtering the search results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/random_documents_with_filters',
 			json=dict(
 				username=self.username,
@@ -881,7 +880,7 @@ docs_to_compare: Other documents to compare against the main document.
 difference_fields: Fields to compare. Defaults to [], which compares all fields.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/compare_documents',
 			json=dict(
 				username=self.username,
@@ -894,7 +893,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def retrieve_search_history(self,**kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/retrieve_search_history',
 			params=dict(
 				))
@@ -902,7 +901,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def id_search_history(self,**kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/id_search_history',
 			params=dict(
 				))
@@ -910,7 +909,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def _search(self,vector, collection_name, search_fields, search_history_id, approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, asc=False, keep_search_history=True, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search',
 			params=dict(
 				vector=vector, 
@@ -938,7 +937,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def search_by_id(self,document_id, collection_name, search_field, approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search_by_id',
 			params=dict(
 				document_id=document_id, 
@@ -964,7 +963,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def search_by_ids(self,document_ids, collection_name, search_field, vector_operation="sum", approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search_by_ids',
 			params=dict(
 				document_ids=document_ids, 
@@ -991,7 +990,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def search_by_positive_negative_ids(self,positive_document_ids, negative_document_ids, collection_name, search_field, vector_operation="sum", approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search_by_positive_negative_ids',
 			params=dict(
 				positive_document_ids=positive_document_ids, 
@@ -1019,7 +1018,7 @@ difference_fields: Fields to compare. Defaults to [], which compares all fields.
 	@retry()
 	@return_curl_or_response('json')
 	def search_with_positive_negative_ids_as_history(self,vector, positive_document_ids, negative_document_ids, collection_name, search_field, vector_operation="sum", approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search_with_positive_negative_ids_as_history',
 			params=dict(
 				vector=vector, 
@@ -1076,7 +1075,7 @@ encoders: An array structure of models to encode fields with.
 document: A json document to encode.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/encode',
 			json=dict(
 				username=self.username,
@@ -1118,7 +1117,7 @@ encoders: An array structure of models to encode fields with.
 documents: Json documents to encode.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/bulk_encode',
 			json=dict(
 				username=self.username,
@@ -1147,7 +1146,7 @@ impute_value: What value to fill if target field is missing.
 predict_operation: How to predict using the vectors.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/predict_knn_regression',
 			json=dict(
 				username=self.username,
@@ -1178,7 +1177,7 @@ impute_value: The impute value
 predict_operation: How to predict using the vectors.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/predict_knn_regression_from_results',
 			json=dict(
 				username=self.username,
@@ -1193,7 +1192,7 @@ predict_operation: How to predict using the vectors.
 	@retry()
 	@return_curl_or_response('json')
 	def facets(self,collection_name, facets_fields=[], date_interval="monthly", page_size=1000, page=1, asc=False, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/facets',
 			params=dict(
 				facets_fields=facets_fields, 
@@ -1255,7 +1254,7 @@ include_vector: Include vectors in the search results
 sort: Fields to sort by
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/filters',
 			json=dict(
 				username=self.username,
@@ -1307,7 +1306,7 @@ keep_search_history: Whether to store the history of search or not
 multivector_query: Query for advance search that allows for multiple vector and field querying
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search',
 			json=dict(
 				username=self.username,
@@ -1372,7 +1371,7 @@ document_id: ID of a document
 search_fields: Vector fields to search against, and the weightings for them.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search_by_id',
 			json=dict(
 				username=self.username,
@@ -1441,7 +1440,7 @@ search_fields: Vector fields to search against, and the weightings for them.
 vector_operation: Aggregation for the vectors, choose from ['mean', 'sum', 'min', 'max']
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search_by_ids',
 			json=dict(
 				username=self.username,
@@ -1512,7 +1511,7 @@ search_fields: Vector fields to search against, and the weightings for them.
 vector_operation: Aggregation for the vectors, choose from ['mean', 'sum', 'min', 'max']
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search_by_positive_negative_ids',
 			json=dict(
 				username=self.username,
@@ -1582,7 +1581,7 @@ negative_document_ids: Negative Document IDs to get recommendations for, and the
 vector_operation: Aggregation for the vectors, choose from ['mean', 'sum', 'min', 'max']
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search_with_positive_negative_ids_as_history',
 			json=dict(
 				username=self.username,
@@ -1661,7 +1660,7 @@ asc: Whether to sort results by ascending or descending order
 flatten: 
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/aggregate',
 			json=dict(
 				username=self.username,
@@ -1694,7 +1693,7 @@ asc: Whether to sort results by ascending or descending order
 flatten: 
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/aggregate_fetch',
 			json=dict(
 				username=self.username,
@@ -1711,7 +1710,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def traditional_search(self,collection_name, text, text_fields, search_history_id, fuzzy=-1, join=True, page_size=20, page=1, include_fields=[], include_vector=False, include_count=True, asc=False, keep_search_history=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/traditional_search',
 			params=dict(
 				username=self.username, 
@@ -1734,7 +1733,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def hybrid_search(self,text, vector, text_fields, collection_name, search_fields, search_history_id, traditional_weight=0.075, fuzzy=-1, join=True, approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, asc=False, keep_search_history=True, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/hybrid_search',
 			params=dict(
 				text=text, 
@@ -1805,7 +1804,7 @@ fuzzy: Fuzziness of the search. A value of 1-3 is good. For automated fuzzines u
 join: Whether to consider cases where there is a space in the word. E.g. Go Pro vs GoPro.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_hybrid_search',
 			json=dict(
 				username=self.username,
@@ -1839,7 +1838,7 @@ join: Whether to consider cases where there is a space in the word. E.g. Go Pro
 	@retry()
 	@return_curl_or_response('json')
 	def job_status(self,job_id, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/job/job_status',
 			params=dict(
 				job_id=job_id, 
@@ -1851,7 +1850,7 @@ join: Whether to consider cases where there is a space in the word. E.g. Go Pro
 	@retry()
 	@return_curl_or_response('json')
 	def list_collection_jobs(self,collection_name, show_active_only=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/job/list_collection_jobs',
 			params=dict(
 				show_active_only=show_active_only, 
@@ -1878,7 +1877,7 @@ refresh: If True, overwrite all encoded vectors, otherwise it just encodes the f
 store_to_pipeline: Whether to store the encoder to the encoders pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/encode_image_field',
 			json=dict(
 				username=self.username,
@@ -1909,7 +1908,7 @@ refresh: If True, overwrite all encoded vectors, otherwise it just encodes the f
 store_to_pipeline: Whether to store the encoder to the encoders pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/encode_text_field',
 			json=dict(
 				username=self.username,
@@ -1943,7 +1942,7 @@ refresh: If True, overwrite all labelled clusters, otherwise it just labels the
 store_to_pipeline: Whether to store the cluster model to the clusters pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/advanced_cluster',
 			json=dict(
 				username=self.username,
@@ -1979,7 +1978,7 @@ refresh: If True, overwrite all labelled dimensionality reduced fields, otherwis
 store_to_pipeline: Whether to store the dimensionality reduction model to the dimensionality reductions pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/dimensionality_reduction',
 			json=dict(
 				username=self.username,
@@ -2019,7 +2018,7 @@ hub_api_key: The API key of the hub account.
 store_to_pipeline: Whether to store the encoders to pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/tag_vector_job',
 			json=dict(
 				username=self.username,
@@ -2066,7 +2065,7 @@ hub_api_key: The API key of the hub account.
 store_to_pipeline: Whether to store the encoders to pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/tag_job',
 			json=dict(
 				username=self.username,
@@ -2106,7 +2105,7 @@ insert_results_to_seperate_collection_name: If specified the chunks will be inse
 store_to_pipeline: Whether to store the encoder to the chunking pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/text_chunking',
 			json=dict(
 				username=self.username,
@@ -2139,7 +2138,7 @@ insert_results_to_seperate_collection_name: If specified the chunks will be inse
 store_to_pipeline: Whether to store the encoder to the chunking pipeline
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/text_chunking_encoder',
 			json=dict(
 				username=self.username,
@@ -2168,7 +2167,7 @@ file_url: The file url blob
 filename: The name of the PDF file.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/process_pdf',
 			json=dict(
 				username=self.username,
@@ -2193,7 +2192,7 @@ file_url: The file url blob
 filename: The name of the Doc or DocX file
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/job/process_doc',
 			json=dict(
 				username=self.username,
@@ -2218,7 +2217,7 @@ source_username: Source username of whom the collection belongs to
 source_api_key: Api key to access the source username
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/project/copy_collection_from_another_user',
 			json=dict(
 				collection_name=collection_name, 
@@ -2263,7 +2262,7 @@ chunk_page: Page of the chunk results
 chunk_page_size: Size of each page of chunk results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/chunk_search',
 			json=dict(
 				username=self.username,
@@ -2324,7 +2323,7 @@ chunk_page: Page of the chunk results
 chunk_page_size: Size of each page of chunk results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_chunk_search',
 			json=dict(
 				username=self.username,
@@ -2382,7 +2381,7 @@ first_step_page: Page of the results
 first_step_page_size: Size of each page of results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_multistep_chunk_search',
 			json=dict(
 				username=self.username,
@@ -2423,7 +2422,7 @@ join_query: Join query
 doc_id: ID of a Document
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/id_lookup_joined',
 			json=dict(
 				username=self.username,
@@ -2446,7 +2445,7 @@ join_query: Join query
 joined_collection_name: Name of the new collection that contains the joined results
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/join_collections',
 			json=dict(
 				username=self.username,
@@ -2476,7 +2475,7 @@ refresh_time: How often should the aggregation check for new data
 start_immediately: Whether to start the published aggregation immediately
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/publish_aggregation',
 			json=dict(
 				username=self.username,
@@ -2494,7 +2493,7 @@ start_immediately: Whether to start the published aggregation immediately
 	@retry()
 	@return_curl_or_response('json')
 	def delete_published_aggregation(self,aggregation_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/delete_published_aggregation',
 			params=dict(
 				aggregation_name=aggregation_name, 
@@ -2505,7 +2504,7 @@ start_immediately: Whether to start the published aggregation immediately
 	@retry()
 	@return_curl_or_response('json')
 	def start_aggregation(self,aggregation_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/start_aggregation',
 			params=dict(
 				aggregation_name=aggregation_name, 
@@ -2516,7 +2515,7 @@ start_immediately: Whether to start the published aggregation immediately
 	@retry()
 	@return_curl_or_response('json')
 	def stop_aggregation(self,aggregation_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/stop_aggregation',
 			params=dict(
 				aggregation_name=aggregation_name, 
@@ -2542,7 +2541,7 @@ aggregation_type: Aggregation for the vectors, choose from ['mean', 'sum', 'min'
 refresh: Whether to refresh the aggregation and recalculate the vectors for every single groupby
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/vector_aggregation',
 			json=dict(
 				username=self.username,
@@ -2558,7 +2557,7 @@ refresh: Whether to refresh the aggregation and recalculate the vectors for ever
 	@retry()
 	@return_curl_or_response('json')
 	def encode_array_field(self,array_fields, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_array_field',
 			params=dict(
 				array_fields=array_fields, 
@@ -2570,7 +2569,7 @@ refresh: Whether to refresh the aggregation and recalculate the vectors for ever
 	@retry()
 	@return_curl_or_response('json')
 	def encode_array(self,array_field, array, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_array',
 			params=dict(
 				array_field=array_field, 
@@ -2607,7 +2606,7 @@ collection_name: Name of Collection
 multiarray_query: List of array fields
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/encode_multiple_arrays',
 			json=dict(
 				username=self.username,
@@ -2619,7 +2618,7 @@ multiarray_query: List of array fields
 	@retry()
 	@return_curl_or_response('json')
 	def search_with_array(self,array_field, array, collection_name, search_fields, search_history_id, approx=0, sum_fields=True, page_size=20, page=1, metric="cosine", min_score=None, include_fields=[], include_vector=False, include_count=True, hundred_scale=False, asc=False, keep_search_history=True, include_search_relevance=False, search_relevance_cutoff_aggressiveness=1, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/search_with_array',
 			params=dict(
 				array_field=array_field, 
@@ -2648,7 +2647,7 @@ multiarray_query: List of array fields
 	@retry()
 	@return_curl_or_response('json')
 	def encode_dictionary_field(self,dictionary_fields, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_dictionary_field',
 			params=dict(
 				dictionary_fields=dictionary_fields, 
@@ -2682,7 +2681,7 @@ dictionary: A dictionary to encode into vectors
 dictionary_field: The dictionary field that encoding of the dictionary is trained on
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/encode_dictionary',
 			json=dict(
 				username=self.username,
@@ -2737,7 +2736,7 @@ dictionary: A dictionary to encode into vectors
 dictionary_field: The dictionary field that encoding of the dictionary is trained on
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_dictionary',
 			json=dict(
 				username=self.username,
@@ -2792,7 +2791,7 @@ vector_name: The name of the vector that the fields turn into
 selected_fields: The fields to turn into vectors
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/encode_fields_to_vector',
 			json=dict(
 				username=self.username,
@@ -2827,7 +2826,7 @@ document: A document to encode into vectors
 vector_name: The name of the vector that the fields turn into
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/encode_fields',
 			json=dict(
 				username=self.username,
@@ -2882,7 +2881,7 @@ selected_fields: The fields to turn into vectors
 vector_name: A name to call the vector that the fields turn into
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_fields',
 			json=dict(
 				username=self.username,
@@ -2910,7 +2909,7 @@ vector_name: A name to call the vector that the fields turn into
 	@retry()
 	@return_curl_or_response('json')
 	def combine_vectors(self,vector_fields, vector_name, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/combine_vectors',
 			params=dict(
 				vector_fields=vector_fields, 
@@ -2923,7 +2922,7 @@ vector_name: A name to call the vector that the fields turn into
 	@retry()
 	@return_curl_or_response('json')
 	def collection_vector_mappings(self,collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/collection_vector_mappings',
 			params=dict(
 				username=self.username, 
@@ -2934,7 +2933,7 @@ vector_name: A name to call the vector that the fields turn into
 	@retry()
 	@return_curl_or_response('json')
 	def cluster(self,vector_field, collection_name, n_clusters=0, gpu=True, refresh=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/cluster',
 			params=dict(
 				vector_field=vector_field, 
@@ -2967,7 +2966,7 @@ asc: Whether to sort results by ascending or descending order
 flatten: 
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/cluster_aggregate',
 			json=dict(
 				username=self.username,
@@ -2984,7 +2983,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def cluster_facets(self,collection_name, facets_fields=[], page_size=1000, page=1, asc=False, date_interval="monthly", **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/cluster_facets',
 			params=dict(
 				facets_fields=facets_fields, 
@@ -3000,7 +2999,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def cluster_centroids(self,vector_field, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/cluster_centroids',
 			params=dict(
 				vector_field=vector_field, 
@@ -3012,7 +3011,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def cluster_centroid_documents(self,vector_field, collection_name, metric="cosine", include_vector=False, page=1, page_size=20, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/cluster_centroid_documents',
 			params=dict(
 				vector_field=vector_field, 
@@ -3028,7 +3027,7 @@ flatten:
 	@retry()
 	@return_curl_or_response('json')
 	def advanced_cluster(self,vector_field, collection_name, alias="default", n_clusters=0, n_iter=10, n_init=5, gpu=True, refresh=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/advanced_cluster',
 			params=dict(
 				vector_field=vector_field, 
@@ -3066,7 +3065,7 @@ vector_field: Clustered vector field
 alias: Alias of a cluster
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_cluster_aggregate',
 			json=dict(
 				username=self.username,
@@ -3085,7 +3084,7 @@ alias: Alias of a cluster
 	@retry()
 	@return_curl_or_response('json')
 	def advanced_cluster_facets(self,vector_field, collection_name, alias="default", facets_fields=[], page_size=1000, page=1, asc=False, date_interval="monthly", **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/advanced_cluster_facets',
 			params=dict(
 				vector_field=vector_field, 
@@ -3103,7 +3102,7 @@ alias: Alias of a cluster
 	@retry()
 	@return_curl_or_response('json')
 	def advanced_cluster_centroids(self,vector_field, collection_name, alias="default", **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/advanced_cluster_centroids',
 			params=dict(
 				vector_field=vector_field, 
@@ -3116,7 +3115,7 @@ alias: Alias of a cluster
 	@retry()
 	@return_curl_or_response('json')
 	def advanced_cluster_centroid_documents(self,vector_field, collection_name, alias="default", metric="cosine", include_vector=False, page=1, page_size=20, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/advanced_cluster_centroid_documents',
 			params=dict(
 				vector_field=vector_field, 
@@ -3163,7 +3162,7 @@ vector_field: Vector field to perform clustering on
 alias: Alias is used to name a cluster
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_cluster_search',
 			json=dict(
 				username=self.username,
@@ -3251,7 +3250,7 @@ n_iter: Number of iterations in each run
 return_as_clusters: If True, return as clusters as opposed to results list
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/advanced_search_post_cluster',
 			json=dict(
 				username=self.username,
@@ -3300,7 +3299,7 @@ job: Whether to run a job where each document is assigned a cluster from the clu
 job_metric: Similarity Metric, choose from ['cosine', 'l1', 'l2', 'dp']
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/insert_cluster_centroids',
 			json=dict(
 				username=self.username,
@@ -3332,7 +3331,7 @@ alias: Alias of the dimensionality reduced vectors
 n_components: The size/length to reduce the vector down to.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/dimensionality_reduce',
 			json=dict(
 				username=self.username,
@@ -3347,7 +3346,7 @@ n_components: The size/length to reduce the vector down to.
 	@retry()
 	@return_curl_or_response('json')
 	def encode_text_field(self,text_field, collection_name, refresh=True, alias="default", **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_text_field',
 			params=dict(
 				text_field=text_field, 
@@ -3361,7 +3360,7 @@ n_components: The size/length to reduce the vector down to.
 	@retry()
 	@return_curl_or_response('json')
 	def encode_text(self,text, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_text',
 			params=dict(
 				text=text, 
@@ -3373,7 +3372,7 @@ n_components: The size/length to reduce the vector down to.
 	@retry()
 	@return_curl_or_response('json')
 	def bulk_encode_text(self,texts, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/bulk_encode_text',
 			params=dict(
 				texts=texts, 
@@ -3426,7 +3425,7 @@ text: Text to encode into vector and vector search with
 search_fields: Vector fields to search against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_text',
 			json=dict(
 				username=self.username,
@@ -3456,7 +3455,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def encode_image_field(self,image_field, collection_name, alias="default", refresh=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_image_field',
 			params=dict(
 				image_field=image_field, 
@@ -3470,7 +3469,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def encode_image(self,image_url, model_url, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_image',
 			params=dict(
 				image_url=image_url, 
@@ -3483,7 +3482,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def bulk_encode_image(self,image_urls, model_url, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/bulk_encode_image',
 			params=dict(
 				image_urls=image_urls, 
@@ -3540,7 +3539,7 @@ model_url: The model url of a deployed vectorhub model
 search_fields: Vector fields to search against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_image',
 			json=dict(
 				username=self.username,
@@ -3615,7 +3614,7 @@ model_url: The model url of a deployed vectorhub model
 search_fields: Vector fields to search against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_image_upload',
 			json=dict(
 				username=self.username,
@@ -3646,7 +3645,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def encode_audio_field(self,audio_field, collection_name, refresh=True, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_audio_field',
 			params=dict(
 				audio_field=audio_field, 
@@ -3659,7 +3658,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def encode_audio(self,audio_url, model_url, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/encode_audio',
 			params=dict(
 				audio_url=audio_url, 
@@ -3672,7 +3671,7 @@ search_fields: Vector fields to search against
 	@retry()
 	@return_curl_or_response('json')
 	def bulk_encode_audio(self,audio_urls, collection_name, **kwargs):
-		return requests.get(
+		return self.session.get(
 			url=self.url+'/collection/bulk_encode_audio',
 			params=dict(
 				audio_urls=audio_urls, 
@@ -3728,7 +3727,7 @@ model_url: The model url of a deployed vectorhub model
 search_fields: Vector fields to search against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_audio',
 			json=dict(
 				username=self.username,
@@ -3802,7 +3801,7 @@ model_url: The model url of a deployed vectorhub model
 search_fields: Vector fields to search against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/search_with_audio_upload',
 			json=dict(
 				username=self.username,
@@ -3849,7 +3848,7 @@ insert_results_to_seperate_collection_name: If specified the chunks will be inse
 return_processed_documents: Whether to return the processed documents.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/text_chunking',
 			json=dict(
 				username=self.username,
@@ -3889,7 +3888,7 @@ search_relevance_cutoff_aggressiveness: How aggressive the search_relevance cuto
 asc: Whether to sort results by ascending or descending order
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/tag',
 			json=dict(
 				username=self.username,
@@ -3940,7 +3939,7 @@ n_iter: Number of iterations in each run
 n_init: Number of runs to run with different centroid seeds
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/post_cluster_tag',
 			json=dict(
 				username=self.username,
@@ -3989,7 +3988,7 @@ refresh: If True, retags the whole collection.
 return_tagged_documents: If True, returns the original documents with tags.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/tag_collection_from_vectors',
 			json=dict(
 				username=self.username,
@@ -4031,7 +4030,7 @@ include_tag_vector: Whether to include the one hot encoded tag vector.
 pad_vector_length: Whether to pad the vector length of the one hot encoded array.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/tag_documents',
 			json=dict(
 				username=self.username,
@@ -4070,7 +4069,7 @@ encode and then use a specific collection to get data.
     
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/store_taggers_pipeline',
 			json=dict(
 				username=self.username,
@@ -4103,7 +4102,7 @@ hub_username: The username of the hub for the tag.
 hub_api_key: The api key of the hub for the tag.
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/collection/tag_documents_from_hub',
 			json=dict(
 				username=self.username,
@@ -4137,7 +4136,7 @@ ranked_list_1: First ranked List
 ranked_list_2: Second ranked list
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/experimentation/rank_comparator',
 			json=dict(
 				username=self.username,
@@ -4162,7 +4161,7 @@ metadata_field: Field from which the vector was derived
 vector_field: Vector field to compare against
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/experimentation/bias_indicator',
 			json=dict(
 				username=self.username,
@@ -4190,7 +4189,7 @@ vector_field: The vector field that has been clustered
 alias: The alias of the vector field
 
 """
-		return requests.post(
+		return self.session.post(
 			url=self.url+'/experimentation/cluster_comparator',
 			json=dict(
 				username=self.username,
@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViArrayDictClient:
+class ViArrayDictClient(ViSessionMixin):
     """
     Search and Encoding for Array & Dictionary
     """
@@ -53,7 +53,7 @@ Args:
             "dictionary_fields": dictionary_fields,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/encode_dictionary_field".format(self.url),
             params=params,
         )
@@ -92,7 +92,7 @@ Args:
             "dictionary_field": dictionary_field,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/encode_dictionary".format(self.url),
             json=params,
         )
@@ -176,7 +176,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/search_with_dictionary".format(self.url),
             json=params
         )
@@ -220,7 +220,7 @@ Args:
             "array_fields": array_fields
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/encode_array_field".format(self.url),
             params=params,
         )
@@ -259,7 +259,7 @@ Args:
             "array_field": array_field,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/encode_array".format(self.url),
             params=params,
         )
@@ -344,7 +344,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search_with_array".format(self.url),
             params=params
         )
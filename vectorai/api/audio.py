@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViAudioClient:
+class ViAudioClient(ViSessionMixin):
     """
     Search and Encoding of Audios
     """
@@ -96,7 +96,7 @@ Args:
                     "asc": asc
                 }
                 params.update(kwargs)
-                return requests.post(
+                return self.session.post(
                     url="{}/collection/search_with_audio".format(self.url),
                     json=params
                 )
@@ -117,7 +117,7 @@ Args:
                 "asc": asc
             }
             params.update(kwargs)
-            return requests.post(
+            return self.session.post(
                 url="{}/collection/search_with_audio_upload".format(self.url),
                 json=params
             )
@@ -216,7 +216,7 @@ Args:
             "audio_url": audio,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/encode_audio".format(self.url),
             params=params
         )
@@ -262,7 +262,7 @@ Args:
             "refresh": refresh,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/jobs/encode_audio_field".format(self.url),
             params=params
         )
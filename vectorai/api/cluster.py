@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViClusterClient:
+class ViClusterClient(ViSessionMixin):
     """
     Clustering
     """
@@ -50,7 +50,7 @@ Args:
             "refresh": refresh,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/jobs/cluster".format(self.url),
             params=params
         )
@@ -100,7 +100,7 @@ Args:
                 "flatten" : flatten
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/cluster_aggregate".format(self.url),
             json=params,
         )
@@ -143,7 +143,7 @@ Args:
                 "date_interval": date_interval
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/cluster_facets".format(self.url),
             params=params
         )
@@ -169,7 +169,7 @@ Args:
             "vector_field": vector_field,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/cluster_centroids".format(self.url),
             params=params
         )
@@ -208,7 +208,7 @@ Args:
             "metric": metric,
             "include_vector": include_vector,
         }
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/cluster_centroid_documents".format(self.url),
             params=params
         )
@@ -260,7 +260,7 @@ Args:
             "n_iter": n_iter,
             "refresh": refresh,
         }
-        return requests.get(
+        return self.session.get(
             url="{}/collection/jobs/advanced_cluster".format(self.url),
             params=params
         )
@@ -319,7 +319,7 @@ Args:
                 "filters" : filters,
                 "flatten" : flatten
         }
-        return requests.post(
+        return self.session.post(
             url="{}/collection/advanced_cluster_aggregate".format(self.url),
             json=params
         )
@@ -371,7 +371,7 @@ Args:
                 "alias": alias,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/advanced_cluster_facets".format(self.url),
             params=params,
         )
@@ -402,7 +402,7 @@ Args:
             "alias": alias,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/advanced_cluster_centroids".format(self.url),
             params=params
         )
@@ -446,7 +446,7 @@ Args:
             "alias": alias,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/advanced_cluster_centroid_documents".format(self.url),
             params=params
         )
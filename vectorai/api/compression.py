@@ -0,0 +1,65 @@
+"""
+    Compression of large request bodies.
+
+    Responses are decompressed by urllib3 while they are streamed, so only request
+    bodies are handled here.
+"""
+import gzip
+from ..options import get_option
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _gzip(body: bytes, level: int=None) -> bytes:
+    return gzip.compress(body, compresslevel=6 if level is None else level)
+
+
+def _zstd(body: bytes, level: int=None) -> bytes:
+    if zstandard is None:
+        raise ImportError("zstd compression requires zstandard. Install it with pip install zstandard.")
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(body)
+
+
+COMPRESSORS = {
+    'gzip': _gzip,
+    'zstd': _zstd,
+}
+
+
+def compress_body(body: bytes, compression: str=None, threshold: int=None, level: int=None):
+    """
+    Compress a request body if it is at least threshold bytes long.
+
+    Args:
+        body:
+            The serialized request body.
+        compression:
+            gzip or zstd. Defaults to the request_compression option. None disables compression.
+        threshold:
+            The minimum body size in bytes to compress. Defaults to the
+            request_compression_threshold option.
+        level:
+            The compression level. Defaults to the request_compression_level option.
+
+    Returns:
+        The body and the Content-Encoding to send it with, which is None if the
+        body was not compressed.
+
+    Example:
+        >>> from vectorai.api.compression import compress_body
+        >>> body, content_encoding = compress_body(b'{}' * 10000, 'gzip', threshold=1024)
+    """
+    if compression is None:
+        compression = get_option('request_compression')
+    if threshold is None:
+        threshold = get_option('request_compression_threshold')
+    if level is None:
+        level = get_option('request_compression_level')
+    if compression is None or body is None or len(body) < threshold:
+        return body, None
+    if compression not in COMPRESSORS:
+        raise ValueError(f"Unknown compression {compression}. Choose one of {list(COMPRESSORS)}.")
+    return COMPRESSORS[compression](body, level), compression
@@ -1,8 +1,8 @@
-import requests
+from .session import ViSessionMixin
 from typing import List
 from .utils import retry, return_curl_or_response
 
-class ViDimensionalityReductionClient:
+class ViDimensionalityReductionClient(ViSessionMixin):
     """
     Dimensionality Reduction
     """
@@ -52,7 +52,7 @@ Args:
             "n_components": n_components,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/dimensionality_reduce".format(self.url),
             params=params
         )
@@ -96,7 +96,7 @@ Args:
             "refresh": refresh,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/jobs/dimensionality_reduction".format(self.url),
             params=params
         )
@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViImageClient:
+class ViImageClient(ViSessionMixin):
     """
     Search and Encoding of Images
     """
@@ -97,7 +97,7 @@ Args:
                     "asc": asc
                 }
                 params.update(kwargs)
-                return requests.post(
+                return self.session.post(
                     url="{}/collection/search_with_image".format(self.url),
                     json=params
                 )
@@ -117,7 +117,7 @@ Args:
                 "asc": asc
             }
             params.update(kwargs)
-            return requests.post(
+            return self.session.post(
                 url="{}/collection/search_with_image_upload".format(self.url),
                 json=params
             )
@@ -218,7 +218,7 @@ Args:
             "image_url": image,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/encode_image".format(self.url),
             params=params
         )
@@ -263,7 +263,7 @@ Args:
                 "refresh": refresh,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/jobs/encode_image_field".format(self.url),
             params=params
         )
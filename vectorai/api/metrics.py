@@ -0,0 +1,166 @@
+"""
+    Per-endpoint request metrics collected by every client session.
+"""
+import threading
+from collections import deque
+from typing import Dict
+import numpy as np
+
+__all__ = ['ViMetrics']
+
+
+class _EndpointStats:
+    def __init__(self, buckets, max_samples: int):
+        self.requests = 0
+        self.errors = 0
+        self.status_codes = {}
+        self.retries = 0
+        self.failed_documents = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * len(buckets)
+        self.latencies = deque(maxlen=max_samples)
+
+
+class ViMetrics:
+    """
+    Counters and latency histograms for the requests made by a client, kept per endpoint.
+
+    Latency percentiles are computed over the most recent max_samples requests of an
+    endpoint. The histogram buckets and every counter cover all requests since the
+    last reset.
+
+    Args:
+        max_samples:
+            The number of latencies kept per endpoint for percentiles.
+        buckets:
+            The upper bounds in seconds of the latency histogram buckets.
+
+    Example:
+        >>> from vectorai.client import ViClient
+        >>> vi_client = ViClient(username, api_key, vectorai_url)
+        >>> vi_client.insert_documents(collection_name, documents)
+        >>> vi_client.metrics.to_dict()['bulk_insert']['latency']['p95']
+        >>> print(vi_client.metrics.to_prometheus())
+    """
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, max_samples: int=10000, buckets=LATENCY_BUCKETS):
+        self.max_samples = max_samples
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _get_stats(self, endpoint: str) -> _EndpointStats:
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = _EndpointStats(self.buckets, self.max_samples)
+        return self._endpoints[endpoint]
+
+    def record_request(self, endpoint: str, status_code: int, latency: float, bytes_sent: int=0,
+        bytes_received: int=0):
+        """
+        Record one attempt of a request. status_code is None if no response was received.
+        """
+        with self._lock:
+            stats = self._get_stats(endpoint)
+            stats.requests += 1
+            stats.status_codes[status_code] = stats.status_codes.get(status_code, 0) + 1
+            if status_code != 200:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency_sum += latency
+            stats.latencies.append(latency)
+            for i, upper_bound in enumerate(self.buckets):
+                if latency <= upper_bound:
+                    stats.bucket_counts[i] += 1
+                    break
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._get_stats(endpoint).retries += 1
+
+    def record_failed_documents(self, endpoint: str, count: int):
+        with self._lock:
+            self._get_stats(endpoint).failed_documents += count
+
+    def reset(self):
+        """
+        Clear every counter and latency.
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def percentile(self, endpoint: str, q: float) -> float:
+        """
+        The q-th percentile latency in seconds of an endpoint, or None if it has no requests.
+        """
+        with self._lock:
+            latencies = list(self._get_stats(endpoint).latencies)
+        if len(latencies) == 0:
+            return None
+        return float(np.percentile(latencies, q))
+
+    def to_dict(self) -> Dict:
+        """
+        The metrics of every endpoint as a dictionary of plain Python values.
+        """
+        with self._lock:
+            endpoints = {k: (v, list(v.latencies)) for k, v in self._endpoints.items()}
+        metrics = {}
+        for endpoint, (stats, latencies) in sorted(endpoints.items()):
+            latency = {'mean': stats.latency_sum / stats.requests if stats.requests else None}
+            for q in self.PERCENTILES:
+                latency[f'p{q}'] = float(np.percentile(latencies, q)) if latencies else None
+            latency['max'] = max(latencies) if latencies else None
+            metrics[endpoint] = {
+                'requests': stats.requests,
+                'errors': stats.errors,
+                'status_codes': {str(k): v for k, v in stats.status_codes.items()},
+                'retries': stats.retries,
+                'failed_documents': stats.failed_documents,
+                'bytes_sent': stats.bytes_sent,
+                'bytes_received': stats.bytes_received,
+                'latency': latency,
+            }
+        return metrics
+
+    def to_prometheus(self, prefix: str='vectorai') -> str:
+        """
+        The metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = []
+
+            def add(name, kind, help, samples):
+                lines.append(f"# HELP {prefix}_{name} {help}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+                for suffix, labels, value in samples:
+                    labels = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                    lines.append(f"{prefix}_{name}{suffix}{{{labels}}} {value}")
+
+            add('requests_total', 'counter', 'Requests sent, including retries.', [
+                ('', {'endpoint': e, 'status': 'none' if code is None else code}, count)
+                for e, s in endpoints for code, count in s.status_codes.items()])
+            add('retries_total', 'counter', 'Requests that were retried.',
+                [('', {'endpoint': e}, s.retries) for e, s in endpoints])
+            add('failed_documents_total', 'counter', 'Documents the API reported as failed.',
+                [('', {'endpoint': e}, s.failed_documents) for e, s in endpoints])
+            add('sent_bytes_total', 'counter', 'Request body bytes sent.',
+                [('', {'endpoint': e}, s.bytes_sent) for e, s in endpoints])
+            add('received_bytes_total', 'counter', 'Response body bytes received.',
+                [('', {'endpoint': e}, s.bytes_received) for e, s in endpoints])
+            samples = []
+            for e, s in endpoints:
+                cumulative = 0
+                for upper_bound, count in zip(self.buckets, s.bucket_counts):
+                    cumulative += count
+                    samples.append(('_bucket', {'endpoint': e, 'le': upper_bound}, cumulative))
+                samples.append(('_bucket', {'endpoint': e, 'le': '+Inf'}, s.requests))
+                samples.append(('_sum', {'endpoint': e}, s.latency_sum))
+                samples.append(('_count', {'endpoint': e}, s.requests))
+            add('request_duration_seconds', 'histogram', 'Request latency in seconds.', samples)
+        return '\n'.join(lines) + '\n'
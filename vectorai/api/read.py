@@ -1,4 +1,3 @@
-import requests
 import random
 from typing import Dict, List
 from .audio import ViAudioClient
@@ -48,7 +47,7 @@ Args:
             "api_key": self.api_key
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/project/list_collections".format(self.url),
             params=params,
         )
@@ -72,7 +71,7 @@ Args:
             "collection_name": collection_name
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/project/collection_stats".format(self.url),
             params=params
         )
@@ -96,7 +95,7 @@ Args:
         }
         params.update(kwargs)
 
-        response = requests.get(
+        response = self.session.get(
             url="{}/project/collection_schema".format(self.url),
             params=params
         )
@@ -124,7 +123,7 @@ Args:
             "include_vector": include_vector,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/id".format(self.url),
             params=params
         )
@@ -151,7 +150,7 @@ Args:
             "document_ids": document_ids,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/bulk_id".format(self.url),
             params=params
         )
@@ -204,7 +203,7 @@ Args:
         if sort:
             q_params["sort"] = sort
         q_params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/retrieve_documents".format(self.url), params=q_params
         )
         return return_curl_or_response(response, 'json', return_curl=return_curl)
@@ -250,7 +249,7 @@ Args:
         }
         q_params.update(kwargs)
 
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/random_documents".format(self.url), params=q_params
         )
         return return_curl_or_response(response, 'json', return_curl=return_curl)
@@ -273,7 +272,7 @@ Args:
             "doc_id" : doc_id,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/id_lookup_joined".format(self.url),
             json=params
         )
@@ -341,7 +340,7 @@ Args:
             "flatten" : flatten
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/aggregate".format(self.url),
             json=params
         )
@@ -388,7 +387,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/facets".format(self.url),
             params=params
         )
@@ -462,7 +461,7 @@ Args:
             "include_vector": include_vector,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/filters".format(self.url),
             json=params
         )
@@ -489,7 +488,7 @@ Args:
             "job_id": job_id,
             "job_name": job_name,
         }
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/jobs/job_status".format(self.url),
             params=params
         )
@@ -513,7 +512,7 @@ Args:
             "collection_name": collection_name,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/jobs/list_jobs".format(self.url),
             params=params
         )
@@ -531,7 +530,7 @@ Args:
             "document_ids" : document_ids
         }
         params.update(kwargs)
-        response = requests.post('{}/collection/bulk_missing_id'.format(self.url), 
+        response = self.session.post('{}/collection/bulk_missing_id'.format(self.url), 
         json=params)
         return return_curl_or_response(response, 'json', return_curl=return_curl)
     
@@ -557,7 +556,7 @@ Args:
             "filters": filters
         }
 
-        response = requests.post('{}/collection/random_documents_with_filters'.format(self.url), json=params)
+        response = self.session.post('{}/collection/random_documents_with_filters'.format(self.url), json=params)
         return return_curl_or_response(response, 'json', return_curl=return_curl)
 
     @retry()
@@ -570,6 +569,6 @@ Args:
             "collection_name": collection_name
         }
         params.update(kwargs)
-        response = requests.get("{}/collection/vector_health".format(self.url), params=params)
+        response = self.session.get("{}/collection/vector_health".format(self.url), params=params)
         return return_curl_or_response(response, 'json', return_curl=return_curl)
         
@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViSearchClient:
+class ViSearchClient(ViSessionMixin):
     """
     Search and Advanced Search Operations
     """
@@ -94,7 +94,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search".format(self.url),
             params=params
         )
@@ -183,7 +183,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/hybrid_search".format(self.url),
             params=params
         )
@@ -262,7 +262,7 @@ Args:
             "hundred_scale": hundred_scale
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search_by_id".format(self.url),
             params=params
         )
@@ -338,7 +338,7 @@ Args:
             "include_count": include_count,
             "asc": asc
         }
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search_by_ids".format(self.url),
             params=params
         )
@@ -418,7 +418,7 @@ Args:
             "asc": asc
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search_by_positive_negative_ids".format(self.url),
             params=params
         )
@@ -503,7 +503,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/search_with_positive_negative_ids_as_history".format(self.url),
             params=params
         )
@@ -600,7 +600,7 @@ Example:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_search".format(self.url),
             json=params
         )
@@ -701,7 +701,7 @@ Args:
             "asc": asc,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_hybrid_search".format(self.url),
             json=params
         )
@@ -802,7 +802,7 @@ Example:
             "asc": asc
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_search_by_id".format(self.url),
             json=params
         )
@@ -897,7 +897,7 @@ Args:
                 "asc": asc
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_search_by_ids".format(self.url),
             json=params
         )
@@ -996,7 +996,7 @@ Args:
                 "asc": asc,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_search_by_positive_negative_ids".format(
                 self.url
             ),
@@ -1101,7 +1101,7 @@ Args:
                 "asc": asc,
         } 
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/advanced_search_with_positive_negative_ids_as_history".format(
                 self.url
             ),
@@ -1159,7 +1159,7 @@ Args:
             "asc": asc
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/chunk_search".format(
                 self.url
             ),
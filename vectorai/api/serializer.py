@@ -0,0 +1,147 @@
+"""
+    JSON serializers for request bodies.
+
+    Numpy arrays, numpy scalars and timestamps are serialized directly so documents
+    do not need to be converted with .tolist() before they are sent.
+    orjson is used when it is installed, otherwise the standard library json module.
+"""
+import json
+import datetime
+import numpy as np
+from ..options import get_option
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """
+    Convert objects the json module cannot serialize.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_default(obj):
+    """
+    Convert objects orjson cannot serialize natively, such as float16 and
+    non-contiguous numpy arrays.
+    """
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == 'f' and obj.dtype.itemsize < 4:
+        obj = obj.astype(np.float32)
+    return _default(obj)
+
+
+def _native_arrays(obj):
+    """
+    obj with numpy arrays that are not in native byte order converted to native
+    order, which orjson misreads or rejects. obj itself is returned when it has none,
+    and lists of scalars, such as vectors, are not searched.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj if obj.dtype.isnative else obj.astype(obj.dtype.newbyteorder('='))
+    if isinstance(obj, dict):
+        converted = None
+        for k, v in obj.items():
+            native = _native_arrays(v)
+            if native is not v:
+                if converted is None:
+                    converted = dict(obj)
+                converted[k] = native
+        return obj if converted is None else converted
+    if isinstance(obj, (list, tuple)) and obj and not isinstance(obj[0], (str, int, float, type(None))):
+        converted = [_native_arrays(v) for v in obj]
+        return obj if all(a is b for a, b in zip(converted, obj)) else converted
+    return obj
+
+
+def _has_non_finite(obj) -> bool:
+    """
+    Whether obj holds a NaN or infinite float, which the json module refuses to serialize.
+    """
+    if isinstance(obj, (float, np.floating)):
+        return not np.isfinite(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind in 'fc' and not np.isfinite(obj).all()
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+class JSONSerializer:
+    """
+    Serializer based on the standard library json module.
+
+    Example:
+        >>> from vectorai.api.serializer import JSONSerializer
+        >>> JSONSerializer().dumps({'color_vector_': np.random.rand(3)})
+    """
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, default=_default, allow_nan=False).encode('utf-8')
+
+    def loads(self, content):
+        return json.loads(content)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    Serializer based on orjson. Numpy arrays of native byte order are serialized by
+    orjson itself, so their values match JSONSerializer, though float32 values are
+    written in their shortest form. Like JSONSerializer it raises ValueError for NaN
+    and infinite values.
+
+    Example:
+        >>> from vectorai.api.serializer import OrjsonSerializer
+        >>> OrjsonSerializer().dumps({'color_vector_': np.random.rand(3)})
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonSerializer requires orjson. Install it with pip install orjson.")
+
+    def dumps(self, obj) -> bytes:
+        content = orjson.dumps(_native_arrays(obj), default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        # orjson writes NaN and infinity as null, so only output with a null can hold them
+        if b'null' in content and _has_non_finite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return content
+
+    def loads(self, content):
+        return orjson.loads(content)
+
+
+SERIALIZERS = {
+    'json': JSONSerializer,
+    'orjson': OrjsonSerializer,
+}
+
+
+def get_serializer(name: str=None) -> JSONSerializer:
+    """
+    Return a serializer by name. If no name is given the json_serializer option is used,
+    and if that is not set either orjson is used when installed.
+
+    Example:
+        >>> from vectorai.api.serializer import get_serializer
+        >>> serializer = get_serializer('json')
+    """
+    if name is None:
+        name = get_option('json_serializer')
+    if name is None:
+        name = 'orjson' if orjson is not None else 'json'
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer {name}. Choose one of {list(SERIALIZERS)}.")
+    return SERIALIZERS[name]()
@@ -0,0 +1,274 @@
+"""
+    Connection pooling shared by every request a client makes.
+"""
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from ..options import get_option
+from .utils import RetryPolicy
+from .wire import encode_vectors, VECTOR_ENCODING_HEADER, ACCEPT_VECTOR_ENCODING_HEADER
+from .serializer import get_serializer, JSONSerializer
+from .compression import compress_body
+from .metrics import ViMetrics
+
+_SESSION_LOCK = threading.Lock()
+
+
+class ViSession(requests.Session):
+    """
+    A requests session that keeps connections alive in a sized connection pool.
+
+    Args:
+        pool_connections:
+            The number of hosts to keep a connection pool for.
+        pool_maxsize:
+            The maximum number of connections kept alive per host.
+        pool_block:
+            If True, block when all connections to a host are in use instead of
+            opening an extra connection that is discarded afterwards.
+        retry_policy:
+            The RetryPolicy applied to every request. Defaults to one built from the options.
+        vector_encoding:
+            If float32 or float16, send vector fields as base64 little-endian floats and ask
+            the server to do the same in responses. Only use this with servers that support it.
+            Defaults to the vector_wire_encoding option.
+        serializer:
+            The serializer for JSON request bodies. Defaults to get_serializer().
+        metrics:
+            The ViMetrics every request is recorded in. Pass the same instance to
+            several sessions to aggregate them.
+
+    Example:
+        >>> from vectorai.api.session import ViSession
+        >>> session = ViSession(pool_maxsize=20)
+        >>> vi_client.session = session
+    """
+    def __init__(self, pool_connections: int=None, pool_maxsize: int=None, pool_block: bool=None,
+        retry_policy: RetryPolicy=None, vector_encoding: str=None, serializer: JSONSerializer=None,
+        metrics: ViMetrics=None):
+        super().__init__()
+        self.metrics = metrics if metrics is not None else ViMetrics()
+        self.request_hooks = []
+        self.response_hooks = []
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if vector_encoding is None:
+            vector_encoding = get_option('vector_wire_encoding')
+        self.vector_encoding = vector_encoding
+        self.serializer = serializer if serializer is not None else get_serializer()
+        if pool_connections is None:
+            pool_connections = get_option('http_pool_connections')
+        if pool_maxsize is None:
+            pool_maxsize = get_option('http_pool_maxsize')
+        if pool_block is None:
+            pool_block = get_option('http_pool_block')
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def on_request(self, hook):
+        """
+        Call hook with every PreparedRequest before it is sent, including retries.
+        Returns the hook so it can be used as a decorator.
+
+        Example:
+            >>> @vi_client.session.on_request
+            >>> def log_request(request):
+            >>>     print(request.method, request.url)
+        """
+        self.request_hooks.append(hook)
+        return hook
+
+    def on_response(self, hook):
+        """
+        Call hook with every Response once its body has been read, including the
+        responses of attempts that are retried. Returns the hook.
+
+        Example:
+            >>> @vi_client.session.on_response
+            >>> def log_response(response):
+            >>>     print(response.url, response.status_code, response.elapsed)
+        """
+        self.response_hooks.append(hook)
+        return hook
+
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        """
+        Prepare a request, serializing JSON bodies with the session serializer,
+        encoding their vector fields if a vector encoding is set and compressing
+        them if they are larger than the request_compression_threshold option.
+        """
+        if self.vector_encoding is not None:
+            request.headers[ACCEPT_VECTOR_ENCODING_HEADER] = self.vector_encoding
+        if request.json is not None:
+            payload = request.json
+            if self.vector_encoding is not None:
+                payload = encode_vectors(payload, self.vector_encoding)
+                request.headers[VECTOR_ENCODING_HEADER] = self.vector_encoding
+            request.data, content_encoding = compress_body(self.serializer.dumps(payload))
+            request.json = None
+            request.headers['Content-Type'] = 'application/json'
+            if content_encoding is not None:
+                request.headers['Content-Encoding'] = content_encoding
+        return super().prepare_request(request)
+
+    def request(self, method, url, *args, **kwargs):
+        """
+        Send a request, retrying connection errors and retryable status codes
+        according to the retry policy.
+        """
+        policy = self.retry_policy
+        retryable = policy.is_retryable(method, url)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            remaining = policy.remaining(start)
+            if remaining is not None:
+                kwargs['timeout'] = max(remaining, 0.001)
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                wait = policy.get_backoff(attempt)
+                if not retryable or not policy.should_retry(attempt, start, wait):
+                    raise
+            else:
+                if not retryable or not policy.is_retryable_status(response.status_code):
+                    return response
+                wait = policy.get_backoff(attempt, response.headers)
+                if not policy.should_retry(attempt, start, wait):
+                    return response
+                response.close()
+            self.metrics.record_retry(policy.endpoint_name(url))
+            time.sleep(wait)
+            attempt += 1
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """
+        Send a prepared request, running the hooks and recording its metrics.
+        """
+        for hook in self.request_hooks:
+            hook(request)
+        endpoint = RetryPolicy.endpoint_name(request.url)
+        bytes_sent = len(request.body) if isinstance(request.body, (bytes, str)) else 0
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.metrics.record_request(endpoint, None, time.perf_counter() - start, bytes_sent)
+            raise
+        if kwargs.get('stream'):
+            bytes_received = int(response.headers.get('Content-Length', 0))
+        else:
+            bytes_received = int(response.headers.get('Content-Length', len(response.content)))
+        self.metrics.record_request(endpoint, response.status_code, time.perf_counter() - start,
+            bytes_sent, bytes_received)
+        for hook in self.response_hooks:
+            hook(response)
+        return response
+
+
+class ViSessionMixin:
+    """
+    Gives a client one connection pool that all of its requests go through.
+    The session is created on first use so that subclasses do not need to call
+    a parent constructor.
+    """
+    @property
+    def session(self) -> ViSession:
+        """
+        The pooled session used for every request made by the client.
+
+        Example:
+            >>> from vectorai.client import ViClient
+            >>> vi_client = ViClient(username, api_key, vectorai_url)
+            >>> vi_client.session.get(vectorai_url)
+        """
+        session = self.__dict__.get('_session')
+        if session is None:
+            with _SESSION_LOCK:
+                session = self.__dict__.get('_session')
+                if session is None:
+                    session = ViSession(retry_policy=self.__dict__.get('_retry_policy'))
+                    self.__dict__['_session'] = session
+        return session
+
+    @session.setter
+    def session(self, value: requests.Session):
+        self.__dict__['_session'] = value
+
+    @property
+    def metrics(self) -> ViMetrics:
+        """
+        The per-endpoint request metrics of the client.
+
+        Example:
+            >>> vi_client.metrics.to_dict()
+            >>> print(vi_client.metrics.to_prometheus())
+        """
+        return self.session.metrics
+
+    def on_request(self, hook):
+        """
+        Call hook with every request the client sends. See ViSession.on_request.
+        """
+        return self.session.on_request(hook)
+
+    def on_response(self, hook):
+        """
+        Call hook with every response the client receives. See ViSession.on_response.
+        """
+        return self.session.on_response(hook)
+
+    def _record_failed_documents(self, endpoint: str, failed_document_ids: list):
+        metrics = getattr(self.session, 'metrics', None)
+        if metrics is not None and len(failed_document_ids) > 0:
+            metrics.record_failed_documents(endpoint, len(failed_document_ids))
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """
+        The RetryPolicy applied to every request made by the client.
+
+        Example:
+            >>> from vectorai.api.utils import RetryPolicy
+            >>> vi_client.retry_policy = RetryPolicy(max_retries=5, deadline=30)
+        """
+        return getattr(self.session, 'retry_policy', self.__dict__.get('_retry_policy'))
+
+    @retry_policy.setter
+    def retry_policy(self, value: RetryPolicy):
+        self.__dict__['_retry_policy'] = value
+        self.session.retry_policy = value
+
+    def close(self):
+        """
+        Close every pooled connection held by the client.
+
+        Example:
+            >>> from vectorai.client import ViClient
+            >>> vi_client = ViClient(username, api_key, vectorai_url)
+            >>> vi_client.close()
+        """
+        session = self.__dict__.pop('_session', None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        # Connection pools cannot be shared across processes so each process
+        # opens its own on first use.
+        state = self.__dict__.copy()
+        state.pop('_session', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
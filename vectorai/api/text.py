@@ -1,10 +1,10 @@
 import io
 import base64
-import requests
+from .session import ViSessionMixin
 from typing import Dict, List
 from .utils import retry, return_curl_or_response
 
-class ViTextClient:
+class ViTextClient(ViSessionMixin):
     """
     Search and Encoding of Texts
     """
@@ -90,7 +90,7 @@ Args:
                 "asc": asc
         }
         params.update(kwargs)
-        return requests.post(
+        return self.session.post(
             url="{}/collection/search_with_text".format(self.url),
             json=params
         )
@@ -122,7 +122,7 @@ Args:
             "text": text,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/encode_text".format(self.url),
             params=params
         )
@@ -165,7 +165,7 @@ Args:
                 "refresh": refresh,
         }
         params.update(kwargs)
-        return requests.get(
+        return self.session.get(
             url="{}/collection/jobs/encode_text_field".format(self.url),
             params=params
         )
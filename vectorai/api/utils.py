@@ -4,6 +4,10 @@
 import time
 import os
 import sys
+import random
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 if sys.version_info.major >= 3:
     from shlex import quote
 else:
@@ -11,32 +15,150 @@ else:
 from functools import wraps
 from ..options import get_option
 from ..errors import APIError
+from .wire import decode_response_vectors
 
-def retry(num_of_retries=3, timeout=5):
+class RetryPolicy:
     """
-    Allows the function to retry upon failure. 
+    Decides whether a request is retried and how long to wait in between.
+    Waits grow exponentially with full jitter. A Retry-After header is waited in
+    full, unless the wait goes past the deadline, which stops the retries.
+
     Args:
-        num_of_retries: The number of times the function should retry
-        timeout: The number of seconds to wait between each retry
+        max_retries:
+            The maximum number of retries after the first attempt.
+        backoff_factor:
+            The wait before the first retry. It doubles with every retry.
+        max_backoff:
+            The longest exponential backoff between two attempts in seconds. It
+            does not shorten a Retry-After wait.
+        status_forcelist:
+            The status codes that are retried.
+        retry_endpoints:
+            POST endpoints that are safe to retry. GET requests are always retried.
+            Write endpoints such as bulk_insert are only retried when added here.
+        deadline:
+            The maximum number of seconds a call may take including retries.
+            None means no deadline.
+        jitter:
+            If True, wait a random duration between 0 and the exponential backoff.
+
+    Example:
+        >>> from vectorai.api.utils import RetryPolicy
+        >>> vi_client.retry_policy = RetryPolicy(max_retries=5, deadline=60,
+        ...     retry_endpoints=RetryPolicy.READ_ENDPOINTS | {'bulk_insert'})
     """
-    num_of_retries = get_option('maximum_num_of_http_retries')
-    timeout = get_option('maximum_http_timeout')
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+    # POST endpoints that only read data.
+    READ_ENDPOINTS = frozenset([
+        'search_collections', 'bulk_missing_id', 'retrieve_documents_with_filters',
+        'random_documents_with_filters', 'compare_documents', 'encode', 'bulk_encode',
+        'predict_knn_regression', 'predict_knn_regression_from_results', 'filters',
+        'advanced_search', 'advanced_search_by_id', 'advanced_search_by_ids',
+        'advanced_search_by_positive_negative_ids', 'aggregate', 'aggregate_fetch',
+        'advanced_hybrid_search', 'chunk_search', 'advanced_chunk_search',
+        'advanced_multistep_chunk_search', 'id_lookup_joined', 'cluster_aggregate',
+        'advanced_cluster_aggregate', 'advanced_cluster_search', 'search_with_text',
+        'search_with_image', 'search_with_audio', 'search_with_fields', 'search_with_dictionary',
+        'bulk_encode_text', 'bulk_encode_image',
+    ])
+    RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+    def __init__(self, max_retries: int=None, backoff_factor: float=None, max_backoff: float=None,
+        status_forcelist=RETRY_STATUS_CODES, retry_endpoints=READ_ENDPOINTS, deadline: float=None,
+        jitter: bool=True):
+        if max_retries is None:
+            max_retries = get_option('maximum_num_of_http_retries')
+        if backoff_factor is None:
+            backoff_factor = get_option('http_backoff_factor')
+        if max_backoff is None:
+            max_backoff = get_option('maximum_http_timeout')
+        if deadline is None:
+            deadline = get_option('http_retry_deadline')
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_forcelist = frozenset(status_forcelist)
+        self.retry_endpoints = frozenset(retry_endpoints)
+        self.deadline = deadline
+        self.jitter = jitter
+
+    @staticmethod
+    def endpoint_name(url: str) -> str:
+        """
+        The endpoint name of a request url, e.g. bulk_insert.
+        """
+        return urlparse(url).path.rstrip('/').split('/')[-1]
+
+    def is_retryable(self, method: str, url: str) -> bool:
+        """
+        Whether a request can be sent again without side effects.
+        """
+        return method.upper() in self.IDEMPOTENT_METHODS or self.endpoint_name(url) in self.retry_endpoints
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.status_forcelist
+
+    def get_backoff(self, attempt: int, headers: dict=None) -> float:
+        """
+        The number of seconds to wait before the next attempt.
+
+        Args:
+            attempt:
+                The number of attempts made so far, starting at 0.
+            headers:
+                Response headers, used to honor Retry-After.
+        """
+        retry_after = self._parse_retry_after(headers)
+        if retry_after is not None:
+            return retry_after
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
 
+    @staticmethod
+    def _parse_retry_after(headers: dict=None):
+        if not headers or headers.get('Retry-After') is None:
+            return None
+        retry_after = headers.get('Retry-After')
+        try:
+            return max(0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0, (retry_date - datetime.now(retry_date.tzinfo)).total_seconds())
+
+    def remaining(self, start: float):
+        """
+        Seconds left before the deadline of a call that started at start.
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - start)
+
+    def should_retry(self, attempt: int, start: float, wait: float) -> bool:
+        """
+        Whether another attempt fits in the number of retries and the deadline.
+        """
+        if attempt >= self.max_retries:
+            return False
+        remaining = self.remaining(start)
+        return remaining is None or wait < remaining
+
+
+def retry(num_of_retries=3, timeout=5):
+    """
+    Kept for the generated API methods. Retries are applied by the client's
+    RetryPolicy when the request is sent through its session.
+    Args:
+        num_of_retries: Unused, set retry_policy on the client instead
+        timeout: Unused, set retry_policy on the client instead
+    """
     def _retry(func):
-        @wraps(func)
-        def function_wrapper(*args, **kwargs):
-            for i in range(num_of_retries):
-                try:
-                    return func(*args, **kwargs)
-                # Using general error to avoid any possible error dependencies.
-                except ConnectionError as error:
-                    time.sleep(timeout)
-                    print("Retrying...")
-                    if i == num_of_retries - 1:
-                        raise error
-                    continue
-                break
-        return function_wrapper
+        return func
     return _retry
 
 def return_response(response, return_type='json'):
@@ -47,11 +169,11 @@ def return_response(response, return_type='json'):
         content = response.content
         if isinstance(content, bytes):
             content = content.decode()
-        raise APIError(content)
+        raise APIError(content, status_code=response.status_code)
     if return_type is None:
         return response
     elif return_type == 'json':
-        return response.json()
+        return decode_response_vectors(response.json(), response.headers)
     elif return_type == 'content':
         return response.content
     return response
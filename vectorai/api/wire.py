@@ -0,0 +1,110 @@
+"""
+    Compact wire encoding for vectors in request and response bodies.
+
+    When enabled, vector fields (fields ending in _vector_ and the vector of a
+    multivector query) are sent as base64 strings of little-endian floats instead
+    of lists of JSON numbers. The X-Vector-Encoding header names the float type.
+"""
+import base64
+import numpy as np
+
+VECTOR_ENCODING_HEADER = 'X-Vector-Encoding'
+ACCEPT_VECTOR_ENCODING_HEADER = 'X-Accept-Vector-Encoding'
+VECTOR_ENCODINGS = {
+    'float32': np.dtype('<f4'),
+    'float16': np.dtype('<f2'),
+}
+
+
+def _get_dtype(encoding: str):
+    if encoding not in VECTOR_ENCODINGS:
+        raise ValueError(f"Unknown vector encoding {encoding}. Choose one of {list(VECTOR_ENCODINGS)}.")
+    return VECTOR_ENCODINGS[encoding]
+
+
+def _is_vector_field(field) -> bool:
+    return isinstance(field, str) and (field.endswith('vector_') or field == 'vector')
+
+
+def _is_vector(value) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and value.dtype.kind in 'fiu'
+    if isinstance(value, (list, tuple)):
+        return len(value) > 0 and isinstance(value[0], (int, float, np.number)) and not isinstance(value[0], bool)
+    return False
+
+
+def encode_vector(vector, encoding: str='float32') -> str:
+    """
+    Encode a vector as a base64 string of little-endian floats.
+
+    Example:
+        >>> from vectorai.api.wire import encode_vector
+        >>> encode_vector([0.1, 0.2, 0.3])
+    """
+    return base64.b64encode(np.asarray(vector, dtype=_get_dtype(encoding)).tobytes()).decode('ascii')
+
+
+def decode_vector(value: str, encoding: str='float32') -> np.ndarray:
+    """
+    Decode a base64 string of little-endian floats into a float32 numpy array.
+
+    Example:
+        >>> from vectorai.api.wire import decode_vector, encode_vector
+        >>> decode_vector(encode_vector([0.1, 0.2, 0.3]))
+    """
+    return np.frombuffer(base64.b64decode(value), dtype=_get_dtype(encoding)).astype(np.float32)
+
+
+def encode_vectors(payload, encoding: str='float32'):
+    """
+    Return a copy of a JSON payload with every vector field encoded.
+    The payload itself is not modified.
+
+    Args:
+        payload:
+            A JSON-like payload of dictionaries and lists.
+        encoding:
+            One of float32 or float16.
+    """
+    _get_dtype(encoding)
+    if isinstance(payload, dict):
+        return {
+            k: encode_vector(v, encoding) if _is_vector_field(k) and _is_vector(v) else encode_vectors(v, encoding)
+            for k, v in payload.items()
+        }
+    if isinstance(payload, list):
+        return [encode_vectors(x, encoding) for x in payload]
+    return payload
+
+
+def decode_vectors(payload, encoding: str='float32'):
+    """
+    Decode every vector field of a JSON payload in place.
+
+    Args:
+        payload:
+            A JSON-like payload of dictionaries and lists.
+        encoding:
+            One of float32 or float16.
+    """
+    if isinstance(payload, dict):
+        for k, v in payload.items():
+            if _is_vector_field(k) and isinstance(v, str):
+                payload[k] = decode_vector(v, encoding)
+            else:
+                decode_vectors(v, encoding)
+    elif isinstance(payload, list):
+        for x in payload:
+            decode_vectors(x, encoding)
+    return payload
+
+
+def decode_response_vectors(payload, headers):
+    """
+    Decode the vectors of a parsed response if the server encoded them.
+    """
+    encoding = headers.get(VECTOR_ENCODING_HEADER)
+    if encoding is None:
+        return payload
+    return decode_vectors(payload, encoding)
@@ -1,4 +1,3 @@
-import requests
 from typing import Dict, List
 from .read import ViReadAPIClient
 from .utils import retry, return_curl_or_response
@@ -45,7 +44,7 @@ Args:
             "document": document,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/project/create_collection_from_document".format(self.url),
             json=params
         )
@@ -72,7 +71,7 @@ Args:
             'models' : models
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url='{}/collection/bulk_insert_and_encode'.format(self.url), 
             json=params
         )
@@ -88,7 +87,7 @@ Args:
             "collection_schema": collection_schema,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/project/create_collection".format(self.url),
             json=params
         )
@@ -103,14 +102,14 @@ Args:
             "collection_name": collection_name,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/project/delete_collection".format(self.url),
             params=params
         )
         return return_curl_or_response(response, 'json', return_curl)
 
     # def replicate_collection(self, collection_name: str, new_collection_name: str):
-    #     return requests.get(
+    #     return self.session.get(
     #         url="{}/project/replicate_collection".format(self.url),
     #         params={
     #             "username": self.username,
@@ -152,7 +151,7 @@ Args:
             "quick": quick
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/bulk_insert".format(self.url),
             json=params
         )
@@ -187,7 +186,7 @@ Args:
             "overwrite" : overwrite
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/insert".format(self.url),
             json=params
         )
@@ -204,7 +203,7 @@ Args:
             "document_id": document_id,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/edit_document".format(self.url),
             json=params
         )
@@ -225,7 +224,7 @@ Args:
             "documents": documents
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/bulk_edit_document".format(self.url),
             json=params
         )
@@ -249,7 +248,7 @@ Args:
             "document_id": document_id,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/delete_by_id".format(self.url),
             params=params
         )
@@ -306,7 +305,7 @@ Args:
             "start_immediately": start_immediately,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/publish_aggregation".format(self.url),
             json=params
         )
@@ -329,7 +328,7 @@ Args:
             "aggregation_name": aggregation_name,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/start_aggregation".format(self.url),
             params=params
         )
@@ -352,7 +351,7 @@ Args:
             "aggregation_name": aggregation_name,
         }
         params.update(kwargs)
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/stop_aggregation".format(self.url),
             params=params
         )
@@ -374,7 +373,7 @@ Args:
             "api_key": self.api_key,
             "aggregation_name": aggregation_name,
         }
-        response = requests.get(
+        response = self.session.get(
             url="{}/collection/delete_published_aggregation".format(self.url),
             params=params
         )
@@ -400,7 +399,7 @@ Args:
             "joined_collection_name": joined_collection_name,
         }
         params.update(kwargs)
-        response = requests.post(
+        response = self.session.post(
             url="{}/collection/join_collections".format(self.url),
             json=params
         )
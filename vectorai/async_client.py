@@ -0,0 +1,381 @@
+"""
+Asyncio client for Vi. Every endpoint of the generated API client is available as a coroutine.
+"""
+import time
+import asyncio
+import inspect
+import requests
+from functools import wraps
+from typing import List, Dict, Callable
+from .api.api import _ViAPIClient
+from .api.session import ViSession
+from .api.utils import RetryPolicy
+from .api.wire import decode_response_vectors
+from .options import get_option
+from .client import ViClient
+from .errors import APIError
+
+__all__ = ['AsyncViClient']
+
+
+def _import_aiohttp():
+    """
+    Import aiohttp when it is first needed as it is slow to import.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("AsyncViClient requires aiohttp. Install it with pip install vectorai[async].")
+    return aiohttp
+
+
+class _RequestRecorder:
+    """
+    Stands in for a session so that a generated API method returns the request
+    it would have sent instead of sending it.
+    """
+    def get(self, url, params=None, **kwargs):
+        return requests.Request('GET', url, params=params)
+
+    def post(self, url, json=None, **kwargs):
+        return requests.Request('POST', url, json=json)
+
+
+class _RequestBuilder:
+    """
+    Exposes the client credentials to a generated API method.
+    """
+    session = _RequestRecorder()
+
+    def __init__(self, username: str, api_key: str, url: str):
+        self.username = username
+        self.api_key = api_key
+        self.url = url
+
+
+def _async_endpoint(func: Callable):
+    """
+    Turn a generated API method into a coroutine that sends the same request
+    without blocking the event loop.
+    """
+    build_request = inspect.unwrap(func)
+
+    @wraps(build_request)
+    async def endpoint(self, *args, **kwargs):
+        request = build_request(
+            _RequestBuilder(self.username, self.api_key, self.url), *args, **kwargs
+        )
+        return await self._send(request)
+    return endpoint
+
+
+class AsyncViClient:
+    """
+        Asyncio client for Vi. Requires aiohttp.
+
+        Every endpoint of the API is a coroutine sharing one connection pool, along with
+        asynchronous versions of insert_documents, retrieve_all_documents and edit_documents.
+
+        Parameters:
+            username:
+                your username for accessing vectorai
+            api_key:
+                your api key for accessing vectorai
+            url:
+                url of the deployed vectorai database
+
+        Example:
+            >>> from vectorai import AsyncViClient
+            >>> async with AsyncViClient(username, api_key, vectorai_url) as vi_client:
+            >>>     results = await vi_client.advanced_search(collection_name, multivector_query)
+    """
+    def __init__(self, username: str, api_key: str, url: str="https://vectorai-development-api.azurewebsites.net"):
+        self.username = username
+        self.api_key = api_key
+        self.url = url
+        # Encoding and document utilities are shared with the synchronous client.
+        self.client = ViClient(username, api_key, url, verbose=False)
+        self._request_session = ViSession()
+        self._aiohttp_session = None
+        self.retry_policy = RetryPolicy()
+
+    @property
+    def metrics(self):
+        """
+        The per-endpoint request metrics of the client, see ViMetrics.
+        """
+        return self._request_session.metrics
+
+    @property
+    def aiohttp_session(self):
+        """
+        The aiohttp session holding the connection pool. Created on first use as it
+        needs to be bound to a running event loop.
+        """
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(
+                limit=get_option('http_pool_connections') * get_option('http_pool_maxsize'),
+                limit_per_host=get_option('http_pool_maxsize')
+            )
+            self._aiohttp_session = aiohttp.ClientSession(connector=connector)
+        return self._aiohttp_session
+
+    async def _send(self, request: requests.Request):
+        """
+        Send a request built by a generated API method and parse the response.
+        Retries follow the client's retry policy.
+        """
+        aiohttp = _import_aiohttp()
+        prepared = self._request_session.prepare_request(request)
+        policy = self.retry_policy
+        retryable = policy.is_retryable(prepared.method, prepared.url)
+        endpoint = policy.endpoint_name(prepared.url)
+        bytes_sent = len(prepared.body) if prepared.body is not None else 0
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            remaining = policy.remaining(start)
+            timeout = aiohttp.ClientTimeout(total=max(remaining, 0.001) if remaining is not None else None)
+            sent = time.perf_counter()
+            try:
+                async with self.aiohttp_session.request(
+                    prepared.method, prepared.url, data=prepared.body,
+                    headers=dict(prepared.headers), timeout=timeout
+                ) as response:
+                    content = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.metrics.record_request(endpoint, None, time.perf_counter() - sent, bytes_sent)
+                wait = policy.get_backoff(attempt)
+                if not retryable or not policy.should_retry(attempt, start, wait):
+                    raise
+            else:
+                self.metrics.record_request(endpoint, response.status, time.perf_counter() - sent,
+                    bytes_sent, int(response.headers.get('Content-Length', len(content))))
+                if not retryable or not policy.is_retryable_status(response.status):
+                    break
+                wait = policy.get_backoff(attempt, response.headers)
+                if not policy.should_retry(attempt, start, wait):
+                    break
+            self.metrics.record_retry(endpoint)
+            await asyncio.sleep(wait)
+            attempt += 1
+        if response.status != 200:
+            raise APIError(content.decode(), status_code=response.status)
+        return decode_response_vectors(requests.models.complexjson.loads(content), response.headers)
+
+    async def close(self):
+        """
+        Close the connection pool.
+
+        Example:
+            >>> await vi_client.close()
+        """
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        self._request_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def list_collections(self) -> List[str]:
+        """
+        List Collections
+
+        Example:
+            >>> await vi_client.list_collections()
+        """
+        return sorted(await self._list_collections())
+
+    async def create_collection_from_document(self, collection_name: str, document: dict, **kwargs):
+        """
+        Creates a collection by infering the schema from a document
+
+        Args:
+            collection_name:
+                Name of Collection
+            document:
+                A document used to infer the schema of the collection
+        """
+        self.client._typecheck_collection_name(collection_name)
+        return await self._create_collection_from_document(
+            collection_name=collection_name, document=document)
+
+    async def _encode(self, documents: List[Dict], models: Dict, use_bulk_encode: bool=None):
+        """
+        Encode documents in the default executor so models do not block the event loop.
+        """
+        if len(models) == 0:
+            return documents
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.client.encode_documents_with_models(
+                documents, models=models, use_bulk_encode=use_bulk_encode)
+        )
+
+    async def insert_documents(
+        self,
+        collection_name: str,
+        documents: List,
+        models: Dict[str, Callable] = {},
+        chunksize: int = 15,
+        workers: int = 1,
+        verbose: bool=False,
+        use_bulk_encode: bool=None,
+        overwrite: bool=False,
+        quick: bool=False,
+        preprocess_hook: Callable=None,
+        **kwargs
+    ):
+        """
+        Insert documents into a collection with an option to encode with models.
+
+        Args:
+            collection_name:
+                Name of collection
+            documents:
+                All documents.
+            models:
+                Models with an encode method
+            workers:
+                The number of chunks uploaded concurrently.
+            use_bulk_encode:
+                Use the bulk_encode method in models. None uses it for the models that have one.
+            verbose:
+                Whether to print document ids that have failed when inserting.
+            overwrite:
+                If True, overwrites document based on _id field.
+            quick:
+                If True, skip the collection schema checks.
+            preprocess_hook:
+                Document-level function that updates documents before they are inserted
+
+        Example:
+            >>> await vi_client.insert_documents(collection_name, documents, workers=5)
+        """
+        if collection_name not in await self.list_collections():
+            if len(models) == 0:
+                self.client._check_schema(documents[0])
+            first_document = (await self._encode([documents[0]], models))[0]
+            await self.create_collection_from_document(collection_name, first_document)
+        self.client._raise_warning_if_no_id(documents)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def insert_chunk(chunk):
+            async with semaphore:
+                if preprocess_hook: {preprocess_hook(d) for d in chunk}
+                self.client._convert_ids_to_string(chunk)
+                chunk = await self._encode(chunk, models, use_bulk_encode=use_bulk_encode)
+                result = await self.bulk_insert(
+                    collection_name=collection_name, documents=chunk,
+                    overwrite=overwrite, quick=quick, **kwargs
+                )
+                self.client._raise_error(result)
+                if len(result['failed_document_ids']) > 0:
+                    self.metrics.record_failed_documents('bulk_insert', len(result['failed_document_ids']))
+                if verbose and len(result['failed_document_ids']) > 0:
+                    print(f"Failed: {result['failed_document_ids']}")
+                return result['failed_document_ids']
+
+        failed = await asyncio.gather(*[
+            insert_chunk(c) for c in self.client._chunks(documents, chunksize)])
+        failed = self.client.flatten_list(failed)
+        return {
+            "inserted_successfully": len(documents) - len(failed),
+            "failed": len(failed),
+            "failed_document_ids": failed,
+        }
+
+    async def retrieve_all_documents(
+        self,
+        collection_name: str,
+        sort: List = [],
+        asc: bool = True,
+        include_vector: bool = True,
+        include_fields: List = [],
+        retrieve_chunk_size: int=1000,
+        **kwargs
+    ):
+        """
+        Retrieve all documents in a given collection.
+
+        Args:
+            collection_name:
+                Name of collection.
+            sort:
+                Select the fields by which to sort by.
+            asc:
+                If true, returns in ascending order of what is sort.
+            include_vector:
+                If true, includes _vector_ fields to return them.
+            include_fields:
+                Adjust which fields are returned.
+            retrieve_chunk_size:
+                The number of documents to retrieve per request.
+
+        Example:
+            >>> all_documents = await vi_client.retrieve_all_documents(collection_name)
+        """
+        d = await self.retrieve_documents(
+            collection_name=collection_name, page_size=retrieve_chunk_size, sort=sort, asc=asc,
+            include_vector=include_vector, include_fields=include_fields, **kwargs
+        )
+        all_docs = d["documents"]
+        while len(d["documents"]) > 0:
+            d = await self.retrieve_documents(
+                collection_name=collection_name,
+                page_size=retrieve_chunk_size,
+                cursor=d["cursor"],
+                sort=sort,
+                asc=asc,
+                include_vector=include_vector,
+                include_fields=include_fields
+            )
+            all_docs += d["documents"]
+        return all_docs
+
+    async def edit_documents(self, collection_name: str, edits: Dict, chunk_size: int=15,
+        workers: int=1, verbose: bool=False, **kwargs):
+        """
+        Edit documents in a collection
+
+        Args:
+            collection_name:
+                Name of collection
+            edits:
+                What edits to make in a collection. Ensure that _id is stored in the document.
+            workers:
+                The number of chunks edited concurrently.
+
+        Example:
+            >>> await vi_client.edit_documents(collection_name, edits=documents, workers=10)
+        """
+        semaphore = asyncio.Semaphore(workers)
+
+        async def edit_chunk(chunk):
+            async with semaphore:
+                response = await self.bulk_edit_document(collection_name, chunk, **kwargs)
+                if verbose: print(response)
+                if len(response['failed_document_ids']) > 0:
+                    self.metrics.record_failed_documents('bulk_edit_document', len(response['failed_document_ids']))
+                return response['failed_document_ids']
+
+        failed = await asyncio.gather(*[
+            edit_chunk(c) for c in self.client.chunk(edits, chunk_size=chunk_size)])
+        failed = self.client.flatten_list(failed)
+        return {
+            "edited_successfully": len(edits) - len(failed),
+            "failed": len(failed),
+            "failed_document_ids": failed,
+        }
+
+
+# Mirror every generated endpoint so the asyncio client stays in sync with the API.
+for _name, _func in vars(_ViAPIClient).items():
+    if _name.startswith('__') or not callable(_func) or hasattr(AsyncViClient, _name):
+        continue
+    setattr(AsyncViClient, _name, _async_endpoint(_func))
@@ -0,0 +1,355 @@
+"""
+    Adaptive chunk sizes for bulk requests, sized by payload bytes and response times.
+"""
+import itertools
+import threading
+import time
+import requests
+from typing import Callable, Dict, Iterable, Iterator, List
+from .api.utils import RetryPolicy
+from .api.serializer import get_serializer
+from .errors import APIError
+
+__all__ = ['AdaptiveChunker', 'FailedDocumentHandler']
+
+# Status codes meaning a smaller request may succeed
+OVERLOAD_STATUS_CODES = (408, 413, 504)
+# Status codes meaning the request was rejected before anything was written
+REJECTED_STATUS_CODES = (413,)
+
+
+def _merge_results(results: List[Dict]) -> Dict:
+    """
+    Combine the responses of the halves of a chunk, concatenating lists such as
+    failed_document_ids and adding counts.
+    """
+    merged = dict(results[0])
+    for result in results[1:]:
+        for k, v in result.items():
+            if isinstance(v, list):
+                merged[k] = merged.get(k, []) + v
+            elif isinstance(v, (int, float)) and not isinstance(v, bool):
+                merged[k] = merged.get(k, 0) + v
+    return merged
+
+
+class AdaptiveChunker:
+    """
+    Chunks documents for bulk requests, adjusting the number of documents per
+    chunk as requests complete. The size grows by a fixed step after every full
+    chunk that is sent within target_latency and is multiplied by decrease when a
+    request is slower than that, times out or is rejected as too large (AIMD).
+    Chunks are also capped at roughly target_bytes, estimated from the documents
+    sent so far.
+
+    A chunk rejected as too large is sent again in halves. A chunk that times out
+    may already have been written, so it is only sent again in halves when the
+    caller says the request is safe to repeat, e.g. when the endpoint is in the
+    retry policy's retry_endpoints. Otherwise the error is raised and only later
+    chunks are smaller.
+
+    Pass one as the chunk size of insert_documents, edit_documents or
+    retrieve_and_encode, or pass 'auto' to use the defaults. One chunker can be
+    shared by all the threads of an insert.
+
+    Args:
+        initial_size:
+            The number of documents in the first chunk.
+        min_size:
+            The smallest chunk size.
+        max_size:
+            The largest chunk size.
+        target_bytes:
+            The largest request body in bytes chunks are sized for.
+        target_latency:
+            Requests slower than this many seconds shrink the chunk size.
+        increase:
+            The number of documents added to the chunk size after a fast request.
+            Defaults to a tenth of initial_size, at least 1.
+        decrease:
+            The factor the chunk size is multiplied by after a slow or failed request.
+
+    Example:
+        >>> from vectorai.batching import AdaptiveChunker
+        >>> chunker = AdaptiveChunker(target_bytes=2 * 1024 * 1024, target_latency=1)
+        >>> vi_client.insert_documents(collection_name, documents, chunksize=chunker)
+        >>> vi_client.edit_documents(collection_name, edits, chunk_size='auto')
+    """
+    def __init__(self, initial_size: int=15, min_size: int=1, max_size: int=1000,
+        target_bytes: int=4 * 1024 * 1024, target_latency: float=2.0, increase: int=None,
+        decrease: float=0.5):
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError("Chunk sizes must satisfy 1 <= min_size <= initial_size <= max_size.")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_bytes = target_bytes
+        self.target_latency = target_latency
+        self.increase = increase if increase is not None else max(1, initial_size // 10)
+        self.decrease = decrease
+        self._size = float(initial_size)
+        self._bytes_per_document = None
+        self._serializer = get_serializer()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of documents in the next chunk.
+        """
+        with self._lock:
+            size = self._size
+            if self._bytes_per_document:
+                size = min(size, self.target_bytes / self._bytes_per_document)
+        return max(self.min_size, int(size))
+
+    def chunks(self, documents: Iterable) -> Iterator[List]:
+        """
+        Split documents into chunks of the current size, reading them lazily.
+        """
+        iterator = iter(documents)
+        while True:
+            chunk = list(itertools.islice(iterator, self.size))
+            if len(chunk) == 0:
+                return
+            yield chunk
+
+    def record_success(self, num_of_documents: int, latency: float):
+        """
+        Grow the chunk size after a full chunk is sent quickly, shrink it after a slow one.
+        """
+        with self._lock:
+            if latency > self.target_latency:
+                self._size = max(self.min_size, self._size * self.decrease)
+            elif num_of_documents >= int(self._size):
+                self._size = min(self.max_size, self._size + self.increase)
+
+    def record_failure(self):
+        """
+        Shrink the chunk size after a request timed out or was too large.
+        """
+        with self._lock:
+            self._size = max(self.min_size, self._size * self.decrease)
+
+    def _record_bytes(self, document: Dict):
+        # Estimate the size of every document from one document per chunk
+        num_of_bytes = len(self._serializer.dumps(document))
+        with self._lock:
+            if self._bytes_per_document is None:
+                self._bytes_per_document = num_of_bytes
+            else:
+                self._bytes_per_document = 0.8 * self._bytes_per_document + 0.2 * num_of_bytes
+
+    @staticmethod
+    def is_overload(error: Exception) -> bool:
+        """
+        Whether an error means the request was too large or too slow, so a smaller
+        chunk may succeed.
+        """
+        if isinstance(error, requests.Timeout):
+            return True
+        return isinstance(error, APIError) and getattr(error, 'status_code', None) in OVERLOAD_STATUS_CODES
+
+    @staticmethod
+    def is_rejected(error: Exception) -> bool:
+        """
+        Whether an error means the request was refused as too large, so none of
+        it was written and it can be sent again in parts.
+        """
+        return isinstance(error, APIError) and getattr(error, 'status_code', None) in REJECTED_STATUS_CODES
+
+    def send(self, func: Callable[[List], Dict], documents: List, retryable: bool=False) -> Dict:
+        """
+        Send a chunk with func and record how long it took. If the request times out
+        or is too large, the chunk size shrinks. A chunk that is too large is sent
+        again in halves whose responses are combined, and so is one that timed out
+        if retryable is True. Otherwise the error is raised.
+
+        Args:
+            func:
+                Sends a list of documents and returns the response, e.g. bulk_insert.
+            documents:
+                The chunk to send.
+            retryable:
+                Whether func can be called again with the same documents after a
+                timeout without writing them twice.
+        """
+        self._record_bytes(documents[0])
+        start = time.perf_counter()
+        try:
+            result = func(documents)
+        except Exception as e:
+            if not self.is_overload(e):
+                raise
+            self.record_failure()
+            if len(documents) <= 1 or not (retryable or self.is_rejected(e)):
+                raise
+            half = len(documents) // 2
+            return _merge_results([self.send(func, documents[:half], retryable),
+                self.send(func, documents[half:], retryable)])
+        self.record_success(len(documents), time.perf_counter() - start)
+        return result
+
+    @classmethod
+    def from_chunksize(cls, chunksize) -> 'AdaptiveChunker':
+        """
+        The chunker for a chunk size argument, or None for a fixed number of documents.
+        """
+        if isinstance(chunksize, cls):
+            return chunksize
+        if chunksize == 'auto':
+            return cls()
+        return None
+
+
+class FailedDocumentHandler:
+    """
+    Sends chunks of documents and deals with the documents that fail. Documents
+    the API reports as failed are sent again with backoff. When a whole chunk is
+    rejected or cannot be serialized, it is split in halves until the documents
+    causing the error are found, so the rest of the chunk still goes in. Documents
+    that still fail are written to a dead-letter JSON lines file with the error.
+
+    Only errors caused by the documents themselves lead to splitting: responses
+    with a status in DOCUMENT_STATUS_CODES, error responses without a status, and
+    documents that cannot be serialized. Connection errors, timeouts, throttling,
+    server and authentication errors are raised for the caller and its
+    RetryPolicy to handle, as splitting the chunk would not help. So is a TypeError
+    or ValueError raised while the chunk itself can be serialized, such as a wrong
+    argument passed to bulk_insert.
+
+    Args:
+        max_retries:
+            The number of times documents reported as failed are sent again.
+        dead_letter_path:
+            A JSON lines file that every document that could not be inserted is
+            appended to as {"document": ..., "error": ..., "status_code": ...}.
+            None keeps only their ids.
+        retry_policy:
+            The backoff between retries. Defaults to a RetryPolicy with the http
+            backoff options.
+
+    Example:
+        >>> from vectorai.batching import FailedDocumentHandler
+        >>> vi_client.insert_documents(collection_name, documents, retry_failed=3,
+        ...     dead_letter_path='failed.jsonl')
+    """
+    DOCUMENT_ERRORS = (APIError, TypeError, ValueError)
+    # Errors of serializers that cannot serialize a document
+    SERIALIZATION_ERRORS = (TypeError, ValueError)
+    # Statuses of requests rejected because of the documents they hold
+    DOCUMENT_STATUS_CODES = (400, 413, 422)
+
+    def __init__(self, max_retries: int=3, dead_letter_path: str=None, retry_policy: RetryPolicy=None):
+        self.max_retries = max_retries
+        self.dead_letter_path = dead_letter_path
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def write_dead_letters(self, documents: List[Dict], error: str, status_code: int=None):
+        """
+        Append documents that could not be inserted to the dead-letter file.
+        """
+        if self.dead_letter_path is None or len(documents) == 0:
+            return
+        serializer = get_serializer()
+        lines = []
+        for document in documents:
+            letter = {'document': document, 'error': error, 'status_code': status_code}
+            try:
+                lines.append(serializer.dumps(letter))
+            except (TypeError, ValueError):
+                # Keep what can be kept of documents that cannot be serialized
+                letter['document'] = repr(document)
+                lines.append(serializer.dumps(letter))
+        with self._lock, open(self.dead_letter_path, 'ab') as f:
+            f.write(b''.join(line + b'\n' for line in lines))
+
+    def is_document_error(self, error: Exception, documents: List=None) -> bool:
+        """
+        Whether an error was caused by the documents sent, so that sending fewer of
+        them may succeed. A TypeError or ValueError only is when the documents
+        cannot be serialized.
+        """
+        if not isinstance(error, APIError):
+            return isinstance(error, self.SERIALIZATION_ERRORS) and not self._serializes(documents)
+        return getattr(error, 'status_code', None) in self.DOCUMENT_STATUS_CODES
+
+    @classmethod
+    def _serializes(cls, documents: List) -> bool:
+        try:
+            get_serializer().dumps(documents)
+        except cls.SERIALIZATION_ERRORS:
+            return False
+        return True
+
+    def _bisect(self, func: Callable[[List], Dict], documents: List, dead_lettered: List) -> List[str]:
+        """
+        Send documents, splitting them in halves on document errors. Returns the ids
+        the API reported as failed and adds the ids of documents written to the
+        dead-letter file to dead_lettered.
+        """
+        try:
+            result = func(documents)
+        except self.DOCUMENT_ERRORS as e:
+            if not self.is_document_error(e, documents):
+                raise
+            return self._split(func, documents, dead_lettered, e)
+        if str(result.get('status', '')).lower() == 'error':
+            return self._split(func, documents, dead_lettered, APIError(result.get('message')))
+        return [str(i) for i in result.get('failed_document_ids', [])]
+
+    def _split(self, func: Callable[[List], Dict], documents: List, dead_lettered: List,
+        error: Exception) -> List[str]:
+        """
+        Send the halves of documents that failed with error, or write a single
+        document to the dead-letter file.
+        """
+        if len(documents) > 1:
+            half = len(documents) // 2
+            return self._bisect(func, documents[:half], dead_lettered) + \
+                self._bisect(func, documents[half:], dead_lettered)
+        message = error.response_message if isinstance(error, APIError) else f"{type(error).__name__}: {error}"
+        self.write_dead_letters(documents, str(message), getattr(error, 'status_code', None))
+        dead_lettered.append(str(documents[0].get('_id')))
+        return []
+
+    def send(self, func: Callable[[List], Dict], documents: List) -> Dict:
+        """
+        Send a chunk with func, retrying and isolating failed documents.
+
+        Args:
+            func:
+                Sends a list of documents and returns the response, e.g. bulk_insert.
+            documents:
+                The chunk to send.
+
+        Returns:
+            The number of documents inserted and the ids of those that failed.
+        """
+        dead_lettered = []
+        failed_ids = self._bisect(func, documents, dead_lettered)
+        by_id = {str(d.get('_id')): d for d in documents}
+        for attempt in range(self.max_retries):
+            retry = [by_id[i] for i in failed_ids if i in by_id]
+            if len(retry) == 0:
+                break
+            time.sleep(self.retry_policy.get_backoff(attempt))
+            failed_ids = [i for i in failed_ids if i not in by_id] + self._bisect(func, retry, dead_lettered)
+        self.write_dead_letters([by_id[i] for i in failed_ids if i in by_id],
+            f"Reported as failed after {self.max_retries} retries")
+        failed_ids = dead_lettered + failed_ids
+        return {
+            'inserted_successfully': len(documents) - len(failed_ids),
+            'failed_document_ids': failed_ids,
+        }
@@ -1,14 +1,14 @@
 import io
 import base64
-import requests
-import pandas as pd
 import os
 import warnings
+import threading
 from .api.utils import return_curl_or_response
 from .write import ViWriteClient
 from .analytics.client import ViAnalyticsClient
 from .utils import decorate_functions_by_argument, set_default_collection
 from .errors import LoginError, APIError
+from .options import get_option
 
 class ViClient(ViWriteClient, ViAnalyticsClient):
     """
@@ -21,6 +21,13 @@ class ViClient(ViWriteClient, ViAnalyticsClient):
                 your api key for accessing vectorai
             url:
                 url of the deployed vectorai database
+            verbose:
+                If True, check the login details and print a welcome message.
+            login_check:
+                eager checks the login details before returning. background checks them
+                in a thread so that creating the client does not wait on a request; the
+                first request made by the client waits for the check and raises a
+                LoginError if it failed. Defaults to the login_check option.
 
         Example:
             >>> from vectorai.client import ViClient
@@ -34,7 +41,7 @@ class ViClient(ViWriteClient, ViAnalyticsClient):
         # Old API URL: https://vecdb-aueast-api.azurewebsites.net
         # url: str="https://vectorai-development-api-vectorai-test-api.azurewebsites.net/",
         url: str="https://vectorai-development-api.azurewebsites.net",
-        analytics_url="https://vector-analytics.vctr.ai", verbose: bool = True) -> None:
+        analytics_url="https://vector-analytics.vctr.ai", verbose: bool = True, login_check: str = None) -> None:
         super().__init__(username, api_key, url)
         if username is None:
             if 'VI_USERNAME' not in os.environ.keys():
@@ -52,10 +59,20 @@ class ViClient(ViWriteClient, ViAnalyticsClient):
         self.analytics_url = analytics_url
 
         if verbose:
-            self.check_login_details()
-            print(
-                f"Logged in. Welcome {self.username}. To view list of available collections, call list_collections() method."
-            )
+            if login_check is None:
+                login_check = get_option('login_check')
+            if login_check == 'background':
+                self._check_login_in_background()
+            elif login_check == 'eager':
+                self.check_login_details()
+                self._print_welcome()
+            else:
+                raise ValueError(f"Unknown login_check {login_check}. Choose one of eager or background.")
+
+    def _print_welcome(self):
+        print(
+            f"Logged in. Welcome {self.username}. To view list of available collections, call list_collections() method."
+        )
 
     def check_login_details(self):
         try:
@@ -63,6 +80,34 @@ class ViClient(ViWriteClient, ViAnalyticsClient):
         except:
             raise LoginError("Username, api key or url is incorrect.")
 
+    def _check_login_in_background(self):
+        """
+        Check the login details in a thread. Requests wait for the check to finish.
+        """
+        def check():
+            try:
+                self.check_login_details()
+                self._print_welcome()
+            except LoginError as e:
+                self._login_error = e
+        self._login_error = None
+        self._login_thread = threading.Thread(target=check, daemon=True)
+        self.on_request(self._wait_for_login)
+        self._login_thread.start()
+
+    def _wait_for_login(self, request):
+        thread = self.__dict__.get('_login_thread')
+        if thread is None or thread is threading.current_thread():
+            return
+        thread.join()
+        if self._login_error is not None:
+            raise self._login_error
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop('_login_thread', None)
+        return state
+
 def request_api_key(self,email, description, referral_code="api_referred", **kwargs):
 		"""Request an api key
 Make sure to save the api key somewhere safe. If you have a valid referral code, you can recieve the api key more quickly.
@@ -75,7 +120,7 @@ description: Description of your intended use case
 referral_code: The referral code you've been given to allow you to register for an api key before others
 
 """
-		return requests.post(
+		return self.session.post(
 			url='https://api.vctr.ai/project/request_api_key',
 			json=dict(
 				username=self.username,
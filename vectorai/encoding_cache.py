@@ -0,0 +1,260 @@
+"""
+    A cache of the vectors models return, so repeated values are only encoded once.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import types
+from functools import partial
+from typing import Any, Callable, List, Optional
+import numpy as np
+from .api.serializer import _default
+
+__all__ = ['EncodingCache']
+
+
+class EncodingCache:
+    """
+    Caches vectors by model and input value, in memory and optionally in a SQLite
+    file that persists across runs and processes.
+
+    The most recently used max_items vectors are kept in memory. The file keeps
+    up to max_disk_bytes of vectors and drops the least recently used ones when
+    it grows past that.
+
+    Models are told apart by their module, qualified name, name (see set_name) and
+    url, so two instances of the same model class with the same url share vectors.
+    Lambdas, functions defined inside other functions and instances of classes
+    without a url cannot be told apart this way, so they are not cached. Set a
+    cache_key attribute on a model to name it explicitly and cache it, which is
+    also needed for models with different weights but the same class and url.
+
+    Args:
+        max_items:
+            The number of vectors kept in memory.
+        path:
+            A SQLite file to keep vectors in. None keeps them in memory only.
+        max_disk_bytes:
+            The largest total size in bytes of the vectors kept in the file.
+
+    Example:
+        >>> from vectorai.encoding_cache import EncodingCache
+        >>> vi_client.encoding_cache = EncodingCache(path='encodings.cache')
+        >>> vi_client.insert_documents(collection_name, documents, models={'category': text_encoder.encode})
+    """
+    def __init__(self, max_items: int=100000, path: str=None, max_disk_bytes: int=1024 ** 3):
+        self.max_items = max_items
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._disk_bytes = None
+
+    def __getstate__(self):
+        # Each process opens its own connection to the file and keeps its own vectors in memory
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        state['_connection'] = None
+        state['_memory'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute("""CREATE TABLE IF NOT EXISTS vectors (
+                    key BLOB PRIMARY KEY, vector BLOB, size INTEGER, last_used REAL)""")
+                connection.execute("CREATE INDEX IF NOT EXISTS vectors_last_used ON vectors (last_used)")
+            self._disk_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM vectors").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def model_key(model) -> Optional[str]:
+        """
+        The name vectors of a model are cached under, or None if the model cannot
+        be told apart from other models and is not cached.
+        """
+        if getattr(model, 'cache_key', None) is not None:
+            return str(model.cache_key)
+        if isinstance(model, partial):
+            key = EncodingCache.model_key(model.func)
+            if key is None:
+                return None
+            return f"{key}{model.args!r}{sorted(model.keywords.items())!r}"
+        owner = getattr(model, '__self__', None)
+        if isinstance(owner, types.ModuleType):
+            # Builtin functions are bound to their module
+            owner = None
+        if owner is not None and getattr(owner, 'cache_key', None) is not None:
+            return f"{owner.cache_key}.{model.__name__}"
+        qualname = getattr(model, '__qualname__', None) or type(model).__qualname__
+        if '<lambda>' in qualname or '<locals>' in qualname:
+            return None
+        key = f"{getattr(model, '__module__', None) or type(model).__module__}.{qualname}"
+        name = getattr(model, '__name__', None)
+        if name is not None and not qualname.endswith(name):
+            key += f":{name}"
+        urls = 0
+        for attribute in ('url', 'model_url'):
+            value = getattr(owner if owner is not None else model, attribute, None)
+            if isinstance(value, str):
+                key += f"@{value}"
+                urls += 1
+        is_function = owner is None and isinstance(model, (types.FunctionType, types.BuiltinFunctionType))
+        if not is_function and urls == 0:
+            return None
+        return key
+
+    @staticmethod
+    def _key(model_key: str, value: Any) -> bytes:
+        if isinstance(value, str):
+            content = b's' + value.encode('utf-8')
+        else:
+            content = b'j' + json.dumps(value, sort_keys=True, default=_default).encode('utf-8')
+        return hashlib.blake2b(model_key.encode('utf-8') + b'\0' + content, digest_size=16).digest()
+
+    def _remember(self, key: bytes, vector):
+        # Call with the lock held
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _get(self, keys: List[bytes]) -> List:
+        vectors = [None] * len(keys)
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    vectors[i] = vector
+                else:
+                    missing.append(i)
+            if missing and self.path is not None:
+                connection = self._get_connection()
+                found = {}
+                wanted = list({keys[i] for i in missing})
+                for start in range(0, len(wanted), 500):
+                    batch = wanted[start : start + 500]
+                    found.update(connection.execute(
+                        f"SELECT key, vector FROM vectors WHERE key IN ({','.join('?' * len(batch))})", batch))
+                if found:
+                    with connection:
+                        connection.executemany("UPDATE vectors SET last_used = ? WHERE key = ?",
+                            [(time.time(), key) for key in found])
+                for i in missing:
+                    if keys[i] in found:
+                        vectors[i] = np.frombuffer(found[keys[i]], dtype=np.float64).tolist()
+                        self._remember(keys[i], vectors[i])
+            num_of_hits = sum(v is not None for v in vectors)
+            self.hits += num_of_hits
+            self.misses += len(keys) - num_of_hits
+        return vectors
+
+    def _put(self, keys: List[bytes], vectors: List):
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._remember(key, vector)
+            if self.path is None:
+                return
+            rows = []
+            now = time.time()
+            for key, vector in zip(keys, vectors):
+                try:
+                    blob = np.asarray(vector, dtype=np.float64).tobytes()
+                except (TypeError, ValueError):
+                    continue
+                rows.append((key, blob, len(blob), now))
+            connection = self._get_connection()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO vectors VALUES (?, ?, ?, ?)", rows)
+            self._disk_bytes += sum(row[2] for row in rows)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection):
+        # Drop the least recently used vectors until the file is 10% below its limit
+        target = 0.9 * self.max_disk_bytes
+        self._disk_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM vectors").fetchone()[0]
+        with connection:
+            while self._disk_bytes > target:
+                rows = connection.execute(
+                    "SELECT key, size FROM vectors ORDER BY last_used LIMIT 1000").fetchall()
+                if len(rows) == 0:
+                    break
+                removed, freed = [], 0
+                for key, size in rows:
+                    removed.append((key,))
+                    freed += size
+                    if self._disk_bytes - freed <= target:
+                        break
+                connection.executemany("DELETE FROM vectors WHERE key = ?", removed)
+                self._disk_bytes -= freed
+
+    def encode(self, model, value: Any, encode: Callable):
+        """
+        The vector of a value, from the cache or from calling encode(value).
+        """
+        model_key = self.model_key(model)
+        if model_key is None:
+            return encode(value)
+        key = self._key(model_key, value)
+        vector = self._get([key])[0]
+        if vector is None:
+            vector = encode(value)
+            self._put([key], [vector])
+        return vector
+
+    def bulk_encode(self, model, values: List, bulk_encode: Callable) -> List:
+        """
+        The vectors of values, calling bulk_encode once with the values that are not
+        cached. Each distinct value is encoded once.
+        """
+        model_key = self.model_key(model)
+        if model_key is None:
+            return list(bulk_encode(values))
+        keys = [self._key(model_key, v) for v in values]
+        vectors = self._get(keys)
+        missing = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], []).append(i)
+        if missing:
+            missing_keys = list(missing)
+            encoded = bulk_encode([values[missing[key][0]] for key in missing_keys])
+            self._put(missing_keys, list(encoded))
+            for key, vector in zip(missing_keys, encoded):
+                for i in missing[key]:
+                    vectors[i] = vector
+        return vectors
+
+    def clear(self):
+        """
+        Remove every cached vector from memory and from the file.
+        """
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                connection = self._get_connection()
+                with connection:
+                    connection.execute("DELETE FROM vectors")
+                self._disk_bytes = 0
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -4,17 +4,19 @@ class APIError(Exception):
     """Base error class for all errors in library
     """
 
-    def __init__(self, response_message: str=None):
+    def __init__(self, response_message: str=None, status_code: int=None):
         """
         The main Vi  base error.
 
         Args:
             response_message: THe error message
+            status_code: The HTTP status code of the response, if there was one
 
         Example:
             >>> raise APIError("Missing ____.")
         """
         self.response_message = response_message
+        self.status_code = status_code
 
 class MissingFieldWarning(APIError, UserWarning):
     """
@@ -0,0 +1,130 @@
+"""
+    Content fingerprints for skipping documents that have not changed since they were last written.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+from .api.serializer import _default
+
+__all__ = ['FingerprintStore']
+
+
+class FingerprintStore:
+    """
+    Keeps a hash of the content of every document written to a collection in a
+    SQLite file, so that writing the same documents again can skip those that
+    have not changed, including encoding them.
+
+    The hash of an inserted document leaves out vector fields (fields ending in
+    _vector_) and insert_date_, so a document encoded with a new model still counts
+    as unchanged. Edits are kept apart from inserts and hash every edited field,
+    vectors included, so an edit that only changes vectors is still written.
+    Documents without an _id are always written.
+
+    Args:
+        path:
+            The fingerprint file. It is created if it does not exist.
+
+    Example:
+        >>> from vectorai.fingerprints import FingerprintStore
+        >>> vi_client.insert_documents(collection_name, documents, fingerprints='catalogue.fingerprints')
+        >>> # The next day only new and changed documents are encoded and inserted
+        >>> vi_client.insert_documents(collection_name, documents, fingerprints='catalogue.fingerprints')
+    """
+    IGNORED_FIELDS = frozenset(['insert_date_'])
+    # SQLite limits the number of parameters in a query
+    LOOKUP_CHUNKSIZE = 500
+    TABLES = ('fingerprints', 'edit_fingerprints')
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for table in self.TABLES:
+                self._connection.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+                    collection_name TEXT, document_id TEXT, fingerprint TEXT,
+                    PRIMARY KEY (collection_name, document_id))""")
+
+    @classmethod
+    def _content(cls, value, vectors: bool=False):
+        if isinstance(value, dict):
+            return {k: cls._content(v, vectors) for k, v in value.items()
+                if vectors or k not in cls.IGNORED_FIELDS and not str(k).endswith('_vector_')}
+        if isinstance(value, list):
+            return [cls._content(v, vectors) for v in value]
+        return value
+
+    @classmethod
+    def fingerprint(cls, document: Dict, vectors: bool=False) -> str:
+        """
+        The hash of the content of a document, leaving out vectors and insert_date_
+        unless vectors is True.
+        """
+        content = json.dumps(cls._content(document, vectors), sort_keys=True, default=_default)
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+    @classmethod
+    def _table(cls, edits: bool) -> str:
+        return cls.TABLES[1] if edits else cls.TABLES[0]
+
+    def lookup(self, collection_name: str, document_ids: List[str], edits: bool=False) -> Dict[str, str]:
+        """
+        The stored fingerprints of the documents that have one, of their edits if edits is True.
+        """
+        fingerprints = {}
+        with self._lock:
+            for i in range(0, len(document_ids), self.LOOKUP_CHUNKSIZE):
+                ids = document_ids[i : i + self.LOOKUP_CHUNKSIZE]
+                rows = self._connection.execute(
+                    f"""SELECT document_id, fingerprint FROM {self._table(edits)}
+                    WHERE collection_name = ? AND document_id IN ({','.join('?' * len(ids))})""",
+                    [collection_name] + ids)
+                fingerprints.update(rows)
+        return fingerprints
+
+    def changed(self, collection_name: str, documents: List[Dict], edits: bool=False) -> List[Tuple[Dict, str]]:
+        """
+        The documents that are new or changed since they were recorded, each with its
+        fingerprint to record once it is written. Documents without an _id are kept
+        with a fingerprint of None. If edits is True, documents are edits, compared
+        with every field, vectors included, to the last edits recorded.
+        """
+        keyed = [(d, str(d['_id']) if '_id' in d else None, self.fingerprint(d, vectors=edits)) for d in documents]
+        stored = self.lookup(collection_name, [k for _, k, _ in keyed if k is not None], edits)
+        return [(d, None if k is None else f) for d, k, f in keyed if k is None or stored.get(k) != f]
+
+    def record(self, collection_name: str, fingerprints: List[Tuple[str, str]], edits: bool=False):
+        """
+        Store the fingerprints of written documents, or of edits if edits is True, as
+        (document id, fingerprint) pairs.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(f"INSERT OR REPLACE INTO {self._table(edits)} VALUES (?, ?, ?)",
+                [(collection_name, str(i), f) for i, f in fingerprints])
+
+    def forget(self, collection_name: str, document_ids: List[str]=None):
+        """
+        Remove the fingerprints of documents, or of a whole collection, so they are written again.
+        """
+        with self._lock, self._connection:
+            for table in self.TABLES:
+                if document_ids is None:
+                    self._connection.execute(f"DELETE FROM {table} WHERE collection_name = ?", (collection_name,))
+                else:
+                    self._connection.executemany(
+                        f"DELETE FROM {table} WHERE collection_name = ? AND document_id = ?",
+                        [(collection_name, str(i)) for i in document_ids])
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,107 @@
+"""
+    A checkpoint journal for resuming inserts that stopped part way.
+"""
+import bisect
+import sqlite3
+import threading
+from typing import List, Tuple
+
+__all__ = ['InsertJournal']
+
+
+class InsertJournal:
+    """
+    Records which documents of an insert the API has acknowledged in a SQLite file,
+    so that a restarted insert skips them instead of sending them again.
+
+    Documents are identified by their position in the input, so a resumed insert
+    must be given the same documents in the same order. Every acknowledged chunk
+    is stored as the range of positions it covered along with the ids of the
+    documents the API reported as failed.
+
+    Args:
+        path:
+            The journal file. It is created if it does not exist.
+        collection_name:
+            The collection being inserted into. A journal cannot be reused for a
+            different collection.
+
+    Example:
+        >>> vi_client.insert_documents(collection_name, documents, journal='load.journal')
+        >>> # After a crash, the same call inserts only the documents not yet acknowledged
+        >>> vi_client.insert_documents(collection_name, documents, journal='load.journal')
+        >>> InsertJournal('load.journal').failed_document_ids()
+    """
+    def __init__(self, path: str, collection_name: str=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS chunks (start INTEGER, end INTEGER)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS failed (document_id TEXT, start INTEGER)")
+        if collection_name is not None:
+            self._check_collection_name(collection_name)
+        self._load_spans()
+
+    def _check_collection_name(self, collection_name: str):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'collection_name'").fetchone()
+        if row is None:
+            with self._connection:
+                self._connection.execute("INSERT INTO meta VALUES ('collection_name', ?)", (collection_name,))
+        elif row[0] != collection_name:
+            raise ValueError(f"The journal {self.path} belongs to an insert into {row[0]}, not {collection_name}.")
+
+    def _load_spans(self):
+        # Merge touching ranges so lookups stay fast for long journals
+        spans = []
+        for start, end in self._connection.execute("SELECT start, end FROM chunks ORDER BY start"):
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        self._starts = [start for start, _ in spans]
+        self._spans = spans
+
+    @property
+    def num_of_documents(self) -> int:
+        """
+        The number of documents acknowledged when the journal was opened.
+        """
+        return sum(end - start for start, end in self._spans)
+
+    def is_done(self, position: int) -> bool:
+        """
+        Whether the document at a position of the input was acknowledged before the
+        journal was opened.
+        """
+        i = bisect.bisect_right(self._starts, position) - 1
+        return i >= 0 and position < self._spans[i][1]
+
+    def record_chunk(self, span: Tuple[int, int], failed_document_ids: List[str]=[]):
+        """
+        Record that the API acknowledged the documents from span[0] up to but not
+        including span[1].
+        """
+        with self._lock, self._connection:
+            self._connection.execute("INSERT INTO chunks VALUES (?, ?)", span)
+            self._connection.executemany("INSERT INTO failed VALUES (?, ?)",
+                [(str(i), span[0]) for i in failed_document_ids])
+
+    def failed_document_ids(self) -> List[str]:
+        """
+        The ids of every document the API reported as failed.
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT document_id FROM failed ORDER BY start")]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,628 @@
+"""
+    In-process stand-in for the Vector AI REST API.
+
+    LocalViServer serves the endpoints ViClient relies on most from memory so the
+    client can be tested and benchmarked without a live deployment. Search is brute
+    force with numpy and the encoders return deterministic pseudo-random vectors, so
+    results are only meaningful for vectors you insert yourself.
+"""
+import re
+import gzip
+import json
+import time
+import uuid
+import hashlib
+import datetime
+import threading
+import numpy as np
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from typing import Dict, List
+from .api.serializer import get_serializer
+from .api.compression import zstandard
+from .api.wire import (encode_vectors, decode_vectors, _is_vector_field,
+    VECTOR_ENCODING_HEADER, ACCEPT_VECTOR_ENCODING_HEADER)
+
+__all__ = ['LocalViServer']
+
+_MISSING = object()
+_DISTANCE_METRICS = ('l1', 'l2')
+
+
+class _LocalAPIError(Exception):
+    def __init__(self, message: str, status: int=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _get_field(document: Dict, field: str):
+    """
+    Return a dotted field of a document or _MISSING.
+    """
+    value = document
+    for f in field.split('.'):
+        if not isinstance(value, dict) or f not in value:
+            return _MISSING
+        value = value[f]
+    return value
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ('true', '1')
+    return bool(value)
+
+
+def _to_list(value) -> List:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _infer_type(field: str, value):
+    if _is_vector_field(field):
+        return len(value)
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, (int, float, np.number)):
+        return 'numeric'
+    if isinstance(value, str):
+        try:
+            datetime.datetime.fromisoformat(value)
+            return 'date'
+        except ValueError:
+            return 'text'
+    if isinstance(value, dict):
+        return 'dict'
+    if isinstance(value, (list, tuple)):
+        if len(value) > 0 and isinstance(value[0], dict):
+            return 'chunk'
+        return 'text'
+    return 'text'
+
+
+def _infer_schema(document: Dict, prefix: str='') -> Dict:
+    schema = {}
+    for k, v in document.items():
+        if k == '_id':
+            continue
+        field = prefix + k
+        if isinstance(v, dict) and not _is_vector_field(k):
+            schema.update(_infer_schema(v, field + '.'))
+        else:
+            schema[field] = _infer_type(k, v)
+    return schema
+
+
+def _strip_vectors(document):
+    if isinstance(document, dict):
+        return {k: _strip_vectors(v) for k, v in document.items() if not _is_vector_field(k)}
+    if isinstance(document, list):
+        return [_strip_vectors(x) for x in document]
+    return document
+
+
+def _select_fields(document: Dict, include_fields: List[str], include_vector: bool) -> Dict:
+    if include_fields:
+        roots = {f.split('.')[0] for f in include_fields}
+        document = {k: v for k, v in document.items() if k in roots or k == '_id'}
+    if not include_vector:
+        document = _strip_vectors(document)
+    return document
+
+
+def _compare(value, condition: str, condition_value) -> bool:
+    if condition == '==':
+        return value == condition_value
+    if condition == '!=':
+        return value != condition_value
+    if condition == '>=':
+        return value >= condition_value
+    if condition == '>':
+        return value > condition_value
+    if condition == '<=':
+        return value <= condition_value
+    if condition == '<':
+        return value < condition_value
+    raise _LocalAPIError(f"Unknown condition {condition}.")
+
+
+def _matches(document: Dict, query: Dict) -> bool:
+    """
+    Whether a document matches one filter of a filters query.
+    """
+    filter_type = query['filter_type']
+    condition = query.get('condition', '==')
+    condition_value = query.get('condition_value')
+    if filter_type == 'ids':
+        return (str(document['_id']) in [str(x) for x in _to_list(condition_value)]) == (condition == '==')
+    value = _get_field(document, query['field'])
+    if filter_type == 'exists':
+        return (value is not _MISSING) == (condition == '==')
+    if value is _MISSING:
+        return False
+    if filter_type == 'contains':
+        matched = str(condition_value).lower() in str(value).lower()
+    elif filter_type == 'regexp':
+        matched = re.fullmatch(str(condition_value), str(value), flags=re.IGNORECASE | re.DOTALL) is not None
+    elif filter_type in ('exact_match', 'category'):
+        matched = value in condition_value if isinstance(condition_value, list) else value == condition_value
+    elif filter_type == 'categories':
+        values = set(_to_list(value))
+        matched = len(values.intersection(_to_list(condition_value))) > 0
+    elif filter_type in ('numeric', 'date'):
+        if filter_type == 'numeric':
+            value, condition_value = float(value), float(condition_value)
+        else:
+            value, condition_value = str(value), str(condition_value)
+        return _compare(value, condition, condition_value)
+    else:
+        raise _LocalAPIError(f"Unknown filter_type {filter_type}.")
+    return matched == (condition != '!=')
+
+
+def _pseudo_vector(value: str, dimension: int) -> List[float]:
+    """
+    A deterministic unit vector for a string, standing in for a real encoder.
+    """
+    seed = int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'little')
+    vector = np.random.default_rng(seed).standard_normal(dimension)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class _Collection:
+    def __init__(self, schema: Dict=None):
+        self.schema = dict(schema or {})
+        self.documents = {}
+
+    def update_schema(self, document: Dict):
+        for field, field_type in _infer_schema(document).items():
+            self.schema.setdefault(field, field_type)
+
+    def check_document(self, document: Dict):
+        """
+        Raise if a vector field does not have the length given in the schema.
+        """
+        for field, value in document.items():
+            if _is_vector_field(field):
+                length = self.schema.get(field)
+                if not isinstance(value, (list, tuple, np.ndarray)):
+                    raise _LocalAPIError(f"{field} is not a vector.")
+                if isinstance(length, int) and len(value) != length:
+                    raise _LocalAPIError(f"{field} has length {len(value)} instead of {length}.")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Dispatches every request to the LocalViServer that owns the HTTP server.
+    """
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which stalls on delayed ACKs with Nagle
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.vi_server._handle(self)
+
+    def do_POST(self):
+        self.server.vi_server._handle(self)
+
+
+class LocalViServer:
+    """
+    An in-memory server implementing the core Vector AI endpoints on localhost.
+
+    It understands gzip and zstd request bodies, the vector wire encoding and gzip
+    responses, so the whole request path of the client is exercised.
+
+    Args:
+        username:
+            If set, requests with another username or api key are rejected with a 401.
+        api_key:
+            The api key to accept together with username.
+        latency:
+            Seconds to wait before answering every request, to mimic a remote server.
+        max_body_size:
+            Request bodies larger than this many bytes are rejected with a 413.
+        encoding_dimension:
+            The length of the vectors returned by the encode endpoints.
+        host:
+            The host to bind to.
+        port:
+            The port to bind to. 0 picks a free port.
+
+    Example:
+        >>> from vectorai import ViClient
+        >>> from vectorai.local_server import LocalViServer
+        >>> with LocalViServer() as server:
+        >>>     vi_client = ViClient("username", "api_key", url=server.url)
+        >>>     vi_client.insert_documents("test_collection", vi_client.create_sample_documents(100))
+    """
+    def __init__(self, username: str=None, api_key: str=None, latency: float=0,
+        max_body_size: int=None, encoding_dimension: int=512, host: str='127.0.0.1', port: int=0):
+        self.username = username
+        self.api_key = api_key
+        self.latency = latency
+        self.max_body_size = max_body_size
+        self.encoding_dimension = encoding_dimension
+        self.collections = {}
+        self.request_count = 0
+        self.serializer = get_serializer()
+        self._lock = threading.RLock()
+        self._failures = []
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.vi_server = self
+        self._thread = None
+        self.endpoints = {
+            '/project/list_collections': self.list_collections,
+            '/project/create_collection': self.create_collection,
+            '/project/create_collection_from_document': self.create_collection_from_document,
+            '/project/delete_collection': self.delete_collection,
+            '/project/collection_stats': self.collection_stats,
+            '/project/collection_schema': self.collection_schema,
+            '/collection/insert': self.insert,
+            '/collection/bulk_insert': self.bulk_insert,
+            '/collection/retrieve_documents': self.retrieve_documents,
+            '/collection/retrieve_documents_with_filters': self.retrieve_documents,
+            '/collection/random_documents': self.random_documents,
+            '/collection/id': self.id,
+            '/collection/bulk_id': self.bulk_id,
+            '/collection/bulk_missing_id': self.bulk_missing_id,
+            '/collection/edit_document': self.edit_document,
+            '/collection/bulk_edit_document': self.bulk_edit_document,
+            '/collection/delete_by_id': self.delete_by_id,
+            '/collection/bulk_delete_by_id': self.bulk_delete_by_id,
+            '/collection/filters': self.filters,
+            '/collection/advanced_search': self.advanced_search,
+            '/collection/encode_text': self.encode_text,
+            '/collection/bulk_encode_text': self.bulk_encode_text,
+            '/collection/encode_image': self.encode_image,
+            '/collection/bulk_encode_image': self.bulk_encode_image,
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Serve requests in a background thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the socket.
+        """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def fail_next(self, status: int=503, count: int=1, retry_after: float=None):
+        """
+        Answer the next count requests with an error status, e.g. to test retries.
+        """
+        with self._lock:
+            self._failures += [(status, retry_after)] * count
+
+    def _reply(self, handler, status: int, payload, headers: Dict={}):
+        accept_encoding = handler.headers.get('Accept-Encoding', '')
+        vector_encoding = handler.headers.get(ACCEPT_VECTOR_ENCODING_HEADER)
+        headers = dict(headers)
+        if vector_encoding is not None and status == 200:
+            payload = encode_vectors(payload, vector_encoding)
+            headers[VECTOR_ENCODING_HEADER] = vector_encoding
+        content = self.serializer.dumps(payload)
+        if 'gzip' in accept_encoding and len(content) > 1024:
+            content = gzip.compress(content, compresslevel=1)
+            headers['Content-Encoding'] = 'gzip'
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(content)))
+        for k, v in headers.items():
+            handler.send_header(k, v)
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _read_body(self, handler) -> Dict:
+        length = int(handler.headers.get('Content-Length') or 0)
+        if self.max_body_size is not None and length > self.max_body_size:
+            handler.rfile.read(length)
+            raise _LocalAPIError(f"Request body of {length} bytes is too large.", 413)
+        body = handler.rfile.read(length)
+        content_encoding = handler.headers.get('Content-Encoding')
+        if content_encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif content_encoding == 'zstd':
+            body = zstandard.ZstdDecompressor().decompress(body)
+        elif content_encoding is not None:
+            raise _LocalAPIError(f"Unsupported Content-Encoding {content_encoding}.", 415)
+        if len(body) == 0:
+            return {}
+        payload = json.loads(body)
+        vector_encoding = handler.headers.get(VECTOR_ENCODING_HEADER)
+        if vector_encoding is not None:
+            decode_vectors(payload, vector_encoding)
+        return payload
+
+    def _handle(self, handler):
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlparse(handler.path)
+        try:
+            with self._lock:
+                self.request_count += 1
+                failure = self._failures.pop(0) if self._failures else None
+            params = {k: v[0] if len(v) == 1 else v for k, v in parse_qs(url.query).items()}
+            if handler.command == 'POST':
+                params.update(self._read_body(handler))
+            if failure is not None:
+                status, retry_after = failure
+                headers = {} if retry_after is None else {'Retry-After': str(retry_after)}
+                return self._reply(handler, status, {'message': 'Injected failure.'}, headers)
+            if url.path.rstrip('/') not in self.endpoints:
+                raise _LocalAPIError(f"{url.path} is not implemented by the local server.", 404)
+            if self.username is not None and (
+                params.get('username') != self.username or params.get('api_key') != self.api_key):
+                raise _LocalAPIError("Username or api key is incorrect.", 401)
+            with self._lock:
+                payload = self.endpoints[url.path.rstrip('/')](**params)
+            self._reply(handler, 200, payload)
+        except _LocalAPIError as e:
+            self._reply(handler, e.status, {'status': 'error', 'message': str(e)})
+        except (KeyError, TypeError, ValueError) as e:
+            self._reply(handler, 400, {'status': 'error', 'message': f"{type(e).__name__}: {e}"})
+
+    def _get_collection(self, collection_name: str) -> _Collection:
+        if collection_name not in self.collections:
+            raise _LocalAPIError(f"Collection {collection_name} does not exist.")
+        return self.collections[collection_name]
+
+    def _filter_documents(self, collection_name: str, filters: List[Dict]=[]) -> List[Dict]:
+        documents = self._get_collection(collection_name).documents.values()
+        return [d for d in documents if all(_matches(d, f) for f in filters)]
+
+    @staticmethod
+    def _sort_documents(documents: List[Dict], sort: List[str], asc: bool) -> List[Dict]:
+        for field in reversed(sort):
+            present = [d for d in documents if _get_field(d, field) is not _MISSING]
+            missing = [d for d in documents if _get_field(d, field) is _MISSING]
+            documents = sorted(present, key=lambda d: _get_field(d, field), reverse=not asc) + missing
+        return documents
+
+    def list_collections(self, **kwargs) -> List[str]:
+        return sorted(self.collections)
+
+    def create_collection(self, collection_name: str, collection_schema: Dict={}, **kwargs):
+        if collection_name in self.collections:
+            raise _LocalAPIError(f"Collection {collection_name} already exists.")
+        self.collections[collection_name] = _Collection(collection_schema)
+        return {'status': 'complete', 'message': f"Collection {collection_name} created."}
+
+    def create_collection_from_document(self, collection_name: str, document: Dict={}, **kwargs):
+        self.create_collection(collection_name, _infer_schema(document))
+        return {'status': 'complete', 'message': f"Collection {collection_name} created."}
+
+    def delete_collection(self, collection_name: str, **kwargs):
+        self._get_collection(collection_name)
+        del self.collections[collection_name]
+        return {'status': 'complete', 'message': f"Collection {collection_name} deleted."}
+
+    def collection_stats(self, collection_name: str, **kwargs):
+        collection = self._get_collection(collection_name)
+        return {
+            'number_of_documents': len(collection.documents),
+            'number_of_fields': len(collection.schema),
+        }
+
+    def collection_schema(self, collection_name: str, **kwargs):
+        return self._get_collection(collection_name).schema
+
+    def _insert(self, collection: _Collection, document: Dict, insert_date: bool, overwrite: bool, update_schema: bool):
+        document = dict(document)
+        document['_id'] = str(document.get('_id', uuid.uuid4()))
+        collection.check_document(document)
+        if document['_id'] in collection.documents and not overwrite:
+            return
+        if insert_date:
+            document['insert_date_'] = datetime.datetime.now().isoformat()
+        if update_schema:
+            collection.update_schema(document)
+        collection.documents[document['_id']] = document
+
+    def insert(self, collection_name: str, document: Dict, insert_date=True, overwrite=True, update_schema=True, **kwargs):
+        collection = self._get_collection(collection_name)
+        self._insert(collection, document, _to_bool(insert_date), _to_bool(overwrite), _to_bool(update_schema))
+        return {'status': 'success'}
+
+    def bulk_insert(self, collection_name: str, documents: List[Dict], insert_date=True, overwrite=True,
+        update_schema=True, **kwargs):
+        collection = self._get_collection(collection_name)
+        failed_document_ids = []
+        for document in documents:
+            try:
+                self._insert(collection, document, _to_bool(insert_date), _to_bool(overwrite), _to_bool(update_schema))
+            except _LocalAPIError:
+                failed_document_ids.append(str(document.get('_id')))
+        return {
+            'inserted_successfully': len(documents) - len(failed_document_ids),
+            'failed_document_ids': failed_document_ids,
+        }
+
+    def retrieve_documents(self, collection_name: str, include_fields=[], cursor=None, page_size=20, sort=[],
+        asc=False, include_vector=True, filters=[], **kwargs):
+        documents = self._sort_documents(self._filter_documents(collection_name, filters),
+            _to_list(sort), _to_bool(asc))
+        start = int(cursor) if cursor else 0
+        end = start + int(page_size)
+        include_fields, include_vector = _to_list(include_fields), _to_bool(include_vector)
+        return {
+            'documents': [_select_fields(d, include_fields, include_vector) for d in documents[start:end]],
+            'cursor': str(min(end, len(documents))),
+        }
+
+    def random_documents(self, collection_name: str, seed=10, include_fields=[], page_size=20,
+        include_vector=True, filters=[], **kwargs):
+        documents = self._filter_documents(collection_name, filters)
+        rng = np.random.default_rng(int(seed))
+        indices = rng.permutation(len(documents))[:int(page_size)]
+        include_fields, include_vector = _to_list(include_fields), _to_bool(include_vector)
+        return {'documents': [_select_fields(documents[i], include_fields, include_vector) for i in indices]}
+
+    def id(self, collection_name: str, document_id: str, include_vector=True, **kwargs):
+        documents = self._get_collection(collection_name).documents
+        if document_id not in documents:
+            raise _LocalAPIError(f"Document {document_id} does not exist.")
+        return _select_fields(documents[document_id], [], _to_bool(include_vector))
+
+    def bulk_id(self, collection_name: str, document_ids=[], include_vector=True, **kwargs):
+        documents = self._get_collection(collection_name).documents
+        return [_select_fields(documents[i], [], _to_bool(include_vector))
+            for i in _to_list(document_ids) if i in documents]
+
+    def bulk_missing_id(self, collection_name: str, document_ids=[], **kwargs):
+        documents = self._get_collection(collection_name).documents
+        return [i for i in _to_list(document_ids) if str(i) not in documents]
+
+    def _edit(self, collection: _Collection, document_id: str, edits: Dict, insert_date: bool):
+        if document_id not in collection.documents:
+            raise _LocalAPIError(f"Document {document_id} does not exist.")
+        collection.check_document(edits)
+        document = collection.documents[document_id]
+        for field, value in edits.items():
+            if field == '_id':
+                continue
+            d = document
+            *parents, last = field.split('.')
+            for f in parents:
+                d = d.setdefault(f, {})
+            d[last] = value
+        if insert_date:
+            document['insert_date_'] = datetime.datetime.now().isoformat()
+        collection.update_schema(edits)
+
+    def edit_document(self, collection_name: str, document_id: str, edits: Dict={}, insert_date=True, **kwargs):
+        try:
+            self._edit(self._get_collection(collection_name), str(document_id), edits, _to_bool(insert_date))
+        except _LocalAPIError as e:
+            if e.status != 400:
+                raise
+            return 'failed'
+        return 'success'
+
+    def bulk_edit_document(self, collection_name: str, documents: List[Dict]=[], insert_date=True, **kwargs):
+        collection = self._get_collection(collection_name)
+        failed_document_ids = []
+        for document in documents:
+            try:
+                self._edit(collection, str(document['_id']), document, _to_bool(insert_date))
+            except _LocalAPIError:
+                failed_document_ids.append(str(document['_id']))
+        return {
+            'edited_successfully': len(documents) - len(failed_document_ids),
+            'failed_document_ids': failed_document_ids,
+        }
+
+    def delete_by_id(self, collection_name: str, document_id: str, **kwargs):
+        self._get_collection(collection_name).documents.pop(document_id, None)
+        return {'status': 'complete'}
+
+    def bulk_delete_by_id(self, collection_name: str, document_ids=[], **kwargs):
+        documents = self._get_collection(collection_name).documents
+        for i in _to_list(document_ids):
+            documents.pop(str(i), None)
+        return {'status': 'complete'}
+
+    def filters(self, collection_name: str, filters=[], page=1, page_size=20, asc=False, include_vector=False,
+        sort=[], **kwargs):
+        documents = self._sort_documents(self._filter_documents(collection_name, filters),
+            _to_list(sort), _to_bool(asc))
+        start = (int(page) - 1) * int(page_size)
+        return {
+            'results': [_select_fields(d, [], _to_bool(include_vector)) for d in documents[start:start + int(page_size)]],
+            'count': len(documents),
+        }
+
+    @staticmethod
+    def _score(matrix: np.ndarray, vector: np.ndarray, metric: str) -> np.ndarray:
+        if metric == 'cosine':
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+            return (matrix @ vector) / np.where(norms == 0, 1, norms)
+        if metric == 'dp':
+            return matrix @ vector
+        if metric == 'l2':
+            return np.linalg.norm(matrix - vector, axis=1)
+        if metric == 'l1':
+            return np.abs(matrix - vector).sum(axis=1)
+        raise _LocalAPIError(f"Unknown metric {metric}. Choose from ['cosine', 'l1', 'l2', 'dp'].")
+
+    def advanced_search(self, collection_name: str, multivector_query: Dict, page=1, page_size=20, sum_fields=True,
+        metric='cosine', filters=[], min_score=None, include_fields=[], include_vector=False, include_count=True,
+        hundred_scale=False, asc=False, **kwargs):
+        documents = self._filter_documents(collection_name, filters)
+        field_scores = []
+        valid = np.ones(len(documents), dtype=bool)
+        for query in multivector_query.values():
+            vector = np.asarray(query['vector'], dtype=np.float32)
+            fields = query['fields']
+            weights = fields if isinstance(fields, dict) else {f: 1 for f in fields}
+            for field, weight in weights.items():
+                matrix = np.zeros((len(documents), len(vector)), dtype=np.float32)
+                for i, d in enumerate(documents):
+                    value = _get_field(d, field)
+                    if value is _MISSING or len(value) != len(vector):
+                        valid[i] = False
+                    else:
+                        matrix[i] = value
+                field_scores.append(weight * self._score(matrix, vector, metric))
+        if len(field_scores) == 0:
+            raise _LocalAPIError("multivector_query has no fields to search.")
+        scores = np.sum(field_scores, axis=0) if _to_bool(sum_fields) else np.max(field_scores, axis=0)
+        if metric == 'cosine' and _to_bool(hundred_scale):
+            scores = scores * 100
+        if min_score is not None:
+            valid &= scores <= min_score if metric in _DISTANCE_METRICS else scores >= min_score
+        # Most similar first unless asc, where distances are most similar when smallest
+        order = np.argsort(scores, kind='stable')
+        if (metric in _DISTANCE_METRICS) == _to_bool(asc):
+            order = order[::-1]
+        order = [i for i in order if valid[i]]
+        start = (int(page) - 1) * int(page_size)
+        results = []
+        for i in order[start:start + int(page_size)]:
+            document = _select_fields(documents[i], _to_list(include_fields), _to_bool(include_vector))
+            document['_search_score'] = float(scores[i])
+            results.append(document)
+        response = {'results': results}
+        if _to_bool(include_count):
+            response['count'] = len(order)
+        return response
+
+    def encode_text(self, text: str, **kwargs):
+        return _pseudo_vector(text, self.encoding_dimension)
+
+    def bulk_encode_text(self, texts=[], **kwargs):
+        return [_pseudo_vector(t, self.encoding_dimension) for t in _to_list(texts)]
+
+    def encode_image(self, image_url: str, **kwargs):
+        return _pseudo_vector(image_url, self.encoding_dimension)
+
+    def bulk_encode_image(self, image_urls=[], **kwargs):
+        return [_pseudo_vector(u, self.encoding_dimension) for u in _to_list(image_urls)]
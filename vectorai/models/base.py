@@ -1,14 +1,16 @@
 """Base class for models
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Iterable, Iterator
 import json
-import gc
 import os
+import itertools
+import numpy as np
 from appdirs import *
 from ..client import ViWriteClient
+from ..doc_utils import DocUtilsMixin
 
-class _Vi2Vec(ViWriteClient):
+class _Vi2Vec(ViWriteClient, DocUtilsMixin):
     """
     Abstract class for text models. We inherit from the base class to make use of the ability to write 
     to nested dictionaries and other utilities that will be helpful.
@@ -102,28 +104,81 @@ class ViText2Vec(_Vi2Vec):
     def bulk_encode(self, *args, **kwargs):
         return self.bulk_encode_text(*args, **kwargs)
 
+    # The number of texts encoded at a time when no chunk size is given
+    encode_batch_size = 32
+
+    def encode_text_batch(self, texts: List[str]):
+        """
+            Encodes a batch of strings to a (texts, vector length) array. Override this
+            when the model can encode a batch faster than one text at a time.
+        """
+        return [self.encode_text(text=t) for t in texts]
+
+    def iter_encode_text(self, texts: Iterable[str], chunk_size: int = None) -> Iterator[np.ndarray]:
+        """
+            Encodes strings a batch at a time, yielding a float32 array of the vectors
+            of each batch. texts is read lazily, so it can be a generator.
+
+            Args:
+                texts:
+                    The strings to encode.
+                chunk_size (batch size):
+                    The number of strings encoded at a time. Defaults to encode_batch_size.
+
+            Example::
+
+                >>> from vectorai.client import Transformer2Vec
+                >>> model_transformer = Transformer2Vec('distilbert')
+                >>> for vectors in model_transformer.iter_encode_text(open('sentences.txt')):
+                >>>     index.add(vectors)
+        """
+        chunk_size = chunk_size or self.encode_batch_size
+        iterator = iter(texts)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if len(chunk) == 0:
+                return
+            yield np.asarray(self.encode_text_batch(chunk), dtype=np.float32)
+
+    def _encode_text_to_array(self, texts: List[str], chunk_size: int = None) -> np.ndarray:
+        """
+            Encodes strings into one float32 array, allocated once the vector length is known.
+        """
+        vectors = None
+        start = 0
+        for batch in self.iter_encode_text(texts, chunk_size=chunk_size):
+            if vectors is None:
+                vectors = np.empty((len(texts),) + batch.shape[1:], dtype=np.float32)
+            vectors[start : start + len(batch)] = batch
+            start += len(batch)
+        return vectors if vectors is not None else np.empty((0, 0), dtype=np.float32)
+
     def bulk_encode_text(
         self,
         documents: Union[List[str], List[Dict]],
         document_fields: str = None,
         vector_output_field: str = None,
-        chunk_size: int = 10,
-    ) -> List[float]:
+        chunk_size: int = None,
+    ) -> np.ndarray:
         """
-            Encodes either a list of strings or a list of documents. This can be over-ridden if bulk-encoding is supported
-            outside of list comprehension.
+            Encodes either a list of strings or a list of documents. Texts are encoded
+            chunk_size at a time with encode_text_batch, which can be over-ridden if
+            bulk-encoding is supported outside of list comprehension.
             Currently only supports 1 input text field.
-            Bulk encoding text assumes that bulk-encoding is best done via list comprehension of encode_text.
 
             Args:
                 documents:
-                    A list of Python dictionaries
+                    A list of strings or Python dictionaries
                 document_fields
                     The fields to encode
                 vector_output_field:
-                    The name of the vector output
-                chunk_size (batch size): 
-                    The number of documents to encode.
+                    The name of the vector output. Defaults to the field followed by _vector_.
+                chunk_size (batch size):
+                    The number of documents to encode at a time. Defaults to encode_batch_size.
+
+            Returns:
+                A float32 array with the vector of each string or document in a row.
+                Documents are also updated with their vectors.
 
             Example::
 
@@ -131,45 +186,33 @@ class ViText2Vec(_Vi2Vec):
                 >>> sample_docs = [{'name': 'bert', 'age": 10}, {'name': 'elmo', 'age': 15}]
                 >>> model_transformer = Transformer2Vec('distilbert')
                 >>> model_transformer.bulk_encode(sample_docs, "name")
-        
+                >>> model_transformer.bulk_encode(["bert", "elmo"], chunk_size=64)
+
         """
-        if vector_output_field is None:
-            vector_output_field = document_fields + '_vector_'
-        
+        if len(documents) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+
         if isinstance(documents[0], str):
+            # typechecking to ensure correct input is fed in.
             assert (
                 document_fields is None
             ), "You cannot have an input text field if you are just feeding in a list of documents."
             assert (
                 vector_output_field is None
-            ), "You cannot have a vector output field if you are feeding i- Overfitting does not seem to provide good results. "
-            # typechecking to ensure correct input is fed in.
-            all_vectors = []
-            for chunk in self.chunk(documents, chunk_size=chunk_size):
-                all_vectors.append(self.encode_text(chunk))
-            return all_vectors
+            ), "You cannot have a vector output field if you are feeding in a list of strings."
+            return self._encode_text_to_array(documents, chunk_size=chunk_size)
 
         if isinstance(documents[0], dict):
             assert (
                 document_fields is not None
             ), "You need a text input field if you are not feeding in at a document level."
-            assert (
-                vector_output_field is not None
-            ), "You need a vector output field if you are feeding in at a document level."
-            for chunk in self.chunk(documents, chunk_size=chunk_size):
-                # List comprehension of the text encoding methodology.
-                vectors = [
-                    self.encode_text(document=x, document_fields=document_fields)
-                    for x in chunk
-                ]
-                [
-                    x.update({vector_output_field: vector})
-                    for x, vector in list(zip(chunk, vectors))
-                ]
-                del vectors
-                gc.collect()
-            print("Finished updating documents with additional field.")
-            return
+            if vector_output_field is None:
+                vector_output_field = document_fields + '_vector_'
+            vectors = self._encode_text_to_array(
+                self.get_field_across_documents(document_fields, documents), chunk_size=chunk_size
+            )
+            self.set_field_across_documents(vector_output_field, vectors.tolist(), documents)
+            return vectors
         raise ValueError(
             "Unsure of how to bulk encode. Please write custom encoding methodology"
         )
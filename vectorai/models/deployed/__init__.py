@@ -1,3 +1,4 @@
 from .text import *
 from .audio import *
 from .image import *
+from .batching import *
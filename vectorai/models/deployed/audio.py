@@ -1,12 +1,12 @@
 import io
 import base64
-import requests
 from .base import ViDeployedModel
+from ...api.utils import return_response
 
 
 class ViAudio2Vec(ViDeployedModel):
     def encode(self, audio):
-        return requests.get(
+        return return_response(self.session.get(
             url="{}/collection/encode_audio".format(self.url),
             params={
                 "username": self.username,
@@ -14,7 +14,7 @@ class ViAudio2Vec(ViDeployedModel):
                 "collection_name": self.collection_name,
                 "audio_url": audio,
             },
-        ).json()
+        ))
 
     @property
     def __name__(self):
@@ -45,9 +45,9 @@ class ViAudioArray2Vec(ViDeployedModel):
         self.collection_name = collection_name
 
     def encode(self, audios):
-        return _vector_operation(
+        return self._vector_operation(
             [
-                requests.get(
+                return_response(self.session.get(
                     url="{}/collection/encode_audio".format(self.url),
                     params={
                         "username": self.username,
@@ -55,7 +55,7 @@ class ViAudioArray2Vec(ViDeployedModel):
                         "collection_name": self.collection_name,
                         "audio_url": audio,
                     },
-                ).json()
+                ))
                 for audio in audios
             ],
             vector_operation=self.vector_operation,
@@ -1,15 +1,28 @@
+import json
 import numpy as np
 from abc import abstractmethod
+from typing import List
+from ...api.session import ViSessionMixin
+from ...api.utils import return_response
 
+# Status codes of servers that do not accept bulk encodes in a request body
+GET_FALLBACK_STATUS_CODES = (404, 405)
+
+
+class ViDeployedModel(ViSessionMixin):
+    # The most values and the most bytes of values sent in one bulk encode request,
+    # and the number of requests of a bulk encode sent at the same time
+    bulk_encode_chunksize = 100
+    bulk_encode_max_bytes = 1024 * 1024
+    bulk_encode_workers = 4
 
-class ViDeployedModel:
     def __init__(self, username, api_key, url="https://api.vctr.ai", collection_name="base"):
         self.username = username
         self.api_key = api_key
         self.url = url
         self.collection_name = collection_name
         self._name = "default"
-    
+
     def _vector_operation(self, vectors, vector_operation: str = "mean"):
         """
             Creates a vector operation based on the model
@@ -30,6 +43,71 @@ class ViDeployedModel:
         else:
             return np.mean(vectors, axis=0).tolist()
 
+    def _split_for_bulk_encode(self, values: List) -> List[List]:
+        """
+            Split values into requests of at most bulk_encode_chunksize values and
+            about bulk_encode_max_bytes bytes, keeping their order
+        """
+        splits, split, num_of_bytes = [], [], 0
+        for value in values:
+            size = len(value.encode('utf-8')) if isinstance(value, str) else len(json.dumps(value))
+            if split and (len(split) >= self.bulk_encode_chunksize or num_of_bytes + size > self.bulk_encode_max_bytes):
+                splits.append(split)
+                split, num_of_bytes = [], 0
+            split.append(value)
+            num_of_bytes += size
+        if split:
+            splits.append(split)
+        return splits
+
+    def _request_bulk_encode(self, endpoint: str, field: str, values: List) -> List:
+        """
+            Send one bulk encode request. Values go in a JSON body, which the session
+            compresses when it is large, unless the server only takes them as query
+            parameters. The model switches to query parameters for good once a GET
+            request succeeds after a POST request was refused.
+        """
+        url = "{}/collection/{}".format(self.url, endpoint)
+        params = {
+            "username": self.username,
+            "api_key": self.api_key,
+            "collection_name": self.collection_name,
+            field: values,
+        }
+        if self.__dict__.get('_bulk_encode_with_get', False):
+            return return_response(self.session.get(url=url, params=params))
+        response = self.session.post(url=url, json=params)
+        if response.status_code not in GET_FALLBACK_STATUS_CODES:
+            return return_response(response)
+        # A 404 may also come from a wrong url or collection, in which case the GET
+        # request fails too and the model keeps using POST
+        result = return_response(self.session.get(url=url, params=params))
+        self.__dict__['_bulk_encode_with_get'] = True
+        return result
+
+    def _bulk_encode(self, endpoint: str, field: str, values: List, return_array: bool=False):
+        """
+            Encode values with a bulk encode endpoint, split into several requests
+            that are sent at the same time. The vectors are in the order of values.
+        """
+        splits = self._split_for_bulk_encode(list(values))
+        if len(splits) <= 1 or self.bulk_encode_workers <= 1:
+            results = [self._request_bulk_encode(endpoint, field, s) for s in splits]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(self.bulk_encode_workers, len(splits))) as threads:
+                results = list(threads.map(lambda s: self._request_bulk_encode(endpoint, field, s), splits))
+        if not return_array:
+            return [vector for result in results for vector in result]
+        if len(splits) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        vectors = np.empty((sum(len(r) for r in results), len(results[0][0])), dtype=np.float32)
+        start = 0
+        for result in results:
+            vectors[start : start + len(result)] = result
+            start += len(result)
+        return vectors
+
     @abstractmethod
     def __name__(self):
         pass
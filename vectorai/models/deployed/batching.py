@@ -0,0 +1,188 @@
+"""
+    Micro-batching of single encode calls into bulk_encode requests.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List
+from ...errors import APIError
+
+__all__ = ['BatchingEncoder']
+
+
+class BatchingEncoder:
+    """
+    Wraps a model with a bulk_encode method, such as ViText2Vec or ViImage2Vec, so
+    that encode calls made at the same time from many threads or coroutines are
+    sent as one bulk_encode request.
+
+    The first call waits up to max_wait seconds for others to join it, or less if
+    max_batch_size calls arrive first. While max_concurrent_batches requests are
+    in flight, new calls queue up and go out together in the next batch. Repeated
+    values within a batch are encoded once. If the request fails, every call in the
+    batch raises the error.
+
+    Other attributes, such as url and __name__, are read from the wrapped model, so
+    the wrapper can be passed to encode_documents_with_models in its place.
+
+    Args:
+        model:
+            The model whose bulk_encode the calls are sent to.
+        max_batch_size:
+            The largest number of values sent in one request.
+        max_wait:
+            The longest time in seconds a call waits for others before its batch is sent.
+        max_concurrent_batches:
+            The number of batches sent at the same time.
+
+    Example:
+        >>> from vectorai.models.deployed import ViText2Vec, BatchingEncoder
+        >>> text_encoder = BatchingEncoder(ViText2Vec(username, api_key, vectorai_url), max_wait=0.005)
+        >>> # In every request handler thread
+        >>> vector = text_encoder.encode('Big chicken')
+        >>> # Or in a coroutine
+        >>> vector = await text_encoder.aencode('Big chicken')
+        >>> text_encoder.close()
+    """
+    def __init__(self, model, max_batch_size: int=64, max_wait: float=0.005, max_concurrent_batches: int=4):
+        if not hasattr(model, 'bulk_encode'):
+            raise ValueError("The model needs a bulk_encode method to be batched.")
+        if max_batch_size < 1 or max_concurrent_batches < 1:
+            raise ValueError("max_batch_size and max_concurrent_batches must be at least 1.")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrent_batches = max_concurrent_batches
+        self._setup()
+
+    def _setup(self):
+        self._queue = []
+        self._condition = threading.Condition()
+        self._slots = threading.Semaphore(self.max_concurrent_batches)
+        self._executor = None
+        self._thread = None
+        self._closed = False
+
+    def __getstate__(self):
+        # Pending calls and threads belong to this process
+        return {k: self.__dict__[k] for k in ('model', 'max_batch_size', 'max_wait', 'max_concurrent_batches')}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._setup()
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') and name != '__name__' or 'model' not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+    def submit(self, value: Any) -> Future:
+        """
+        Queue a value to be encoded in the next batch and return a future of its vector.
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The BatchingEncoder is closed.")
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent_batches)
+                self._thread = threading.Thread(target=self._collect, daemon=True)
+                self._thread.start()
+            self._queue.append((value, future, time.monotonic()))
+            self._condition.notify()
+        return future
+
+    def encode(self, value: Any):
+        """
+        The vector of a value, encoded in a batch with the other calls made at the same time.
+        """
+        return self.submit(value).result()
+
+    async def aencode(self, value: Any):
+        """
+        The vector of a value, awaited without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit(value))
+
+    def bulk_encode(self, values: List[Any]) -> List:
+        """
+        The vectors of values, sent straight to the model's bulk_encode.
+        """
+        return self.model.bulk_encode(values)
+
+    def _next_batch(self) -> List:
+        # Wait for a first call, then for more calls until the batch is full or the
+        # first call has waited max_wait. Returns an empty batch once closed.
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            while self._queue and len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = self._queue[0][2] + self.max_wait - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = self._queue[:self.max_batch_size]
+            del self._queue[:self.max_batch_size]
+        return batch
+
+    def _collect(self):
+        while True:
+            # Calls keep queueing while every slot is busy, so they go out together
+            self._slots.acquire()
+            batch = self._next_batch()
+            if not batch:
+                self._slots.release()
+                return
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List):
+        try:
+            futures = {}
+            for value, future, _ in batch:
+                if future.set_running_or_notify_cancel():
+                    futures.setdefault(self._key(value), (value, []))[1].append(future)
+            if not futures:
+                return
+            try:
+                values = [value for value, _ in futures.values()]
+                vectors = self.model.bulk_encode(values)
+                if len(vectors) != len(values):
+                    raise APIError(f"bulk_encode returned {len(vectors)} vectors for {len(values)} values.")
+            except Exception as e:
+                for _, waiting in futures.values():
+                    for future in waiting:
+                        future.set_exception(e)
+                return
+            for (_, waiting), vector in zip(futures.values(), vectors):
+                for future in waiting:
+                    future.set_result(vector)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _key(value: Any):
+        try:
+            hash(value)
+            return (type(value), value)
+        except TypeError:
+            return (type(value), repr(value))
+
+    def close(self):
+        """
+        Send the calls still queued and stop the batching threads.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread, executor = self._thread, self._executor
+        if thread is not None:
+            # The collector sends the calls still queued before it stops
+            thread.join()
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
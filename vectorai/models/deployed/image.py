@@ -1,12 +1,12 @@
 import io
 import base64
-import requests
 from .base import ViDeployedModel
+from ...api.utils import return_response
 from typing import List
 
 class ViImage2Vec(ViDeployedModel):
     def encode(self, image):
-        return requests.get(
+        return return_response(self.session.get(
             url="{}/collection/encode_image".format(self.url),
             params={
                 "username": self.username,
@@ -14,21 +14,22 @@ class ViImage2Vec(ViDeployedModel):
                 "collection_name": self.collection_name,
                 "image_url": image,
             },
-        ).json()
+        ))
 
-    def bulk_encode(self, images: List[str]):
+    def bulk_encode(self, images: List[str], return_array: bool=False):
         """
-            Bulk convert text to vectors
+            Bulk convert image urls to vectors. Large lists are split into requests of at
+            most bulk_encode_chunksize values and bulk_encode_max_bytes bytes, which
+            are sent bulk_encode_workers at a time.
+
+            Args:
+                images:
+                    The image urls to encode.
+                return_array:
+                    If True, return the vectors as one contiguous float32 numpy array
+                    with a row per input instead of a list.
         """
-        return requests.get(
-            url="{}/collection/bulk_encode_image".format(self.url),
-            params={
-                "username": self.username,
-                "api_key": self.api_key,
-                "collection_name": self.collection_name,
-                "image_urls": images,
-            },
-        ).json()
+        return self._bulk_encode("bulk_encode_image", "image_urls", images, return_array=return_array)
 
     @property
     def __name__(self):
@@ -60,15 +61,7 @@ class ViImageArray2Vec(ViDeployedModel):
 
     def encode(self, images):
         return self._vector_operation(
-            requests.get(
-                url="{}/collection/bulk_encode_image".format(self.url),
-                params={
-                    "username": self.username,
-                    "api_key": self.api_key,
-                    "collection_name": self.collection_name,
-                    "image_urls": images,
-                },
-            ).json(),
+            self._bulk_encode("bulk_encode_image", "image_urls", images),
             vector_operation=self.vector_operation,
         )
 
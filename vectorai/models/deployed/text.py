@@ -1,9 +1,9 @@
 import io
 import base64
-import requests
 import numpy as np
 from typing import List
 from .base import ViDeployedModel
+from ...api.utils import return_response
 
 
 class ViText2Vec(ViDeployedModel):
@@ -11,7 +11,7 @@ class ViText2Vec(ViDeployedModel):
         """
             Convert text to vectors.
         """
-        return requests.get(
+        return return_response(self.session.get(
             url="{}/collection/encode_text".format(self.url),
             params={
                 "username": self.username,
@@ -19,21 +19,22 @@ class ViText2Vec(ViDeployedModel):
                 "collection_name": self.collection_name,
                 "text": text,
             },
-        ).json()
+        ))
 
-    def bulk_encode(self, texts: List[str]):
+    def bulk_encode(self, texts: List[str], return_array: bool=False):
         """
-            Bulk convert text to vectors
+            Bulk convert text to vectors. Large lists are split into requests of at
+            most bulk_encode_chunksize values and bulk_encode_max_bytes bytes, which
+            are sent bulk_encode_workers at a time.
+
+            Args:
+                texts:
+                    The text to encode.
+                return_array:
+                    If True, return the vectors as one contiguous float32 numpy array
+                    with a row per input instead of a list.
         """
-        return requests.get(
-            url="{}/collection/bulk_encode_text".format(self.url),
-            params={
-                "username": self.username,
-                "api_key": self.api_key,
-                "collection_name": self.collection_name,
-                "texts": texts,
-            }
-        ).json()
+        return self._bulk_encode("bulk_encode_text", "texts", texts, return_array=return_array)
 
     @property
     def __name__(self):
@@ -66,15 +67,7 @@ class ViTextArray2Vec(ViDeployedModel):
 
     def encode(self, texts):
         return self._vector_operation(
-            requests.get(
-                url="{}/collection/bulk_encode_text".format(self.url),
-                params={
-                    "username": self.username,
-                    "api_key": self.api_key,
-                    "collection_name": self.collection_name,
-                    "texts": texts,
-                }
-            ).json(),
+            self._bulk_encode("bulk_encode_text", "texts", texts),
             vector_operation=self.vector_operation,
         )
 
@@ -1,7 +1,19 @@
 OPTIONS = {
     'return_curl': False,
     'maximum_num_of_http_retries': 3,
-    'maximum_http_timeout': 5
+    'maximum_http_timeout': 5,
+    'http_backoff_factor': 0.5,
+    'http_retry_deadline': None,
+    'http_pool_connections': 10,
+    'http_pool_maxsize': 10,
+    'http_pool_block': False,
+    'vector_wire_encoding': None,
+    'json_serializer': None,
+    'request_compression': None,
+    'request_compression_threshold': 256 * 1024,
+    'request_compression_level': None,
+    'login_check': 'eager',
+    'insert_executor': 'thread',
 }
 
 def get_option(option_field):
@@ -0,0 +1,129 @@
+"""
+    Staged pipelines that overlap the steps of processing chunks of documents,
+    e.g. encoding one chunk while the previous one is uploading.
+"""
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+__all__ = ['run_pipeline']
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def run_pipeline(items: Iterable, stages: List[Tuple[Callable, int]], max_queued: int=2) -> Iterator[Any]:
+    """
+    Pass every item through each stage in turn. Every stage runs in its own threads
+    so all stages work at the same time on different items.
+
+    Stages are connected by queues holding at most max_queued items, so only a
+    bounded number of items are in memory at once and a slow stage holds back the
+    stages before it instead of letting work pile up.
+
+    Args:
+        items:
+            The items to process. Consumed lazily.
+        stages:
+            A list of (function, number of threads). Each function takes the output of
+            the previous stage.
+        max_queued:
+            The maximum number of items waiting in front of each stage.
+
+    Returns:
+        A generator of the outputs of the last stage in the order they complete.
+        If a stage raises, the pipeline stops and the generator raises the exception.
+
+    Example:
+        >>> from vectorai.pipeline import run_pipeline
+        >>> stages = [(encode_chunk, 1), (upload_chunk, 4)]
+        >>> for result in run_pipeline(chunks, stages):
+        >>>     print(result)
+    """
+    if max_queued < 1:
+        raise ValueError("max_queued must be at least 1.")
+    stop = threading.Event()
+    lock = threading.Lock()
+    queues = [queue.Queue(maxsize=max_queued) for _ in stages] + [queue.Queue()]
+    remaining = [num_of_threads for _, num_of_threads in stages]
+
+    def put(q: queue.Queue, item) -> bool:
+        # Wait for space without blocking forever if the pipeline stops
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fail(exception: BaseException):
+        stop.set()
+        queues[-1].put(_Failure(exception))
+
+    def close_stage(index: int):
+        # The last thread of a stage to finish tells every thread of the next stage
+        with lock:
+            remaining[index] -= 1
+            is_last = remaining[index] == 0
+        if is_last:
+            num_of_sentinels = stages[index + 1][1] if index + 1 < len(stages) else 1
+            for _ in range(num_of_sentinels):
+                if not put(queues[index + 1], _DONE):
+                    return
+
+    def feed():
+        try:
+            for item in items:
+                if not put(queues[0], item):
+                    return
+        except BaseException as e:
+            fail(e)
+            return
+        for _ in range(stages[0][1]):
+            if not put(queues[0], _DONE):
+                return
+
+    def work(index: int, func: Callable):
+        while not stop.is_set():
+            try:
+                item = queues[index].get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                close_stage(index)
+                return
+            try:
+                output = func(item)
+            except BaseException as e:
+                fail(e)
+                return
+            if not put(queues[index + 1], output):
+                return
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for index, (func, num_of_threads) in enumerate(stages):
+        if num_of_threads < 1:
+            raise ValueError("Every stage needs at least 1 thread.")
+        threads += [threading.Thread(target=work, args=(index, func), daemon=True) for _ in range(num_of_threads)]
+
+    def outputs():
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                output = queues[-1].get()
+                if output is _DONE:
+                    return
+                if isinstance(output, _Failure):
+                    raise output.exception
+                yield output
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+    return outputs()
@@ -2,13 +2,12 @@
 """
 import io
 import base64
-import requests
 import random
-import pandas as pd
 import time
 import warnings
 from typing import List, Dict, Union, Any
 from .api import ViAPIClient
+from .api.utils import return_response
 from .utils import UtilsMixin
 from .doc_utils import DocUtilsMixin
 from .errors import MissingFieldWarning
@@ -206,7 +205,7 @@ Args:
             >>> vi_client = ViClient(username, api_key, vectorai_url)
             >>> vi_client.head(collection_name, page_size=10)
         """
-        response = requests.get(
+        response = return_response(self.session.get(
             url="{}/collection/retrieve_documents".format(self.url),
             params={
                 "username": self.username,
@@ -214,10 +213,11 @@ Args:
                 "collection_name": collection_name,
                 "page_size": page_size,
             },
-        ).json()
+        ))
         if "documents" in response.keys():
             response = response["documents"]
         if return_as_pandas_df:
+            import pandas as pd
             return pd.DataFrame.from_records(response)
         else:
             return response
@@ -234,6 +234,7 @@ Args:
         if "documents" in docs:
             docs = docs['documents']
         if return_as_pandas_df:
+            import pandas as pd
             return pd.DataFrame.from_records(response)
         else:
             return response
@@ -1,15 +1,17 @@
 """Miscellaneous functions for the client.
 """
 import numpy as np
-import pandas as pd
 import itertools
 import inspect
 import types
 import random
 import warnings
-from typing import List, Any, Dict, Union
+from typing import List, Any, Dict, Union, TYPE_CHECKING
 from functools import wraps, partial
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class UtilsMixin:
     """Various utilties
     """
@@ -39,6 +41,7 @@ class UtilsMixin:
             data:
                 data returned from search, retrieve_documents, etc
         """
+        import pandas as pd
         if "results" in data:
             return pd.DataFrame(data["results"])
         elif "documents" in data:
@@ -71,6 +74,7 @@ class UtilsMixin:
                 field='OriginalTweet_vector_', page_size=5)
             >>> vi_client.results_pretty(result, 'OriginalTweet')
         """
+        import pandas as pd
         pd.set_option('display.max_colwidth', 10000)
         if 'results' in results.keys():
             results = results['results']
@@ -185,7 +189,7 @@ class UtilsMixin:
         if not show_progress_bar:
             return documents
 
-        if total is None:
+        if total is None and hasattr(documents, '__len__'):
             total = len(documents)
 
         if self.is_in_notebook():
@@ -254,7 +258,7 @@ class UtilsMixin:
         """
         return [self.create_sample_document(i, include_chunks=include_chunks) for i in range(num_of_documents)]
 
-        def show_df(self, df: pd.DataFrame,
+        def show_df(self, df: 'pd.DataFrame',
         image_fields: List[str]=[], audio_fields: List[str]=[],
         chunk_image_fields: List[str]=[], chunk_audio_fields: List[str]=[],
         image_width: int=60, include_vector: bool=False, return_html: bool=False):
@@ -363,6 +367,7 @@ class UtilsMixin:
                     del json[h]
         if nrows is not None:
             json = json[:nrows]
+        import pandas as pd
         if selected_fields is None and len(image_fields) == 0 and len(audio_fields) == 0:
             return self.show_df(pd.DataFrame(json), image_fields=image_fields, audio_fields=audio_fields,
                 chunk_image_fields=chunk_image_fields, chunk_audio_fields=chunk_audio_fields,
@@ -421,7 +426,7 @@ class UtilsMixin:
     # def render_audio_chunk(self, row):
     #     return self.render_chunk(row, self.render_audio_in_html)
 
-    def show_df(self, df: pd.DataFrame,
+    def show_df(self, df: 'pd.DataFrame',
     image_fields: List[str]=[], audio_fields: List[str]=[], chunk_image_fields: List[str]=[],
     chunk_audio_fields: List[str]=[], image_width: int=60, highlight_fields={},
     include_vector: bool=False, return_html: bool=False):
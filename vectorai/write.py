@@ -8,20 +8,80 @@ import json
 import base64
 import warnings
 import requests
-import pandas as pd
 import numpy as np
 import copy
-from tqdm.notebook import tqdm
-from typing import List, Dict, Union, Any, Callable
+import itertools
+import threading
+from typing import List, Dict, Tuple, Union, Any, Callable, Iterable, TYPE_CHECKING
 from functools import partial
+from contextlib import closing, ExitStack
 from multiprocessing import Pool
 from .utils import UtilsMixin
 from .errors import APIError, MissingFieldError, MissingFieldWarning, CollectionNameError
 from .api import ViAPIClient
+from .api.serializer import get_serializer, _default
+from .pipeline import run_pipeline
+from .batching import AdaptiveChunker, FailedDocumentHandler
+from .journal import InsertJournal
+from .fingerprints import FingerprintStore
+from .encoding_cache import EncodingCache
+from .options import get_option
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _call_with_span(func: Callable, item):
+    """
+    Run func on the documents of a (span, documents) chunk, keeping the span with the output.
+    """
+    span, documents = item
+    return span, func(documents)
+
+
+def _to_vector_list(vectors) -> List:
+    """
+    The vectors of a bulk_encode as a list of lists, which is what documents hold.
+    """
+    return vectors.tolist() if isinstance(vectors, np.ndarray) else list(vectors)
+
+
+def _encode_values(model, values: List, bulk: bool, cache: EncodingCache=None) -> List:
+    """
+    The vectors of values from a model's bulk_encode, encode, or the model itself if it is a function.
+    """
+    if bulk:
+        bulk_encode = model.bulk_encode
+        if cache is not None:
+            return cache.bulk_encode(model, values, lambda values: _to_vector_list(bulk_encode(values)))
+        return _to_vector_list(bulk_encode(values))
+    encode = model if isinstance(model, (types.FunctionType, types.MethodType, partial)) else model.encode
+    return [encode(v) if cache is None else cache.encode(model, v, encode) for v in values]
+
+
+# The models of the last field encoding call, kept in each process of a pool by call key
+_worker_models = {}
+# Guards creating the process pools of every client
+_process_pool_lock = threading.Lock()
+
+
+def _encode_worker_values(key: str, models: bytes, i: int, values: List, bulk: bool,
+    cache: EncodingCache=None) -> List:
+    """
+    The vectors of values from the i-th of the pickled models of a field encoding
+    call. Each process of the pool unpickles the models of a call once.
+    """
+    import pickle
+    if key not in _worker_models:
+        _worker_models.clear()
+        _worker_models[key] = pickle.loads(models)
+    return _encode_values(_worker_models[key][i], values, bulk, cache)
 
 
 class ViWriteClient(ViAPIClient, UtilsMixin):
     """Class to write to database."""
+    # An EncodingCache used whenever documents are encoded with models
+    encoding_cache = None
 
     def __init__(self, username, api_key, url="https://api.vctr.ai" ):
         self.username = username
@@ -51,10 +111,12 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
     def _chunks(self, lst: List, n: int):
         """
         Chunk an iterable object in Python but not a pandas DataFrame.
+        Lists are sliced. Any other iterable, such as a generator, is read lazily
+        one chunk at a time.
 
         Args:
             lst:
-                Python List
+                Python List or any iterable
             n:
                 The chunk size of an object.
 
@@ -62,11 +124,19 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             >>> documents = [{...}]
             >>> ViClient.chunk(documents)
         """
-        for i in range(0, len(lst), n):
-            yield lst[i : i + n]
+        if isinstance(lst, list):
+            for i in range(0, len(lst), n):
+                yield lst[i : i + n]
+            return
+        iterator = iter(lst)
+        while True:
+            chunk = list(itertools.islice(iterator, n))
+            if len(chunk) == 0:
+                return
+            yield chunk
 
     @staticmethod
-    def chunk(documents: Union[pd.DataFrame, List], chunk_size: int = 20):
+    def chunk(documents: Union['pd.DataFrame', List], chunk_size: int = 20):
         """
         Chunk an iterable object in Python.
 
@@ -80,7 +150,8 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             >>> documents = [{...}]
             >>> ViClient.chunk(documents)
         """
-        if isinstance(documents, pd.DataFrame):
+        # Checks for a DataFrame without importing pandas
+        if hasattr(documents, 'iloc'):
             for i in range(0, len(documents), chunk_size):
                 yield documents.iloc[i : i + chunk_size]
         else:
@@ -248,7 +319,8 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             if len(set(name_list)) != len(name_list):
                 raise ValueError("Models have the set name. Check each model name is unique.")
 
-    def encode_documents_with_models_using_encode(self, documents: List[Dict], models: Dict):
+    def encode_documents_with_models_using_encode(self, documents: List[Dict], models: Dict,
+        encoding_cache: EncodingCache=None, field_workers: int=1, field_executor: str=None):
         """
         Encode documents with appropriate models without a bulk_encode function.
         Args:
@@ -256,34 +328,183 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 List of documents/JSONs/dictionaries.
             models:
                 A dictionary of fields and models to determine the type of encoding for each field.
+            encoding_cache:
+                The EncodingCache to use. Defaults to the client's encoding_cache.
+            field_workers:
+                The number of field and model pairs encoded at the same time.
+            field_executor:
+                'thread' or 'process' for the concurrent pairs. See encode_documents_with_models.
 
         """
-        for d in documents:
-            for f, model_list in models.items():
-                # Typecast callable to a list to easily pass through for-loop.
-                if not isinstance(model_list, list):
-                    model_list = [model_list]
+        return self._encode_fields(documents, self._field_tasks(models, use_bulk_encode=False),
+            encoding_cache, field_workers, field_executor)
 
-                for model in model_list:
-                    vector_field = self._get_vector_name_for_encoding(f, model, model_list)
+    def _field_tasks(self, models: Dict, use_bulk_encode: bool=None) -> List[Tuple]:
+        """
+        The (field, model, vector field, use bulk_encode) of every model of every field.
+        """
+        tasks = []
+        for f, model_list in models.items():
+            # Typecast callable to a list to easily pass through for-loop.
+            if not isinstance(model_list, list):
+                model_list = [model_list]
+            for model in model_list:
+                vector_field = self._get_vector_name_for_encoding(f, model, model_list)
+                bulk = hasattr(model, 'bulk_encode') if use_bulk_encode is None else use_bulk_encode
+                tasks.append((f, model, vector_field, bulk))
+        return tasks
 
-                    if not self.is_field(f, d):
-                        warnings.warn(f"""Missing {f} in a document. Filling the missing with empty vectors.""")
-                        self.set_field(vector_field, d, self.dummy_vector(self._get_vector_length_from_model(model)))
+    @staticmethod
+    def _distinct_values(values: List) -> Tuple[List, List[int]]:
+        """
+        The distinct values and the position of every value among them, so that each
+        distinct value is only encoded once.
+        """
+        positions, distinct, index = {}, [], []
+        for value in values:
+            try:
+                key = (type(value), value)
+                hash(key)
+            except TypeError:
+                key = (type(value), json.dumps(value, sort_keys=True, default=_default))
+            if key not in positions:
+                positions[key] = len(distinct)
+                distinct.append(value)
+            index.append(positions[key])
+        return distinct, index
+
+    def _gather_field(self, documents: List[Dict], f: str) -> Tuple[List[Dict], List[Dict], List, List[int]]:
+        """
+        The documents that have a field, those that do not, the distinct values of
+        the field and the position of each document's value among them.
+        """
+        present, missing = [], []
+        for d in documents:
+            (present if self.is_field(f, d) else missing).append(d)
+        if len(present) == 0:
+            return present, missing, [], []
+        values, index = self._distinct_values(self.get_field_across_documents(f, present))
+        return present, missing, values, index
+
+    def _scatter_field(self, f: str, present: List[Dict], missing: List[Dict], index: List[int], model,
+        vector_field: str, vectors: List):
+        """
+        Set the vectors of the distinct values on the documents that have them, and
+        empty vectors on the documents missing the field.
+        """
+        if len(present) > 0:
+            if isinstance(model, (types.FunctionType, types.MethodType, partial)):
+                self._set_vector_length_from_model(model, vectors[0])
+            self.set_field_across_documents(vector_field, [vectors[i] for i in index], present)
+        if len(missing) > 0:
+            warnings.warn(f"""Missing {f} in {len(missing)} documents. Filling the missing with empty vectors.""")
+            vector_length = len(vectors[0]) if len(vectors) > 0 else self._get_vector_length_from_model(model)
+            for d in missing:
+                self.set_field(vector_field, d, self.dummy_vector(vector_length))
+
+    def _encode_field(self, documents: List[Dict], f: str, model, vector_field: str,
+        cache: EncodingCache=None, bulk: bool=False):
+        """
+        Encode a field of documents, encoding repeated values once.
+        """
+        present, missing, values, index = self._gather_field(documents, f)
+        vectors = _encode_values(model, values, bulk, cache) if values else []
+        self._scatter_field(f, present, missing, index, model, vector_field, vectors)
 
-                    if isinstance(model, (types.FunctionType, types.MethodType, partial)):
-                        vector = model(self.get_field(f, d))
-                        self._set_vector_length_from_model(model, vector)
-                        self.set_field(vector_field, d, vector)
-                    else:
-                        self.set_field(vector_field, d, model.encode(self.get_field(f, d)))
+    def _bulk_encode_field(self, documents: List[Dict], f: str, model, vector_field: str,
+        cache: EncodingCache=None):
+        """
+        Encode a field of documents with one bulk_encode call of its distinct values.
+        """
+        self._encode_field(documents, f, model, vector_field, cache, bulk=True)
 
+    def _is_picklable(self, model) -> bool:
+        """
+        Whether a model can be pickled, checked once for each model.
+        """
+        import pickle
+        known = self.__dict__.setdefault('_picklable_models', [])
+        for other, picklable in known:
+            if other is model or other == model:
+                return picklable
+        try:
+            pickle.dumps(model)
+            picklable = True
+        except Exception:
+            picklable = False
+        known.append((model, picklable))
+        # Keep the most recent models only
+        del known[:-32]
+        return picklable
+
+    def _encodes_in_process(self, model, field_executor: str=None) -> bool:
+        """
+        Whether a model is encoded in a process pool rather than a thread. Deployed
+        models, and BatchingEncoders wrapping them, wait on the network and use
+        threads unless field_executor is 'process'. Models that cannot be pickled
+        always use threads, as do models run from a worker of a process pool, which
+        cannot start processes itself.
+        """
+        import multiprocessing
+        from .models.deployed import ViDeployedModel, BatchingEncoder
+        if field_executor == 'thread' or multiprocessing.current_process().daemon:
+            return False
+        owner = getattr(model, '__self__', model)
+        if field_executor is None and isinstance(owner, (ViDeployedModel, BatchingEncoder)):
+            return False
+        return self._is_picklable(model)
+
+    def _encode_fields(self, documents: List[Dict], tasks: List[Tuple], encoding_cache: EncodingCache=None,
+        field_workers: int=1, field_executor: str=None) -> List[Dict]:
+        """
+        Encode the fields of documents for every (field, model, vector field, use
+        bulk_encode) task. With field_workers above 1 the models run at the same
+        time, and their vectors are set on the documents in task order once they
+        have all finished.
+        """
+        if field_executor not in (None, 'thread', 'process'):
+            raise ValueError("field_executor must be 'thread', 'process' or None.")
+        cache = encoding_cache if encoding_cache is not None else self.encoding_cache
+        if field_workers <= 1 or len(tasks) <= 1:
+            for f, model, vector_field, bulk in tasks:
+                self._encode_field(documents, f, model, vector_field, cache, bulk)
+            return documents
+        from concurrent.futures import ThreadPoolExecutor, Future
+        # Values are read from the documents here, so documents never leave this process
+        gathered = [(f, model, vector_field, bulk) + self._gather_field(documents, f)
+            for f, model, vector_field, bulk in tasks]
+        # Models for the process pool are pickled once for the call and copied with its tasks
+        process_models = []
+        for _, model, _, _, _, _, values, _ in gathered:
+            if values and self._encodes_in_process(model, field_executor) and \
+                not any(m is model or m == model for m in process_models):
+                process_models.append(model)
+        if process_models:
+            import pickle
+            import uuid
+            process_models = tuple(process_models)
+            key, pickled_models = uuid.uuid4().hex, pickle.dumps(process_models)
+            pool = self._get_process_pool(field_workers)
+        with ThreadPoolExecutor(max_workers=field_workers) as threads:
+            pending = []
+            for _, model, _, bulk, _, _, values, _ in gathered:
+                if not values:
+                    pending.append([])
+                elif model in process_models:
+                    pending.append(pool.apply_async(_encode_worker_values,
+                        (key, pickled_models, process_models.index(model), values, bulk, cache)))
+                else:
+                    pending.append(threads.submit(_encode_values, model, values, bulk, cache))
+            results = [p.result() if isinstance(p, Future) else p if isinstance(p, list) else p.get()
+                for p in pending]
+        for (f, model, vector_field, _, present, missing, _, index), vectors in zip(gathered, results):
+            self._scatter_field(f, present, missing, index, model, vector_field, vectors)
         return documents
 
     def _get_vector_length_from_model(self, model):
-        if isinstance(model, (types.FunctionType, types.MethodType, partial)):
-            self.vector_length = len(vector)
-            return
+        if isinstance(model, (types.FunctionType, types.MethodType, partial)) and \
+            getattr(self, 'vector_length', None) is not None:
+            return self.vector_length
 
         if hasattr(model, 'vector_length'):
             return model.vector_length
@@ -308,7 +529,8 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             return
 
     def encode_documents_with_models(
-        self, documents: List[Dict], models: Union[Dict[str, Callable], List[Dict]] = {}, use_bulk_encode=False
+        self, documents: List[Dict], models: Union[Dict[str, Callable], List[Dict]] = {}, use_bulk_encode=None,
+        encoding_cache: EncodingCache=None, field_workers: int=1, field_executor: str=None
     ):
         """
         Encode documents with appropriate models.
@@ -318,22 +540,59 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 List of documents/jsons/dictionaries.
             models:
                 A dictionary of fields and models to determine the type of encoding for each field.
+            use_bulk_encode:
+                If True, every model is encoded with its bulk_encode method and if False
+                with encode. None uses bulk_encode for the models that have one.
+                Either way each distinct value of a field is encoded once.
+            encoding_cache:
+                An EncodingCache so values already encoded by a model are not encoded
+                again. Defaults to the client's encoding_cache.
+            field_workers:
+                The number of field and model pairs encoded at the same time. The
+                vectors are set on the documents in the order of models once every
+                pair has finished, so the result does not depend on which finishes first.
+            field_executor:
+                'thread' or 'process'. None runs deployed models in threads and other
+                models in the client's process pool. Models run in the process pool
+                are copied into its workers for each call, so changes a model makes
+                to itself there are not seen in this process. Models that cannot be
+                pickled always run in threads.
 
         Example:
             >>> from vectorai.client import ViClient
             >>> vi_client = ViClient(username, api_key, vectorai_url)
-            >>> from vectorai.models.deployed import ViText2Vec
+            >>> from vectorai.models.deployed import ViText2Vec, ViImage2Vec
             >>> text_encoder = ViText2Vec(username, api_key, vectorai_url)
             >>> documents = [{'chicken': 'Big chicken'}, {'chicken': 'small_chicken'}, {'chicken': 'cow'}]
             >>> vi_client.encode_documents_with_models(documents=documents, models={'chicken': text_encoder.encode})
+            >>> # Encode text and images at the same time
+            >>> image_encoder = ViImage2Vec(username, api_key, vectorai_url)
+            >>> vi_client.encode_documents_with_models(documents=documents,
+            ...     models={'chicken': text_encoder.encode, 'image_url': image_encoder.encode}, field_workers=2)
         """
         # TODO: refactor & test if changing black length
         self._check_if_multiple_models_have_same_name(models)
         if use_bulk_encode:
-            return self.encode_documents_with_models_in_bulk(documents=documents, models=models)
-        return self.encode_documents_with_models_using_encode(documents=documents, models=models)
+            self._check_bulk_encode(models)
+        return self._encode_fields(documents, self._field_tasks(models, use_bulk_encode),
+            encoding_cache, field_workers, field_executor)
+
+    @staticmethod
+    def _check_bulk_encode(models: Dict):
+        """
+        Ensure all models have a bulk_encode method.
+        """
+        for f, model_list in models.items():
+            if not isinstance(model_list, list):
+                model_list = [model_list]
+            for model in model_list:
+                if model.__name__ is not None:
+                    assert hasattr(model, 'bulk_encode'), f"Model {model.__name__} cannot be encoded in bulk. Missing bulk_encode method."
+                else:
+                    assert hasattr(model, 'bulk_encode'), "Model cannot be encoded in bulk. Missing bulk_encode method."
 
-    def encode_documents_with_models_in_bulk(self, documents: List[Dict], models: Dict):
+    def encode_documents_with_models_in_bulk(self, documents: List[Dict], models: Dict,
+        encoding_cache: EncodingCache=None, field_workers: int=1, field_executor: str=None):
         """
         Encode documents with models to allow for bulk_encode.
 
@@ -342,42 +601,90 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 List of documents/jsons/dictionaries.
             models:
                 A dictionary of fields and models to determine the type of encoding for each field.
+            encoding_cache:
+                The EncodingCache to use. Defaults to the client's encoding_cache.
+            field_workers:
+                The number of field and model pairs encoded at the same time.
+            field_executor:
+                'thread' or 'process' for the concurrent pairs. See encode_documents_with_models.
         """
-        # Ensure all models have a bulk_encode method.
-        for f, model_list in models.items():
-            if not isinstance(model_list, list):
-                models[f] = [model_list]
-            for model in models[f]:
-                if model.__name__ is not None:
-                    assert hasattr(model, 'bulk_encode'), f"Model {model.__name__} cannot be encoded in bulk. Missing bulk_encode method."
-                else:
-                    assert hasattr(model, 'bulk_encode'), "Model cannot be encoded in bulk. Missing bulk_encode method."
-        # Now bulk-encode and then set the field for each dictionary
-        for f, model_list in models.items():
-            for model in model_list:
-                vector_field = self._get_vector_name_for_encoding(f, model, model_list)
-                values = self.get_field_across_documents(f, documents, )
-                vectors = model.bulk_encode(values)
-                self.set_field_across_documents(vector_field, vectors, documents)
-        return documents
+        self._check_bulk_encode(models)
+        return self._encode_fields(documents, self._field_tasks(models, use_bulk_encode=True),
+            encoding_cache, field_workers, field_executor)
+
+    def _get_process_pool(self, workers: int):
+        """
+            Return the process pool of the client with the given number of processes,
+            creating it if there is none. Pools are reused across calls and kept
+            until close.
+        """
+        with _process_pool_lock:
+            pools = self.__dict__.setdefault('_process_pools', {})
+            if workers not in pools:
+                pools[workers] = Pool(processes=workers)
+            return pools[workers]
+
+    def close(self):
+        """
+        Close every pooled connection and the process pools held by the client.
+
+        Example:
+            >>> from vectorai.client import ViClient
+            >>> vi_client = ViClient(username, api_key, vectorai_url)
+            >>> vi_client.close()
+        """
+        with _process_pool_lock:
+            pools = self.__dict__.pop('_process_pools', {})
+        for pool in pools.values():
+            pool.close()
+            pool.join()
+        super().close()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop('_process_pools', None)
+        state.pop('_picklable_models', None)
+        return state
 
     def _insert_and_encode(
         self, documents: list, collection_name: str, models: dict, verbose=False,
-        use_bulk_encode: bool=False, overwrite: bool=False, quick: bool=False, **kwargs
+        use_bulk_encode: bool=None, overwrite: bool=False, quick: bool=False,
+        preprocess_hook: Callable=None, chunker: AdaptiveChunker=None,
+        failure_handler: FailedDocumentHandler=None, field_workers: int=1, **kwargs
     ):
         """
             Insert and encode documents
         """
+        return self._insert_chunk(
+            self._encode_chunk(documents, models=models, use_bulk_encode=use_bulk_encode,
+                preprocess_hook=preprocess_hook, field_workers=field_workers),
+            collection_name=collection_name, overwrite=overwrite, quick=quick, chunker=chunker,
+            failure_handler=failure_handler, **kwargs
+        )
+
+    def _encode_chunk(self, documents: list, models: dict, use_bulk_encode: bool=None,
+        preprocess_hook: Callable=None, field_workers: int=1):
+        """
+            Preprocess and encode a chunk of documents before it is inserted
+        """
+        if preprocess_hook: {preprocess_hook(d) for d in documents}
         self._convert_ids_to_string(documents)
+        return self.encode_documents_with_models(documents, models=models, use_bulk_encode=use_bulk_encode,
+            field_workers=field_workers)
 
-        return self.bulk_insert(
-            collection_name=collection_name,
-            documents=self.encode_documents_with_models(documents, models=models,
-            use_bulk_encode=use_bulk_encode),
-            overwrite=overwrite,
-            quick=quick,
-            **kwargs
-        )
+    def _insert_chunk(self, documents: list, collection_name: str, overwrite: bool=False, quick: bool=False,
+        chunker: AdaptiveChunker=None, failure_handler: FailedDocumentHandler=None, **kwargs):
+        """
+            Insert a chunk of encoded documents
+        """
+        insert = partial(self.bulk_insert, collection_name=collection_name, overwrite=overwrite,
+            quick=quick, **kwargs)
+        send = lambda c: insert(documents=c)
+        if chunker is not None:
+            send = partial(chunker.send, send, retryable='bulk_insert' in self.retry_policy.retry_endpoints)
+        if failure_handler is not None:
+            return failure_handler.send(send, documents)
+        return send(documents)
 
     def insert_document(self, collection_name: str, document: Dict, verbose=False):
         """
@@ -456,16 +763,27 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
     def insert_documents(
         self,
         collection_name: str,
-        documents: List,
+        documents: Iterable[Dict],
         models: Dict[str, Callable] = {},
-        chunksize: int = 15,
+        chunksize: Union[int, str, AdaptiveChunker] = 15,
         workers: int = 1,
         verbose: bool=False,
-        use_bulk_encode: bool=False,
+        use_bulk_encode: bool=None,
         overwrite: bool=False,
         show_progress_bar: bool=True,
         quick: bool=False,
         preprocess_hook: Callable=None,
+        executor: str=None,
+        pipelined: bool=False,
+        encode_workers: int=1,
+        upload_workers: int=1,
+        max_queued_chunks: int=2,
+        total: int=None,
+        journal: Union[str, InsertJournal]=None,
+        retry_failed: int=0,
+        dead_letter_path: str=None,
+        fingerprints: Union[str, FingerprintStore]=None,
+        field_workers: int=1,
         **kwargs
     ):
         """
@@ -475,11 +793,17 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             collection_name:
                 Name of collection
             documents:
-                All documents.
+                All documents. A list or any iterable, such as a generator, which
+                is read lazily one chunk at a time so only the chunks being encoded
+                and inserted are held in memory.
             models:
                 Models with an encode method
+            chunksize:
+                The number of documents inserted per request. 'auto' or an AdaptiveChunker
+                sizes chunks by payload bytes and adjusts them to response times and
+                requests that are too large or time out.
             use_bulk_encode:
-                Use the bulk_encode method in models
+                Use the bulk_encode method in models. None uses it for the models that have one.
             verbose:
                 Whether to print document ids that have failed when inserting.
             overwrite:
@@ -489,58 +813,210 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 your first time using the API until you are used to using Vector AI.
             preprocess_hook:
                 Document-level function taht updates
+            workers:
+                The number of chunks encoded and inserted at the same time.
+            executor:
+                How chunks are spread over workers when workers > 1. thread runs them
+                in threads sharing the client's connection pool, which suits inserts
+                as they mostly wait on the network. process runs them in a process
+                pool kept by the client across calls, for CPU-bound local models;
+                the client, models and every chunk are pickled to the processes and
+                preprocess hooks are not supported. Defaults to the insert_executor option.
+            pipelined:
+                If True, encode the next chunks while the previous chunks upload, in
+                encode_workers and upload_workers threads. workers is ignored.
+            encode_workers:
+                The number of chunks encoded at the same time when pipelined.
+            upload_workers:
+                The number of chunks uploaded at the same time when pipelined.
+            max_queued_chunks:
+                The maximum number of chunks waiting to be encoded and waiting to be
+                uploaded when pipelined, which bounds memory use.
+            total:
+                The number of documents, for the progress bar. Defaults to len(documents)
+                if documents has a length, otherwise the progress bar shows no total.
+            journal:
+                A checkpoint file path or InsertJournal. Every acknowledged chunk is
+                recorded in it, and documents it already holds are skipped, so an insert
+                that stopped part way can be restarted with the same documents and
+                carry on from where it stopped.
+            retry_failed:
+                The number of times documents the API reports as failed are sent
+                again, with backoff. Setting it or dead_letter_path also splits
+                chunks rejected as a whole because of their documents (status 400,
+                413 or 422, or documents that cannot be serialized) in halves until
+                the documents causing the error are found, so the rest of the chunk
+                still goes in. Throttling, server and authentication errors are raised.
+            dead_letter_path:
+                A JSON lines file that documents that could not be inserted are
+                appended to, along with the error.
+            fingerprints:
+                A fingerprint file path or FingerprintStore. Documents whose content
+                is unchanged since they were last written with the same store are
+                skipped without being encoded, and the result counts them as unchanged.
+            field_workers:
+                The number of field and model pairs of a chunk encoded at the same
+                time, so a chunk with text and image models takes as long as the
+                slowest model rather than the sum of them. See encode_documents_with_models.
 
         Example:
             >>> from vectorai.models.deployed import ViText2Vec
             >>> text_encoder = ViText2Vec(username, api_key, vectorai_url)
             >>> documents = [{'chicken': 'Big chicken'}, {'chicken': 'small_chicken'}, {'chicken': 'cow'}]
             >>> vi_client.insert_documents(documents, models={'chicken': text_encoder.encode})
+            >>> vi_client.insert_documents(documents, models={'chicken': text_encoder.encode},
+            >>>     pipelined=True, upload_workers=4)
+            >>> vi_client.insert_documents(documents, workers=8, executor='thread')
+            >>> documents = ({'_id': str(i), 'chicken': line} for i, line in enumerate(open('chickens.txt')))
+            >>> vi_client.insert_documents(documents, models={'chicken': text_encoder.encode})
+            >>> vi_client.insert_documents(documents, journal='chickens.journal')
         """
-        if collection_name not in self.list_collections():
-            if len(models) == 0:
-                self._check_schema(documents[0])
-            self.create_collection_from_document(
-                collection_name,
-                self.encode_documents_with_models([documents[0]], models)[0],
-            )
-        self._raise_warning_if_no_id(documents)
-        failed = []
-        iter_len = int(len(documents) / chunksize) + (len(documents) % chunksize > 0)
-        iter_docs = self._chunks(documents, chunksize)
-
-        if workers == 1:
-            for c in self.progress_bar(iter_docs, total=iter_len, show_progress_bar=show_progress_bar):
-                if preprocess_hook: {preprocess_hook(d) for d in c}
-                result = self._insert_and_encode(
-                    documents=c, collection_name=collection_name, models=models, use_bulk_encode=use_bulk_encode,
-                    overwrite=overwrite, quick=quick, **kwargs
+        if total is None and hasattr(documents, '__len__'):
+            total = len(documents)
+        # Journals and fingerprint stores opened from a path are closed when the insert ends or fails
+        with ExitStack() as opened:
+            if isinstance(journal, str):
+                journal = opened.enter_context(InsertJournal(journal, collection_name))
+            if isinstance(fingerprints, str):
+                fingerprints = opened.enter_context(FingerprintStore(fingerprints))
+            # Number the documents so acknowledged chunks can be journaled and skipped on resume
+            numbered = enumerate(documents)
+            if journal is not None:
+                numbered = ((i, d) for i, d in numbered if not journal.is_done(i))
+                if total is not None:
+                    total -= journal.num_of_documents
+            # Fingerprints of the documents being written, recorded once they are acknowledged
+            pending_fingerprints, chunk_ids = {}, {}
+            num_of_unchanged = 0
+            if fingerprints is not None:
+                def changed_documents(numbered):
+                    nonlocal num_of_unchanged
+                    for block in self._chunks(numbered, FingerprintStore.LOOKUP_CHUNKSIZE):
+                        positions = {id(d): i for i, d in block}
+                        changed = fingerprints.changed(collection_name, [d for _, d in block])
+                        num_of_unchanged += len(block) - len(changed)
+                        for d, fingerprint in changed:
+                            if fingerprint is not None:
+                                pending_fingerprints[str(d['_id'])] = fingerprint
+                            yield positions[id(d)], d
+                numbered = changed_documents(numbered)
+                # The progress bar total cannot account for unchanged documents
+                total = None
+            chunker = AdaptiveChunker.from_chunksize(chunksize)
+            failure_handler = None
+            if retry_failed or dead_letter_path is not None:
+                failure_handler = FailedDocumentHandler(retry_failed, dead_letter_path, self.retry_policy)
+            if chunker is not None:
+                iter_len = None
+                chunks = chunker.chunks(numbered)
+            else:
+                iter_len = None if total is None else int(total / chunksize) + (total % chunksize > 0)
+                chunks = self._chunks(numbered, chunksize)
+            # Each chunk is the span of positions it covers and its documents
+            iter_docs = (((c[0][0], c[-1][0] + 1), [d for _, d in c]) for c in chunks)
+            # Only the first chunk is needed to set up the collection
+            first_chunk = next(iter_docs, None)
+            if first_chunk is None:
+                result = {"inserted_successfully": 0, "failed": 0, "failed_document_ids": []}
+                if fingerprints is not None:
+                    result["unchanged"] = num_of_unchanged
+                return result
+            first_document = first_chunk[1][0]
+            if collection_name not in self.list_collections():
+                if len(models) == 0:
+                    self._check_schema(first_document)
+                self.create_collection_from_document(
+                    collection_name,
+                    self.encode_documents_with_models([first_document], models)[0],
                 )
+            self._raise_warning_if_no_id(first_chunk[1])
+            failed = []
+            num_of_documents = 0
+
+            def count_documents(chunks):
+                nonlocal num_of_documents
+                for span, c in chunks:
+                    num_of_documents += len(c)
+                    if fingerprints is not None:
+                        chunk_ids[span] = [str(d['_id']) for d in c if '_id' in d]
+                    yield span, c
+            iter_docs = count_documents(itertools.chain([first_chunk], iter_docs))
+
+            def handle_result(span, result):
                 self._raise_error(result)
+                self._record_failed_documents('bulk_insert', result['failed_document_ids'])
+                if journal is not None:
+                    journal.record_chunk(span, result['failed_document_ids'])
+                if fingerprints is not None:
+                    failed_ids = {str(i) for i in result['failed_document_ids']}
+                    written = [(i, pending_fingerprints.pop(i)) for i in chunk_ids.pop(span) if i in pending_fingerprints]
+                    fingerprints.record(collection_name, [(i, f) for i, f in written if i not in failed_ids])
                 if verbose and len(result['failed_document_ids']) > 0: print(f"Failed: {result['failed_document_ids']}")
                 failed.append(result["failed_document_ids"])
-        else:
-            if preprocess_hook:
-                raise NotImplementedError("Preprocess hooks are not supported with multi-processing.")
-            pool = Pool(processes=workers)
-            # Using partial insert for compatibility with ViCollectionClient
-            partial_insert = partial(self._insert_and_encode, models=models,collection_name=collection_name,
-            overwrite=overwrite, quick=quick, **kwargs)
-            for result in self.progress_bar(
-                pool.imap_unordered(func=partial_insert, iterable=iter_docs), total=iter_len):
-                self._raise_error(result)
-                if verbose and len(result['failed_document_ids']) > 0:
-                    warnings.warn("""There are failed documents. Try re-inserting these IDs
-                    and test by choosing the most important fields first!""")
-                    print(f"Failed: {result['failed_document_ids']}")
-                failed.append(result["failed_document_ids"])
-            pool.close()
-            pool.join()
+
+            if executor is None:
+                executor = get_option('insert_executor')
+            if executor not in ('thread', 'process'):
+                raise ValueError(f"Unknown executor {executor}. Choose one of thread or process.")
+
+            if pipelined or (workers > 1 and executor == 'thread'):
+                if pipelined:
+                    stages = [
+                        (partial(_call_with_span, partial(self._encode_chunk, models=models,
+                            use_bulk_encode=use_bulk_encode, preprocess_hook=preprocess_hook,
+                            field_workers=field_workers)), encode_workers),
+                        (partial(_call_with_span, partial(self._insert_chunk, collection_name=collection_name,
+                            overwrite=overwrite, quick=quick, chunker=chunker, failure_handler=failure_handler,
+                            **kwargs)), upload_workers),
+                    ]
+                else:
+                    stages = [
+                        (partial(_call_with_span, partial(self._insert_and_encode, collection_name=collection_name,
+                            models=models, use_bulk_encode=use_bulk_encode, overwrite=overwrite, quick=quick,
+                            preprocess_hook=preprocess_hook, chunker=chunker, failure_handler=failure_handler,
+                            field_workers=field_workers, **kwargs)), workers),
+                    ]
+                    max_queued_chunks = workers
+                with closing(run_pipeline(iter_docs, stages, max_queued=max_queued_chunks)) as results:
+                    for span, result in self.progress_bar(results, total=iter_len, show_progress_bar=show_progress_bar):
+                        handle_result(span, result)
+            elif workers == 1:
+                for span, c in self.progress_bar(iter_docs, total=iter_len, show_progress_bar=show_progress_bar):
+                    if preprocess_hook: {preprocess_hook(d) for d in c}
+                    result = self._insert_and_encode(
+                        documents=c, collection_name=collection_name, models=models, use_bulk_encode=use_bulk_encode,
+                        overwrite=overwrite, quick=quick, chunker=chunker, failure_handler=failure_handler,
+                        field_workers=field_workers, **kwargs
+                    )
+                    handle_result(span, result)
+            else:
+                if preprocess_hook:
+                    raise NotImplementedError("Preprocess hooks are not supported with multi-processing.")
+                if chunker is not None:
+                    raise NotImplementedError("Adaptive chunk sizes are not supported with multi-processing.")
+                pool = self._get_process_pool(workers)
+                # Using partial insert for compatibility with ViCollectionClient
+                partial_insert = partial(_call_with_span, partial(self._insert_and_encode, models=models,
+                    collection_name=collection_name, use_bulk_encode=use_bulk_encode, overwrite=overwrite,
+                    quick=quick, failure_handler=failure_handler, field_workers=field_workers, **kwargs))
+                # Pool.imap_unordered reads its whole iterable up front, so chunks are
+                # handed to the pool a few at a time to keep memory bounded.
+                results = (result for window in self._chunks(iter_docs, workers * 2)
+                    for result in pool.imap_unordered(func=partial_insert, iterable=window))
+                for span, result in self.progress_bar(results, total=iter_len, show_progress_bar=show_progress_bar):
+                    if verbose and len(result['failed_document_ids']) > 0:
+                        warnings.warn("""There are failed documents. Try re-inserting these IDs
+                        and test by choosing the most important fields first!""")
+                    handle_result(span, result)
         failed = self.flatten_list(failed)
-        return {
-            "inserted_successfully": len(documents) - len(failed),
+        result = {
+            "inserted_successfully": num_of_documents - len(failed),
             "failed": len(failed),
             "failed_document_ids": failed,
         }
+        if fingerprints is not None:
+            result["unchanged"] = num_of_unchanged
+        return result
 
     def resume_insert_documents(
         self,
@@ -550,38 +1026,51 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
         chunksize: int = 15,
         workers: int = 1,
         verbose: bool=False,
-        use_bulk_encode: bool=False,
-        show_progress_bar: bool=True
+        use_bulk_encode: bool=None,
+        show_progress_bar: bool=True,
+        missing_id_chunksize: int=1000,
+        **kwargs
     ):
         """
-        Resume inserting documents
+        Resume inserting documents by asking the API which of their ids are missing,
+        missing_id_chunksize ids at a time, and inserting only those documents.
+        Inserts run with a journal can be resumed without querying the API.
         """
-        document_ids = self.get_field_across_documents(documents)
-        missing_ids = set(self.bulk_missing_id(collection_name, document_ids))
-        self.insert_documents(collection_name=collection_name,
-        documents=[doc for doc in documents if doc['_id'] in missing_ids],
+        def missing_documents():
+            for c in self._chunks(documents, missing_id_chunksize):
+                document_ids = [str(i) for i in self.get_field_across_documents('_id', c)]
+                missing_ids = set(self.bulk_missing_id(document_ids=document_ids, collection_name=collection_name))
+                yield from (doc for doc, i in zip(c, document_ids) if i in missing_ids)
+        return self.insert_documents(collection_name=collection_name,
+        documents=missing_documents(),
         models=models,
         chunksize=chunksize,
         workers=workers,
         verbose=verbose,
         use_bulk_encode=use_bulk_encode,
         overwrite=False,
-        show_progress_bar=show_progress_bar)
+        show_progress_bar=show_progress_bar,
+        **kwargs)
 
 
     def insert_df(
         self,
         collection_name: str,
-        df: pd.DataFrame,
+        df: 'pd.DataFrame',
         models: Dict[str, Callable] = {},
         chunksize: int = 15,
         workers: int = 1,
         verbose: bool = True,
-        use_bulk_encode: bool = False,
+        use_bulk_encode: bool = None,
+        vector_fields: List[str] = None,
+        vector_columns: Dict[str, List[str]] = None,
+        read_chunksize: int = 10000,
         **kwargs
     ):
         """
-        Insert dataframe into a collection
+        Insert dataframe into a collection. The dataframe is converted to documents
+        read_chunksize rows at a time as they are inserted, so only those rows are
+        ever held as documents.
 
         Args:
             collection_name:
@@ -592,6 +1081,15 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 Models with an encode method
             verbose:
                 Whether to print document ids that have failed when inserting.
+            vector_fields:
+                Columns holding vectors as arrays, lists or JSON strings. Defaults to
+                the columns ending in _vector_.
+            vector_columns:
+                Vector fields made of several numeric columns, e.g.
+                {'image_vector_': ['x0', 'x1', 'x2']}. Those columns are left out
+                of the documents.
+            read_chunksize:
+                The number of rows converted to documents at a time.
 
         Example:
             >>> from vectorai.models.deployed import ViText2Vec
@@ -599,9 +1097,11 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             >>> documents_df = pd.DataFrame.from_records([{'chicken': 'Big chicken'}, {'chicken': 'small_chicken'}, {'chicken': 'cow'}])
             >>> vi_client.insert_df(documents=documents_df, models={'chicken': text_encoder.encode})
         """
+        dfs = (df.iloc[i : i + read_chunksize] for i in range(0, len(df), read_chunksize))
+        kwargs.setdefault('total', len(df))
         return self.insert_documents(
             collection_name,
-            [ {k:v for k,v in m.items() if not isinstance(v, float) or pd.notnull(v)} for m in df.to_dict(orient='records')],
+            self._iter_df_documents(dfs, vector_fields, vector_columns),
             models=models,
             chunksize=chunksize,
             workers=workers,
@@ -610,6 +1110,194 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             **kwargs
         )
 
+    def _column_to_vectors(self, column: 'pd.Series') -> List:
+        """
+        Convert a column of vectors stored as arrays, lists or JSON strings to lists of floats.
+        Missing vectors are None.
+        """
+        notnull = column.notna().to_numpy()
+        vectors = [None] * len(column)
+        present = column.to_numpy()[notnull]
+        if len(present) == 0:
+            return vectors
+        if isinstance(present[0], (str, bytes)):
+            loads = get_serializer().loads
+            present = [loads(v) for v in present]
+        else:
+            try:
+                present = np.stack(present).tolist()
+            except ValueError:
+                # Vectors of different lengths cannot be stacked
+                present = [np.asarray(v).tolist() for v in present]
+        for i, vector in zip(np.flatnonzero(notnull), present):
+            vectors[i] = vector
+        return vectors
+
+    def _df_to_documents(self, df: 'pd.DataFrame', vector_fields: List[str]=None,
+        vector_columns: Dict[str, List[str]]=None) -> List[Dict]:
+        """
+        Convert the rows of a DataFrame to documents, leaving out missing values.
+        Columns are converted whole instead of cell by cell.
+
+        Args:
+            df:
+                Pandas DataFrame
+            vector_fields:
+                Columns holding vectors as arrays, lists or JSON strings. Defaults to
+                the columns ending in _vector_.
+            vector_columns:
+                Vector fields made of several numeric columns. A row missing any of
+                the columns gets no vector.
+        """
+        vector_columns = vector_columns or {}
+        grouped = {c for cols in vector_columns.values() for c in cols}
+        columns = [c for c in df.columns if c not in grouped]
+        if vector_fields is None:
+            vector_fields = [c for c in columns if str(c).endswith('_vector_')]
+        values = [self._column_to_vectors(df[c]) if c in vector_fields else df[c].tolist() for c in columns]
+        notnull = [df[columns].notna().to_numpy()]
+        for field, cols in vector_columns.items():
+            block = df[list(cols)]
+            columns.append(field)
+            values.append(block.to_numpy(dtype=float).tolist())
+            notnull.append(block.notna().all(axis=1).to_numpy()[:, None])
+        notnull = np.hstack(notnull)
+        return [
+            {c: v for c, v, keep in zip(columns, row, mask) if keep}
+            for row, mask in zip(zip(*values), notnull)
+        ]
+
+    def _iter_df_documents(self, dfs: Iterable['pd.DataFrame'], vector_fields: List[str]=None,
+        vector_columns: Dict[str, List[str]]=None):
+        for df in dfs:
+            yield from self._df_to_documents(df, vector_fields, vector_columns)
+
+    def insert_jsonl(
+        self,
+        collection_name: str,
+        path: str,
+        models: Dict[str, Callable] = {},
+        chunksize: int = 15,
+        **kwargs
+    ):
+        """
+        Insert documents from a JSON lines file, one document per line. The file is
+        read as documents are inserted so it is never loaded into memory at once.
+
+        Args:
+            collection_name:
+                Name of collection
+            path:
+                Path to the JSON lines file
+            models:
+                Models with an encode method
+            chunksize:
+                The number of documents inserted per request.
+            kwargs:
+                Passed to insert_documents.
+
+        Example:
+            >>> vi_client.insert_jsonl(collection_name, 'documents.jsonl', workers=4)
+        """
+        loads = get_serializer().loads
+
+        def read_documents():
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield loads(line)
+        return self.insert_documents(collection_name, read_documents(), models=models,
+            chunksize=chunksize, **kwargs)
+
+    def insert_csv(
+        self,
+        collection_name: str,
+        path: str,
+        models: Dict[str, Callable] = {},
+        chunksize: int = 15,
+        vector_fields: List[str] = None,
+        read_chunksize: int = 10000,
+        read_kwargs: Dict = None,
+        **kwargs
+    ):
+        """
+        Insert documents from a CSV file, one document per row. The file is read
+        read_chunksize rows at a time as documents are inserted.
+
+        Args:
+            collection_name:
+                Name of collection
+            path:
+                Path to the CSV file
+            models:
+                Models with an encode method
+            chunksize:
+                The number of documents inserted per request.
+            vector_fields:
+                Columns holding vectors as JSON lists, e.g. "[0.1, 0.2]". Defaults to
+                the columns ending in _vector_.
+            read_chunksize:
+                The number of rows read from the file at a time.
+            read_kwargs:
+                Passed to pandas.read_csv, e.g. {'sep': '\\t'}.
+            kwargs:
+                Passed to insert_documents.
+
+        Example:
+            >>> vi_client.insert_csv(collection_name, 'documents.csv', models={'name': text_encoder.encode})
+        """
+        import pandas as pd
+        dfs = pd.read_csv(path, chunksize=read_chunksize, **(read_kwargs or {}))
+        with dfs:
+            return self.insert_documents(collection_name, self._iter_df_documents(dfs, vector_fields),
+                models=models, chunksize=chunksize, **kwargs)
+
+    def insert_parquet(
+        self,
+        collection_name: str,
+        path: str,
+        models: Dict[str, Callable] = {},
+        chunksize: int = 15,
+        vector_fields: List[str] = None,
+        read_chunksize: int = 10000,
+        columns: List[str] = None,
+        **kwargs
+    ):
+        """
+        Insert documents from a Parquet file, one document per row. The file is read
+        read_chunksize rows at a time as documents are inserted. Requires pyarrow.
+
+        Args:
+            collection_name:
+                Name of collection
+            path:
+                Path to the Parquet file
+            models:
+                Models with an encode method
+            chunksize:
+                The number of documents inserted per request.
+            vector_fields:
+                List columns holding vectors. Defaults to the columns ending in _vector_.
+            read_chunksize:
+                The number of rows read from the file at a time.
+            columns:
+                The columns to read. Defaults to every column.
+            kwargs:
+                Passed to insert_documents.
+
+        Example:
+            >>> vi_client.insert_parquet(collection_name, 'documents.parquet', workers=4)
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("insert_parquet requires pyarrow. Install it with pip install vectorai[parquet].")
+        parquet_file = pq.ParquetFile(path)
+        kwargs.setdefault('total', parquet_file.metadata.num_rows)
+        dfs = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=read_chunksize, columns=columns))
+        return self.insert_documents(collection_name, self._iter_df_documents(dfs, vector_fields),
+            models=models, chunksize=chunksize, **kwargs)
+
     def _edit_document_return_id(
         self, edits: Dict[str, str], collection_name: str
     ):
@@ -636,7 +1324,8 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             return edits["_id"]
         return
 
-    def edit_documents(self, collection_name: str, edits: Dict, chunk_size: int=15, verbose: bool=False, **kwargs):
+    def edit_documents(self, collection_name: str, edits: Dict, chunk_size: Union[int, str, AdaptiveChunker]=15,
+        verbose: bool=False, fingerprints: Union[str, FingerprintStore]=None, **kwargs):
         """
             Edit documents in a collection
 
@@ -648,6 +1337,15 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 edits:
                     What edits to make in a collection. Ensure that _id is stored in the document.
 
+                chunk_size:
+                    The number of edits per request, or 'auto' or an AdaptiveChunker
+                    to size requests by payload bytes and response times.
+
+                fingerprints:
+                    A fingerprint file path or FingerprintStore. Edits identical to the
+                    last ones written for a document with the same store, vectors
+                    included, are skipped.
+
                 workers:
                     Number of parallel processes to run.
 
@@ -657,23 +1355,49 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 >>> vi_client.edit_documents(collection_name, edits=documents, workers=10)
         """
         failed = []
-        for c in self.progress_bar(self.chunk(edits, chunk_size=chunk_size),
-        total=int(len(edits)/chunk_size)):
-            response = self.bulk_edit_document(collection_name, c, **kwargs)
-            if verbose: print(response)
-            failed += response['failed_document_ids']
-        return {
+        # A fingerprint store opened from a path is closed when the edit ends or fails
+        with ExitStack() as opened:
+            if isinstance(fingerprints, str):
+                fingerprints = opened.enter_context(FingerprintStore(fingerprints))
+            num_of_unchanged = 0
+            if fingerprints is not None:
+                changed = fingerprints.changed(collection_name, edits, edits=True)
+                num_of_unchanged = len(edits) - len(changed)
+                pending_fingerprints = {str(d['_id']): f for d, f in changed if f is not None}
+                edits = [d for d, _ in changed]
+            chunker = AdaptiveChunker.from_chunksize(chunk_size)
+            if chunker is not None:
+                chunks, total = chunker.chunks(edits), None
+            else:
+                chunks, total = self.chunk(edits, chunk_size=chunk_size), int(len(edits)/chunk_size)
+            for c in self.progress_bar(chunks, total=total):
+                if chunker is not None:
+                    response = chunker.send(lambda c: self.bulk_edit_document(collection_name, c, **kwargs), c,
+                        retryable='bulk_edit_document' in self.retry_policy.retry_endpoints)
+                else:
+                    response = self.bulk_edit_document(collection_name, c, **kwargs)
+                if verbose: print(response)
+                self._record_failed_documents('bulk_edit_document', response['failed_document_ids'])
+                failed += response['failed_document_ids']
+                if fingerprints is not None:
+                    failed_ids = {str(i) for i in response['failed_document_ids']}
+                    fingerprints.record(collection_name, [(str(d['_id']), pending_fingerprints[str(d['_id'])])
+                        for d in c if '_id' in d and str(d['_id']) not in failed_ids], edits=True)
+        result = {
             "edited_successfully": len(edits) - len(failed),
             "failed": len(failed),
             "failed_document_ids": failed,
         }
+        if fingerprints is not None:
+            result["unchanged"] = num_of_unchanged
+        return result
 
     def retrieve_and_encode(
         self,
         collection_name: str,
         models: Dict[str, Callable] = {},
-        chunksize: int = 15,
-        use_bulk_encode: bool=False,
+        chunksize: Union[int, str, AdaptiveChunker] = 15,
+        use_bulk_encode: bool=None,
         filters: list = [],
         refresh: bool=False):
         """
@@ -682,14 +1406,16 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
             collection_name: Name of collection
             models: Models as a dictionary
             chunksize: the number of results to
-            retrieve and then encode and then edit in one go
+            retrieve and then encode and then edit in one go, or 'auto' or an
+            AdaptiveChunker to size them by payload bytes and response times
             use_bulk_encode: Whether to use bulk_encode on the models.
             filter_query: Filtering
             refresh: If True, retrieves and encodes from scratch, otherwise, only
                 encodes for fields that are not there. Only the filter for the first
                 model is applied
         """
-        docs = self.retrieve_documents(collection_name, page_size=chunksize)
+        chunker = AdaptiveChunker.from_chunksize(chunksize)
+        docs = self.retrieve_documents(collection_name, page_size=chunker.size if chunker else chunksize)
         docs['cursor'] = None
         failed_all = {
             "failed_document_ids": []
@@ -707,21 +1433,24 @@ class ViWriteClient(ViAPIClient, UtilsMixin):
                 )
                 break
 
-        with self.progress_bar(list(range(int(num_of_docs/ chunksize)))) as pbar:
+        with self.progress_bar(list(range(num_of_docs))) as pbar:
             while len(docs['documents']) > 0:
                 docs = self.retrieve_documents_with_filters(
                     collection_name, cursor=docs['cursor'],
                     include_fields=list(models.keys()),
                     filters=filter_query,
-                    page_size=chunksize)
-                failed = self.bulk_edit_document(
-                    collection_name=collection_name,
-                    documents=self.encode_documents_with_models(docs['documents'],
+                    page_size=chunker.size if chunker else chunksize)
+                if len(docs['documents']) == 0:
+                    break
+                documents = self.encode_documents_with_models(docs['documents'],
                     models=models,
-                    use_bulk_encode=use_bulk_encode))
+                    use_bulk_encode=use_bulk_encode)
+                edit = lambda c: self.bulk_edit_document(collection_name=collection_name, documents=c)
+                failed = chunker.send(edit, documents,
+                    retryable='bulk_edit_document' in self.retry_policy.retry_endpoints) if chunker else edit(documents)
                 for k in failed_all.keys():
                     failed_all[k] += failed[k]
-                pbar.update(1)
+                pbar.update(len(documents))
         return failed_all
 
     def retrieve_and_edit(